@@ -158,6 +158,42 @@ class IndexRegistry:
                 logger.warning(f"Failed to index item {i} in '{spec.name}': {e}")
                 # Continue indexing other items
 
+    def add_item(self, item: Any, position: int) -> None:
+        """
+        Index a single appended item without a full rebuild.
+
+        Only valid when the indexes were current before the item was appended;
+        the registry is left clean afterwards. Unique keys are all checked
+        before any index changes, so a duplicate leaves the indexes untouched.
+
+        Args:
+            item: Item that was appended to the collection
+            position: Position of the item in the collection list
+
+        Raises:
+            ValueError: If unique index already contains the item's key
+        """
+        keys = []
+        for spec in self.specs.values():
+            try:
+                key = spec.key_func(item)
+            except Exception as e:
+                logger.warning(f"Failed to index item {position} in '{spec.name}': {e}")
+                continue
+
+            if spec.unique and key in self.indexes[spec.name]:
+                raise ValueError(f"Duplicate key '{key}' in unique index '{spec.name}'")
+            keys.append((spec, key))
+
+        for spec, key in keys:
+            index = self.indexes[spec.name]
+            if spec.unique:
+                index[key] = position
+            else:
+                index.setdefault(key, []).append(position)
+
+        self._dirty = False
+
     def get(self, index_name: str, key: Any) -> Optional[Any]:
         """
         Get value from an index.
@@ -369,7 +405,23 @@ class BaseCollection(Generic[T], ABC):
             if self._index_registry.has_key("uuid", uuid_str):
                 raise ValueError(f"Item with UUID {uuid_str} already exists")
 
-        return self._add_item_to_collection(item)
+        # Appending never moves existing items, so current indexes can be
+        # extended in place instead of being rebuilt on the next lookup
+        indexes_current = not self._batch_mode and not self._index_registry.is_dirty()
+
+        was_modified = self._modified
+        self._add_item_to_collection(item)
+
+        if indexes_current:
+            try:
+                self._index_registry.add_item(item, len(self._items) - 1)
+            except ValueError:
+                # Keep the list in step with the (untouched) indexes
+                self._items.pop()
+                self._modified = was_modified
+                raise
+
+        return item
 
     def remove(self, identifier: Union[str, T]) -> bool:
         """
@@ -6,9 +6,10 @@ BaseCollection infrastructure with centralized index management, lazy rebuilding
 and batch mode support.
 """
 
+import copy
 import logging
 import uuid
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from ..core.ic_manager import ICManager
 from ..core.types import PinInfo, Point, SchematicPin, SchematicSymbol
@@ -28,6 +29,10 @@ class Component:
     automatically notify the parent collection for tracking.
     """
 
+    # Wrappers are created per component, so keep them to two slots and use the
+    # parent collection's validator instead of building one each
+    __slots__ = ("_data", "_collection")
+
     def __init__(self, symbol_data: SchematicSymbol, parent_collection: "ComponentCollection"):
         """
         Initialize component wrapper.
@@ -38,7 +43,6 @@ class Component:
         """
         self._data = symbol_data
         self._collection = parent_collection
-        self._validator = SchematicValidator()
 
     # Core properties with validation
     @property
@@ -62,7 +66,7 @@ class Component:
         Raises:
             ValidationError: If reference format is invalid or already exists
         """
-        if not self._validator.validate_reference(value):
+        if not self._collection._validator.validate_reference(value):
             raise ValidationError(f"Invalid reference format: {value}")
 
         # Check for duplicates in parent collection
@@ -207,6 +211,31 @@ class Component:
         self._collection._mark_modified()
         logger.debug(f"Set property {self.reference}.{name} = {value}")
 
+    def update_properties(self, props: Dict[str, str], validate: bool = True) -> None:
+        """
+        Set several property values at once.
+
+        Like set_property() for each pair, but the component is marked modified
+        once and, with validate, every pair is checked before any is applied.
+        Property visibility is left unchanged (see add_properties()).
+
+        Args:
+            props: Dictionary of property name/value pairs
+            validate: Check that names and values are strings. Disable only for
+                values that come from another component.
+
+        Raises:
+            ValidationError: If validate and any name or value is not a string
+        """
+        if validate and not all(
+            isinstance(name, str) and isinstance(value, str) for name, value in props.items()
+        ):
+            raise ValidationError("Property name and value must be strings")
+
+        self._data.properties.update(props)
+        self._collection._mark_modified()
+        logger.debug(f"Set {len(props)} properties on {self.reference}")
+
     def remove_property(self, name: str) -> bool:
         """
         Remove property by name.
@@ -571,8 +600,7 @@ class Component:
         Args:
             other: Component to copy properties from
         """
-        for name, value in other.properties.items():
-            self.set_property(name, value)
+        self.update_properties(other.properties)
 
     def get_symbol_definition(self) -> Optional[SymbolDefinition]:
         """
@@ -614,7 +642,7 @@ class Component:
         Returns:
             List of validation issues (empty if valid)
         """
-        return self._validator.validate_component(self._data.__dict__)
+        return self._collection._validator.validate_component(self._data.field_values())
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -682,6 +710,12 @@ class ComponentCollection(BaseCollection[Component]):
         self._lib_id_index: Dict[str, List[Component]] = {}
         self._value_index: Dict[str, List[Component]] = {}
 
+        # Shared by this collection's component wrappers
+        self._validator = SchematicValidator()
+
+        # Symbol definitions resolved up front by add_many(), keyed by lib_id
+        self._resolved_symbols: Optional[Dict[str, Optional[SymbolDefinition]]] = None
+
         # Add initial components
         if components:
             with self.batch_mode():
@@ -784,8 +818,7 @@ class ComponentCollection(BaseCollection[Component]):
                               position=(150, 100), unit=2)
         """
         # Validate lib_id
-        validator = SchematicValidator()
-        if not validator.validate_lib_id(lib_id):
+        if not self._validator.validate_lib_id(lib_id):
             raise ValidationError(f"Invalid lib_id format: {lib_id}")
 
         # Generate reference if not provided
@@ -793,7 +826,7 @@ class ComponentCollection(BaseCollection[Component]):
             reference = self._generate_reference(lib_id)
 
         # Validate reference
-        if not validator.validate_reference(reference):
+        if not self._validator.validate_reference(reference):
             raise ValidationError(f"Invalid reference format: {reference}")
 
         # Validate multi-unit add (allows duplicate reference with different units)
@@ -883,8 +916,7 @@ class ComponentCollection(BaseCollection[Component]):
         # Get symbol definition and update pins
         from ..core.exceptions import LibraryError
 
-        symbol_cache = get_symbol_cache()
-        symbol_def = symbol_cache.get_symbol(lib_id)
+        symbol_def = self._get_symbol_definition(lib_id)
         if not symbol_def:
             library_name = lib_id.split(":")[0] if ":" in lib_id else "unknown"
             raise LibraryError(
@@ -908,6 +940,132 @@ class ComponentCollection(BaseCollection[Component]):
         logger.info(f"Added component: {reference} ({lib_id})")
         return component
 
+    def add_many(self, specs: List[Dict[str, Any]]) -> List[Component]:
+        """
+        Add several components in one call.
+
+        Each spec holds the keyword arguments for add(). A nested "properties"
+        dict is expanded into extra component properties. Symbol definitions
+        are resolved once per distinct lib_id for the whole batch.
+
+        Args:
+            specs: List of add() keyword-argument dictionaries
+
+        Returns:
+            List of added components, in spec order
+
+        Raises:
+            ValidationError: If any component data is invalid
+            LibraryError: If a symbol library is not found
+
+        Example:
+            sch.components.add_many([
+                {"lib_id": "Device:R", "reference": "R1", "value": "10k", "position": (100, 100)},
+                {"lib_id": "Device:C", "reference": "C1", "value": "100nF",
+                 "position": (120, 100), "properties": {"MPN": "GRM155R71C104KA88D"}},
+            ])
+        """
+        # Resolve each distinct symbol once instead of several times per add()
+        symbol_cache = get_symbol_cache()
+        self._resolved_symbols = {
+            lib_id: symbol_cache.get_symbol(lib_id)
+            for lib_id in dict.fromkeys(spec.get("lib_id") for spec in specs)
+            if lib_id
+        }
+
+        components = []
+        try:
+            for spec in specs:
+                kwargs = dict(spec)
+                extra_properties = kwargs.pop("properties", None) or {}
+                components.append(self.add(**kwargs, **extra_properties))
+        finally:
+            self._resolved_symbols = None
+
+        logger.info(f"Added {len(components)} components")
+        return components
+
+    def add_from(
+        self,
+        component: Component,
+        *,
+        reference: Optional[str] = None,
+        position: Optional[Union[Point, Tuple[float, float]]] = None,
+        component_uuid: Optional[str] = None,
+        copy_lib_symbol: bool = True,
+    ) -> Component:
+        """
+        Add a copy of a component from another collection or schematic.
+
+        The copy keeps the source's lib_id, value, footprint, unit, rotation,
+        properties and pins, so the library symbol is not resolved again and
+        the source does not need its library installed.
+
+        Args:
+            component: Component to copy
+            reference: Reference for the copy (source reference if None)
+            position: Position in mm for the copy (source position if None)
+            component_uuid: Specific UUID for the copy (auto-generated if None)
+            copy_lib_symbol: Copy the source schematic's lib_symbols entry for this
+                lib_id into this schematic if it has none yet
+
+        Returns:
+            The added component
+
+        Raises:
+            ValidationError: If the reference is invalid or already used by that unit
+
+        Example:
+            for comp in ref_sch.components:
+                sch.components.add_from(comp)
+        """
+        source = component._data
+        reference = reference or source.reference
+        if not self._validator.validate_reference(reference):
+            raise ValidationError(f"Invalid reference format: {reference}")
+        self._validate_multi_unit_add(source.lib_id, reference, source.unit)
+
+        if position is None:
+            position = source.position
+        elif isinstance(position, tuple):
+            position = Point(position[0], position[1])
+
+        component_data = SchematicSymbol(
+            uuid=component_uuid if component_uuid else str(uuid.uuid4()),
+            lib_id=source.lib_id,
+            position=position,
+            reference=reference,
+            value=source.value,
+            footprint=source.footprint,
+            properties=copy.deepcopy(source.properties),
+            pins=copy.deepcopy(source.pins),
+            hidden_properties=set(source.hidden_properties),
+            rotation=source.rotation,
+            in_bom=source.in_bom,
+            on_board=source.on_board,
+            unit=source.unit,
+        )
+
+        if copy_lib_symbol:
+            self._copy_lib_symbol(component._collection, source.lib_id)
+
+        new_component = Component(component_data, self)
+        super().add(new_component)
+        self._add_to_manual_indexes(new_component)
+
+        logger.info(f"Added component: {reference} ({source.lib_id}) from {source.reference}")
+        return new_component
+
+    def _copy_lib_symbol(self, source_collection: "ComponentCollection", lib_id: str) -> None:
+        """Copy the source schematic's lib_symbols entry for lib_id unless this one has it."""
+        source_schematic = source_collection._parent_schematic
+        if self._parent_schematic is None or source_schematic is None:
+            return
+        lib_symbols = self._parent_schematic._data.setdefault("lib_symbols", {})
+        definition = source_schematic._data.get("lib_symbols", {}).get(lib_id)
+        if definition is not None and lib_id not in lib_symbols:
+            lib_symbols[lib_id] = copy.deepcopy(definition)
+
     def add_with_pin_at(
         self,
         lib_id: str,
@@ -970,8 +1128,7 @@ class ComponentCollection(BaseCollection[Component]):
         from ..core.geometry import calculate_position_for_pin
 
         # Get symbol definition to find the pin's local position
-        symbol_cache = get_symbol_cache()
-        symbol_def = symbol_cache.get_symbol(lib_id)
+        symbol_def = self._get_symbol_definition(lib_id)
         if not symbol_def:
             library_name = lib_id.split(":")[0] if ":" in lib_id else "unknown"
             raise LibraryError(
@@ -1215,6 +1372,16 @@ class ComponentCollection(BaseCollection[Component]):
                 return self._items[ref_idx]
         return None
 
+    def _get_all_by_reference(self, reference: str) -> List[Component]:
+        """Get every component (unit) with a reference, in collection order."""
+        self._ensure_indexes_current()
+        ref_idx = self._index_registry.get("reference", reference)
+        if ref_idx is None:
+            return []
+        if isinstance(ref_idx, list):
+            return [self._items[i] for i in ref_idx]
+        return [self._items[ref_idx]]
+
     def get_by_uuid(self, component_uuid: str) -> Optional[Component]:
         """
         Get component by UUID.
@@ -1247,12 +1414,14 @@ class ComponentCollection(BaseCollection[Component]):
         Returns:
             List of matching components
         """
-        results = list(self._items)
+        # Start from the lib_id index, so the remaining criteria only see that
+        # part's components (its lists follow collection order, see _sort_items)
+        if "lib_id" in criteria:
+            results = list(self._lib_id_index.get(criteria["lib_id"], []))
+        else:
+            results = list(self._items)
 
         # Apply filters
-        if "lib_id" in criteria:
-            lib_id = criteria["lib_id"]
-            results = [c for c in results if c.lib_id == lib_id]
 
         if "value" in criteria:
             value = criteria["value"]
@@ -1622,8 +1791,7 @@ class ComponentCollection(BaseCollection[Component]):
     # Sorting
     def sort_by_reference(self):
         """Sort components by reference designator (in-place)."""
-        self._items.sort(key=lambda c: c.reference)
-        self._index_registry.mark_dirty()
+        self._sort_items(key=lambda c: c.reference)
 
     def sort_by_position(self, by_x: bool = True):
         """
@@ -1633,9 +1801,17 @@ class ComponentCollection(BaseCollection[Component]):
             by_x: If True, sort by X then Y; if False, sort by Y then X
         """
         if by_x:
-            self._items.sort(key=lambda c: (c.position.x, c.position.y))
+            self._sort_items(key=lambda c: (c.position.x, c.position.y))
         else:
-            self._items.sort(key=lambda c: (c.position.y, c.position.x))
+            self._sort_items(key=lambda c: (c.position.y, c.position.x))
+
+    def _sort_items(self, key: Callable[[Component], Any]):
+        """Sort components in place, keeping the manual index lists in collection order."""
+        self._items.sort(key=key)
+        # Stable sorts by the same key keep each list's order matching the collection's
+        for index in (self._lib_id_index, self._value_index):
+            for components in index.values():
+                components.sort(key=key)
         self._index_registry.mark_dirty()
 
     # Validation
@@ -1843,8 +2019,7 @@ class ComponentCollection(BaseCollection[Component]):
         # Get symbol definition to check valid unit range
         # NOTE: Only enforce if symbol library reports multi-unit (units > 1)
         # If library reports units=1, it may be a parsing limitation, so allow manual addition
-        symbol_cache = get_symbol_cache()
-        symbol_def = symbol_cache.get_symbol(lib_id)
+        symbol_def = self._get_symbol_definition(lib_id)
         if symbol_def and symbol_def.units > 1:
             # Symbol library detected multi-unit - enforce range
             if unit > symbol_def.units:
@@ -1855,7 +2030,7 @@ class ComponentCollection(BaseCollection[Component]):
         # If symbol_def.units == 1 or 0, allow any unit number (manual override)
 
         # Check for existing components with same reference
-        existing_components = self.filter(reference_pattern=f"^{reference}$")
+        existing_components = self._get_all_by_reference(reference)
 
         if existing_components:
             # Verify lib_id matches
@@ -1909,8 +2084,7 @@ class ComponentCollection(BaseCollection[Component]):
         from ..core.multi_unit import MultiUnitComponentGroup
 
         # Get symbol definition to determine unit count
-        symbol_cache = get_symbol_cache()
-        symbol_def = symbol_cache.get_symbol(lib_id)
+        symbol_def = self._get_symbol_definition(lib_id)
         if not symbol_def:
             library_name = lib_id.split(":")[0] if ":" in lib_id else "unknown"
             raise LibraryError(
@@ -1954,6 +2128,12 @@ class ComponentCollection(BaseCollection[Component]):
         logger.info(f"Created MultiUnitComponentGroup for {reference} with {len(group)} units")
         return group
 
+    def _get_symbol_definition(self, lib_id: str) -> Optional[SymbolDefinition]:
+        """Look up a symbol definition, using add_many()'s pre-resolved symbols if present."""
+        if self._resolved_symbols is not None and lib_id in self._resolved_symbols:
+            return self._resolved_symbols[lib_id]
+        return get_symbol_cache().get_symbol(lib_id)
+
     def _generate_reference(self, lib_id: str) -> str:
         """
         Generate unique reference for component.
@@ -1965,8 +2145,7 @@ class ComponentCollection(BaseCollection[Component]):
             Generated reference (e.g., "R1", "U2")
         """
         # Get reference prefix from symbol definition
-        symbol_cache = get_symbol_cache()
-        symbol_def = symbol_cache.get_symbol(lib_id)
+        symbol_def = self._get_symbol_definition(lib_id)
         prefix = symbol_def.reference_prefix if symbol_def else "U"
 
         # Ensure indexes are current
@@ -0,0 +1,183 @@
+"""
+Shared sexpdata.Symbol instances for KiCAD's fixed S-expression vocabulary.
+
+KiCAD schematics repeat a small set of bare atoms (tag names such as ``at`` or
+``effects`` and keyword values such as ``yes`` or ``passive``) thousands of times.
+The parser returns the singletons defined here instead of allocating a new Symbol
+per occurrence, which keeps parse trees smaller and lets hot paths test tags with
+``is``. Trees built by hand still hold ordinary Symbols, so identity checks must
+only be used as a fast path in front of a normal comparison.
+"""
+
+import copyreg
+from typing import Dict
+
+import sexpdata
+
+# Tag names and keyword atoms found in KiCAD 7-9 schematics and symbol libraries
+KICAD_SYMBOL_NAMES = (
+    # Document structure
+    "kicad_sch",
+    "version",
+    "generator",
+    "generator_version",
+    "uuid",
+    "paper",
+    "title_block",
+    "title",
+    "company",
+    "rev",
+    "date",
+    "comment",
+    "lib_symbols",
+    "sheet_instances",
+    "symbol_instances",
+    "embedded_fonts",
+    "instances",
+    "project",
+    "path",
+    "page",
+    "reference",
+    # Symbols and properties
+    "symbol",
+    "lib_id",
+    "at",
+    "mirror",
+    "unit",
+    "body_style",
+    "convert",
+    "exclude_from_sim",
+    "in_bom",
+    "on_board",
+    "dnp",
+    "fields_autoplaced",
+    "property",
+    "pin",
+    "pin_names",
+    "pin_numbers",
+    "offset",
+    "power",
+    "extends",
+    "length",
+    "name",
+    "number",
+    "alternate",
+    # Text effects
+    "effects",
+    "font",
+    "size",
+    "thickness",
+    "bold",
+    "italic",
+    "justify",
+    "left",
+    "right",
+    "top",
+    "bottom",
+    "hide",
+    "href",
+    # Connectivity
+    "wire",
+    "bus",
+    "bus_entry",
+    "junction",
+    "no_connect",
+    "diameter",
+    "label",
+    "global_label",
+    "hierarchical_label",
+    "netclass_flag",
+    "shape",
+    "sheet",
+    "sheet_pin",
+    # Graphics
+    "text",
+    "text_box",
+    "margins",
+    "polyline",
+    "rectangle",
+    "circle",
+    "arc",
+    "bezier",
+    "image",
+    "data",
+    "scale",
+    "pts",
+    "xy",
+    "start",
+    "mid",
+    "end",
+    "center",
+    "radius",
+    "stroke",
+    "width",
+    "type",
+    "fill",
+    "color",
+    "default",
+    "solid",
+    "dash",
+    "dot",
+    "dash_dot",
+    "dash_dot_dot",
+    "none",
+    "outline",
+    "background",
+    # Keyword values
+    "yes",
+    "no",
+    "line",
+    "inverted",
+    "clock",
+    "inverted_clock",
+    "input_low",
+    "clock_low",
+    "output_low",
+    "edge_clock_high",
+    "non_logic",
+    "input",
+    "output",
+    "bidirectional",
+    "tri_state",
+    "passive",
+    "free",
+    "unspecified",
+    "power_in",
+    "power_out",
+    "open_collector",
+    "open_emitter",
+)
+
+KICAD_SYMBOLS: Dict[str, sexpdata.Symbol] = {
+    name: sexpdata.Symbol(name) for name in KICAD_SYMBOL_NAMES
+}
+
+# Most frequent tags, for direct use when building or inspecting trees
+AT = KICAD_SYMBOLS["at"]
+EFFECTS = KICAD_SYMBOLS["effects"]
+FONT = KICAD_SYMBOLS["font"]
+SIZE = KICAD_SYMBOLS["size"]
+JUSTIFY = KICAD_SYMBOLS["justify"]
+HIDE = KICAD_SYMBOLS["hide"]
+PROPERTY = KICAD_SYMBOLS["property"]
+SYMBOL = KICAD_SYMBOLS["symbol"]
+LIB_ID = KICAD_SYMBOLS["lib_id"]
+PIN = KICAD_SYMBOLS["pin"]
+UUID = KICAD_SYMBOLS["uuid"]
+YES = KICAD_SYMBOLS["yes"]
+NO = KICAD_SYMBOLS["no"]
+
+
+def intern_symbol(name: str) -> sexpdata.Symbol:
+    """Return the shared Symbol for a KiCAD keyword, or a new Symbol for anything else."""
+    symbol = KICAD_SYMBOLS.get(name)
+    return symbol if symbol is not None else sexpdata.Symbol(name)
+
+
+def _reduce_symbol(symbol: sexpdata.Symbol):
+    return intern_symbol, (str(symbol),)
+
+
+# Pickler dispatch table that restores keyword Symbols as the shared instances on load
+PICKLE_DISPATCH_TABLE = copyreg.dispatch_table.copy()
+PICKLE_DISPATCH_TABLE[sexpdata.Symbol] = _reduce_symbol
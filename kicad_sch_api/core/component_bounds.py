@@ -7,14 +7,25 @@ KiCAD component bounds calculation and collision detection.
 
 import logging
 import math
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..library.cache import get_symbol_cache
 from .types import Point, SchematicSymbol
 
 logger = logging.getLogger(__name__)
 
+# Rotated symbol-local bounds keyed by (lib_id, rotation, include_properties); the
+# SymbolDefinition they were computed from is stored too, so a reloaded symbol misses.
+# Only the most recently used _LOCAL_BBOX_CACHE_SIZE entries are kept.
+_LOCAL_BBOX_CACHE_SIZE = 512
+_LocalBounds = Tuple[float, float, float, float]
+_LOCAL_BBOX_CACHE: "OrderedDict[Tuple[str, float, bool], Tuple[Any, _LocalBounds]]" = OrderedDict()
+
+# KiCAD rotations that only swap and negate bounds, mapped to their quarter turns
+_QUARTER_TURNS: Dict[float, int] = {0: 0, 90: 1, 180: 2, 270: 3}
+
 
 @dataclass
 class BoundingBox:
@@ -365,9 +376,12 @@ def get_component_bounding_box(
         BoundingBox in world coordinates
     """
     # Get symbol definition
-    cache = get_symbol_cache()
-    symbol = cache.get_symbol(component.lib_id)
+    symbol = get_symbol_cache().get_symbol(component.lib_id)
+    return _place_bounding_box(component, symbol, include_properties)
+
 
+def _place_bounding_box(component, symbol, include_properties: bool) -> BoundingBox:
+    """Translate a symbol's local bounds to the component's world position."""
     if not symbol:
         logger.warning(f"Symbol not found for {component.lib_id}")
         # Return default size centered at component position
@@ -379,52 +393,124 @@ def get_component_bounding_box(
             component.position.y + default_size / 2,
         )
 
+    min_x, min_y, max_x, max_y = _get_local_bounds(
+        symbol, component.lib_id, component.rotation, include_properties
+    )
+    world_bbox = BoundingBox(
+        component.position.x + min_x,
+        component.position.y + min_y,
+        component.position.x + max_x,
+        component.position.y + max_y,
+    )
+
+    logger.debug(
+        f"Component {component.reference} at {component.rotation}° world bbox: {world_bbox}"
+    )
+    return world_bbox
+
+
+def _get_local_bounds(
+    symbol, lib_id: str, rotation: float, include_properties: bool
+) -> Tuple[float, float, float, float]:
+    """
+    Get the rotated bounds of a symbol relative to its component position.
+
+    Identical parts share these bounds, so they are computed once per
+    (lib_id, rotation, include_properties) and only translated per component.
+    """
+    key = (lib_id, rotation, include_properties)
+    cached = _LOCAL_BBOX_CACHE.get(key)
+    if cached is not None and cached[0] is symbol:
+        _LOCAL_BBOX_CACHE.move_to_end(key)
+        return cached[1]
+
     # Calculate symbol bounding box
     symbol_bbox = SymbolBoundingBoxCalculator.calculate_bounding_box(symbol, include_properties)
+    min_x, min_y = symbol_bbox.min_x, symbol_bbox.min_y
+    max_x, max_y = symbol_bbox.max_x, symbol_bbox.max_y
+
+    # KiCAD rotations are multiples of 90°, which only swap and negate the bounds
+    quarter_turns = _QUARTER_TURNS.get(rotation % 360)
+    if quarter_turns is not None:
+        bounds = (
+            (min_x, min_y, max_x, max_y),
+            (-max_y, min_x, -min_y, max_x),
+            (-max_x, -max_y, -min_x, -min_y),
+            (min_y, -max_x, max_y, -min_x),
+        )[quarter_turns]
+        _store_local_bounds(key, symbol, bounds)
+        return bounds
 
-    # Transform to world coordinates with rotation
     # Apply rotation matrix to bounding box corners, then find new min/max
-    import math
-
-    angle_rad = math.radians(component.rotation)
+    angle_rad = math.radians(rotation)
     cos_a = math.cos(angle_rad)
     sin_a = math.sin(angle_rad)
 
     # Get all 4 corners of the symbol bounding box
     corners = [
-        (symbol_bbox.min_x, symbol_bbox.min_y),  # Bottom-left
-        (symbol_bbox.max_x, symbol_bbox.min_y),  # Bottom-right
-        (symbol_bbox.max_x, symbol_bbox.max_y),  # Top-right
-        (symbol_bbox.min_x, symbol_bbox.max_y),  # Top-left
+        (min_x, min_y),  # Bottom-left
+        (max_x, min_y),  # Bottom-right
+        (max_x, max_y),  # Top-right
+        (min_x, max_y),  # Top-left
     ]
 
     # Rotate each corner using standard 2D rotation matrix
-    rotated_corners = []
-    for x, y in corners:
-        rotated_x = x * cos_a - y * sin_a
-        rotated_y = x * sin_a + y * cos_a
-        rotated_corners.append((rotated_x, rotated_y))
+    rotated_xs = [x * cos_a - y * sin_a for x, y in corners]
+    rotated_ys = [x * sin_a + y * cos_a for x, y in corners]
 
-    # Find min/max of rotated corners
-    rotated_xs = [x for x, y in rotated_corners]
-    rotated_ys = [y for x, y in rotated_corners]
+    bounds = (min(rotated_xs), min(rotated_ys), max(rotated_xs), max(rotated_ys))
+    _store_local_bounds(key, symbol, bounds)
+    return bounds
 
-    world_bbox = BoundingBox(
-        component.position.x + min(rotated_xs),
-        component.position.y + min(rotated_ys),
-        component.position.x + max(rotated_xs),
-        component.position.y + max(rotated_ys),
-    )
 
-    logger.debug(
-        f"Component {component.reference} at {component.rotation}° world bbox: {world_bbox}"
-    )
-    return world_bbox
+def _store_local_bounds(key, symbol, bounds: Tuple[float, float, float, float]) -> None:
+    """Cache local bounds, evicting the least recently used entry when full."""
+    _LOCAL_BBOX_CACHE[key] = (symbol, bounds)
+    _LOCAL_BBOX_CACHE.move_to_end(key)
+    if len(_LOCAL_BBOX_CACHE) > _LOCAL_BBOX_CACHE_SIZE:
+        _LOCAL_BBOX_CACHE.popitem(last=False)
 
 
-def get_schematic_component_bboxes(components: List[SchematicSymbol]) -> List[BoundingBox]:
-    """Get bounding boxes for all components in a schematic."""
-    return [get_component_bounding_box(comp) for comp in components]
+def get_schematic_component_bboxes(
+    components: List[SchematicSymbol], include_properties: bool = True
+) -> List[BoundingBox]:
+    """
+    Get bounding boxes for all components in a schematic.
+
+    Symbols are looked up once per distinct lib_id and local bounds resolved
+    once per distinct (lib_id, rotation) for the whole batch, so each component
+    only costs a translation.
+
+    Args:
+        components: Schematic components
+        include_properties: Whether to include space for Reference/Value labels
+
+    Returns:
+        BoundingBox in world coordinates for each component, in order
+    """
+    cache = get_symbol_cache()
+    symbols = {lib_id: cache.get_symbol(lib_id) for lib_id in {c.lib_id for c in components}}
+    local_bounds: Dict[Tuple[str, float], Optional[Tuple[float, float, float, float]]] = {}
+
+    bboxes = []
+    for comp in components:
+        key = (comp.lib_id, comp.rotation)
+        if key not in local_bounds:
+            symbol = symbols[comp.lib_id]
+            local_bounds[key] = (
+                _get_local_bounds(symbol, comp.lib_id, comp.rotation, include_properties)
+                if symbol
+                else None
+            )
+        bounds = local_bounds[key]
+        if bounds is None:
+            # Missing symbol: default box, with the warning _place_bounding_box logs
+            bboxes.append(_place_bounding_box(comp, None, include_properties))
+            continue
+
+        x, y = comp.position.x, comp.position.y
+        bboxes.append(BoundingBox(x + bounds[0], y + bounds[1], x + bounds[2], y + bounds[3]))
+    return bboxes
 
 
 def check_path_collision(
@@ -454,6 +540,112 @@ def check_path_collision(
     return False
 
 
+class ObstacleIndex:
+    """
+    Static packed R-tree over obstacle bounding boxes.
+
+    Boxes are expanded by the clearance and packed once (sort-tile-recursive),
+    so each path query only runs the exact segment test on the boxes whose
+    extents overlap the segment's own extents.
+    """
+
+    def __init__(self, obstacles: List[BoundingBox], clearance: float = 1.27, node_size: int = 16):
+        self.node_size = max(2, node_size)
+        self.boxes = [obs.expand(clearance) for obs in obstacles]
+        self._order = self._sort_tile_recursive(self.boxes)
+
+        # levels[0] holds leaf extents in packed order, each level above holds
+        # the union of node_size consecutive entries of the level below
+        level = [
+            (box.min_x, box.min_y, box.max_x, box.max_y)
+            for box in (self.boxes[i] for i in self._order)
+        ]
+        self._levels = [level]
+        while len(level) > 1:
+            level = [
+                (
+                    min(b[0] for b in group),
+                    min(b[1] for b in group),
+                    max(b[2] for b in group),
+                    max(b[3] for b in group),
+                )
+                for group in (
+                    level[i : i + self.node_size] for i in range(0, len(level), self.node_size)
+                )
+            ]
+            self._levels.append(level)
+
+    def _sort_tile_recursive(self, boxes: List[BoundingBox]) -> List[int]:
+        """Order box indices into vertical slices by center x, each sorted by center y."""
+        count = len(boxes)
+        if count <= self.node_size:
+            return list(range(count))
+
+        leaves = math.ceil(count / self.node_size)
+        slice_size = math.ceil(math.sqrt(leaves)) * self.node_size
+        by_x = sorted(range(count), key=lambda i: boxes[i].min_x + boxes[i].max_x)
+        order: List[int] = []
+        for start in range(0, count, slice_size):
+            order.extend(
+                sorted(
+                    by_x[start : start + slice_size],
+                    key=lambda i: boxes[i].min_y + boxes[i].max_y,
+                )
+            )
+        return order
+
+    def intersection(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[int]:
+        """Get indices of the expanded obstacles overlapping the given extents."""
+        if not self.boxes:
+            return []
+
+        found = []
+        top = len(self._levels) - 1
+        stack = [(top, i) for i in range(len(self._levels[top]))]
+        while stack:
+            depth, i = stack.pop()
+            b = self._levels[depth][i]
+            if b[0] > max_x or b[2] < min_x or b[1] > max_y or b[3] < min_y:
+                continue
+            if depth == 0:
+                found.append(self._order[i])
+            else:
+                first = i * self.node_size
+                last = min(first + self.node_size, len(self._levels[depth - 1]))
+                stack.extend((depth - 1, child) for child in range(first, last))
+        return found
+
+    def collides(self, start: Point, end: Point) -> bool:
+        """Check if a straight line path collides with any indexed obstacle."""
+        for i in self.intersection(
+            min(start.x, end.x), min(start.y, end.y), max(start.x, end.x), max(start.y, end.y)
+        ):
+            if _line_intersects_bbox(start, end, self.boxes[i]):
+                logger.debug(f"Path collision detected with obstacle {self.boxes[i]}")
+                return True
+        return False
+
+
+def build_obstacle_index(
+    components: List[SchematicSymbol], clearance: float = 1.27, include_properties: bool = True
+) -> ObstacleIndex:
+    """
+    Build an obstacle index from component bounding boxes.
+
+    Build it once per layout and query it for every routing segment instead
+    of scanning all component boxes per segment.
+
+    Args:
+        components: Components acting as obstacles
+        clearance: Minimum clearance from obstacles (default: 1 grid unit)
+        include_properties: Whether to include space for Reference/Value labels
+
+    Returns:
+        ObstacleIndex over the expanded component bounding boxes
+    """
+    return ObstacleIndex(get_schematic_component_bboxes(components, include_properties), clearance)
+
+
 def _line_intersects_bbox(start: Point, end: Point, bbox: BoundingBox) -> bool:
     """
     Check if line segment intersects bounding box using line-box intersection.
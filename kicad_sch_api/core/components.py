@@ -315,7 +315,7 @@ class Component:
 
     def validate(self) -> List[ValidationIssue]:
         """Validate this component."""
-        return self._validator.validate_component(self._data.__dict__)
+        return self._validator.validate_component(self._data.field_values())
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert component to dictionary representation."""
@@ -6,6 +6,7 @@ hierarchical connections, and power symbols.
 """
 
 import logging
+import math
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Tuple
@@ -24,11 +25,16 @@ class PinConnection:
     pin_number: str  # Pin number (e.g., "2")
     position: Point  # Absolute position of pin
 
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Identity of the pin, (reference, pin_number); the position is not part of it."""
+        return (self.reference, self.pin_number)
+
     def __hash__(self):
-        return hash((self.reference, self.pin_number))
+        return hash(self.key)
 
     def __eq__(self, other):
-        return self.reference == other.reference and self.pin_number == other.pin_number
+        return self.key == other.key
 
     def __repr__(self):
         return f"{self.reference}.{self.pin_number}@({self.position.x:.2f},{self.position.y:.2f})"
@@ -90,7 +96,7 @@ class ConnectivityAnalyzer:
         self.tolerance = tolerance
         self.nets: List[Net] = []
         self._point_to_net: Dict[Tuple[float, float], Net] = {}
-        self._pin_to_net: Dict[PinConnection, Net] = {}
+        self._pin_to_net: Dict[Tuple[str, str], Net] = {}  # Keyed by PinConnection.key
         self._label_name_to_nets: Dict[str, List[Net]] = defaultdict(list)
 
         logger.info(f"Initialized ConnectivityAnalyzer (tolerance={tolerance}mm)")
@@ -124,10 +130,10 @@ class ConnectivityAnalyzer:
 
         # Step 2: Create initial nets from wire-to-pin connections
         for sch in schematics:
+            # One reference set per sheet, not a component scan per pin
+            sch_refs = {c.reference for c in sch.components}
             sch_pins = {
-                pc: pos
-                for pc, pos in all_pin_positions.items()
-                if any(c.reference == pc.reference for c in sch.components)
+                pc: pos for pc, pos in all_pin_positions.items() if pc.reference in sch_refs
             }
             self._trace_wire_connections(sch, sch_pins)
         logger.info(f"Created {len(self.nets)} nets from wire connections")
@@ -199,6 +205,16 @@ class ConnectivityAnalyzer:
             schematic: Schematic to analyze
             pin_positions: Mapping of pins to positions
         """
+        # Bucket pins into cells twice the tolerance wide, so any pin within
+        # tolerance of a wire point is in that point's cell or a neighbouring one
+        cell = 2 * self.tolerance
+        pin_cells: Dict[Tuple[int, int], List[Tuple[PinConnection, Point]]] = defaultdict(list)
+        if cell > 0:
+            for pin_conn, pin_pos in pin_positions.items():
+                pin_cells[(math.floor(pin_pos.x / cell), math.floor(pin_pos.y / cell))].append(
+                    (pin_conn, pin_pos)
+                )
+
         for wire in schematic.wires:
             # Get wire endpoints
             wire_points = wire.points
@@ -209,13 +225,16 @@ class ConnectivityAnalyzer:
             # Find which pins connect to this wire
             connected_pins = set()
 
-            for pin_conn, pin_pos in pin_positions.items():
-                # Check if pin connects to any point on the wire
-                for wire_point in wire_points:
-                    if points_equal(wire_point, pin_pos, self.tolerance):
-                        connected_pins.add(pin_conn)
-                        logger.debug(f"  Wire {wire.uuid} connects to {pin_conn}")
-                        break
+            # No pins are bucketed when tolerance <= 0, and then no point can match
+            for wire_point in wire_points if pin_cells else ():
+                cx = math.floor(wire_point.x / cell)
+                cy = math.floor(wire_point.y / cell)
+                for x in (cx - 1, cx, cx + 1):
+                    for y in (cy - 1, cy, cy + 1):
+                        for pin_conn, pin_pos in pin_cells.get((x, y), ()):
+                            if points_equal(wire_point, pin_pos, self.tolerance):
+                                connected_pins.add(pin_conn)
+                                logger.debug(f"  Wire {wire.uuid} connects to {pin_conn}")
 
             # Create or update net for this wire
             # Always create a net for the wire, even if no pins connect yet
@@ -242,22 +261,31 @@ class ConnectivityAnalyzer:
             wire_points: Points along the wire
         """
         # Check if any of these pins are already in a net
-        existing_nets = set()
+        # Net is an unhashable dataclass, so collect distinct nets by identity
+        existing_nets: List[Net] = []
         for pin in pins:
-            if pin in self._pin_to_net:
-                existing_nets.add(self._pin_to_net[pin])
+            net = self._pin_to_net.get(pin.key)
+            if net is not None and not any(net is seen for seen in existing_nets):
+                existing_nets.append(net)
 
         if existing_nets:
             # Merge all existing nets into the first one
-            primary_net = existing_nets.pop()
-            for other_net in existing_nets:
+            primary_net = existing_nets[0]
+            for other_net in existing_nets[1:]:
                 primary_net.merge(other_net)
+
+                # Update mappings, so pins of the merged net resolve to the primary net
+                for pin in other_net.pins:
+                    self._pin_to_net[pin.key] = primary_net
+                for net_point in other_net.points:
+                    self._point_to_net[net_point] = primary_net
+
                 self.nets.remove(other_net)
 
             # Add new pins and wire to primary net
             for pin in pins:
                 primary_net.add_pin(pin)
-                self._pin_to_net[pin] = primary_net
+                self._pin_to_net[pin.key] = primary_net
 
             primary_net.wires.add(wire.uuid)
             for point in wire_points:
@@ -268,7 +296,7 @@ class ConnectivityAnalyzer:
             net = Net()
             for pin in pins:
                 net.add_pin(pin)
-                self._pin_to_net[pin] = net
+                self._pin_to_net[pin.key] = net
 
             net.wires.add(wire.uuid)
             for point in wire_points:
@@ -333,7 +361,7 @@ class ConnectivityAnalyzer:
 
                     # Update all pin mappings
                     for pin in other_net.pins:
-                        self._pin_to_net[pin] = primary_net
+                        self._pin_to_net[pin.key] = primary_net
 
                     # Update all point mappings
                     for point in other_net.points:
@@ -365,18 +393,34 @@ class ConnectivityAnalyzer:
             if hasattr(label, "_data") and label._data.label_type == LabelType.LOCAL
         ]
 
+        # Bucket net points into cells twice the tolerance wide, as for wire-to-pin
+        # matching, so each label only checks points in its own and neighbouring cells
+        cell = 2 * self.tolerance
+        point_cells: Dict[Tuple[int, int], List[Tuple[int, Point]]] = defaultdict(list)
+        if cell > 0 and local_labels:
+            for index, net in enumerate(self.nets):
+                for x, y in net.points:
+                    point_cells[(math.floor(x / cell), math.floor(y / cell))].append(
+                        (index, Point(x, y))
+                    )
+
         for label in local_labels:
             label_pos = label.position
 
-            # Find which net this label is on
-            net_for_label = None
-            for net in self.nets:
-                for point in net.points:
-                    if points_equal(Point(point[0], point[1]), label_pos, self.tolerance):
-                        net_for_label = net
-                        break
-                if net_for_label:
-                    break
+            # Find which net this label is on; the first net in order wins, as
+            # with a scan of all nets. No points are bucketed when tolerance <= 0.
+            net_index = None
+            if point_cells:
+                cx = math.floor(label_pos.x / cell)
+                cy = math.floor(label_pos.y / cell)
+                for x in (cx - 1, cx, cx + 1):
+                    for y in (cy - 1, cy, cy + 1):
+                        for index, net_point in point_cells.get((x, y), ()):
+                            if (net_index is None or index < net_index) and points_equal(
+                                net_point, label_pos, self.tolerance
+                            ):
+                                net_index = index
+            net_for_label = self.nets[net_index] if net_index is not None else None
 
             if net_for_label:
                 # Set or merge net name
@@ -399,7 +443,7 @@ class ConnectivityAnalyzer:
 
                         # Update mappings
                         for pin in other_net.pins:
-                            self._pin_to_net[pin] = primary_net
+                            self._pin_to_net[pin.key] = primary_net
                         for point in other_net.points:
                             self._point_to_net[point] = primary_net
 
@@ -428,14 +472,14 @@ class ConnectivityAnalyzer:
 
                 # Find the net this power symbol is connected to
                 # Power symbols have a single pin (usually pin "1")
-                power_pin_conn = None
-                for pin_conn in self._pin_to_net.keys():
-                    if pin_conn.reference == component.reference:
-                        power_pin_conn = pin_conn
+                power_pin_key = None
+                for pin_key in self._pin_to_net.keys():
+                    if pin_key[0] == component.reference:
+                        power_pin_key = pin_key
                         break
 
-                if power_pin_conn:
-                    net = self._pin_to_net[power_pin_conn]
+                if power_pin_key:
+                    net = self._pin_to_net[power_pin_key]
                     power_symbol_nets_by_value[power_value].append(net)
                     logger.debug(f"  Power symbol {component.reference} on net '{net.name}'")
 
@@ -456,7 +500,7 @@ class ConnectivityAnalyzer:
 
                         # Update mappings
                         for pin in other_net.pins:
-                            self._pin_to_net[pin] = primary_net
+                            self._pin_to_net[pin.key] = primary_net
                         for point in other_net.points:
                             self._point_to_net[point] = primary_net
 
@@ -503,22 +547,9 @@ class ConnectivityAnalyzer:
         Returns:
             True if pins are on the same net, False otherwise
         """
-        # Find pins in the connectivity graph
-        pin_conn1 = None
-        pin_conn2 = None
-
-        for pin in self._pin_to_net.keys():
-            if pin.reference == ref1 and pin.pin_number == pin1:
-                pin_conn1 = pin
-            if pin.reference == ref2 and pin.pin_number == pin2:
-                pin_conn2 = pin
-
-        if not pin_conn1 or not pin_conn2:
-            return False
-
         # Check if both pins are in the same net
-        net1 = self._pin_to_net.get(pin_conn1)
-        net2 = self._pin_to_net.get(pin_conn2)
+        net1 = self.get_net_for_pin(ref1, pin1)
+        net2 = self.get_net_for_pin(ref2, pin2)
 
         return net1 is not None and net1 is net2
 
@@ -654,7 +685,7 @@ class ConnectivityAnalyzer:
 
                             # Update mappings
                             for pin in child_net.pins:
-                                self._pin_to_net[pin] = parent_net
+                                self._pin_to_net[pin.key] = parent_net
                             for point in child_net.points:
                                 self._point_to_net[point] = parent_net
 
@@ -673,11 +704,7 @@ class ConnectivityAnalyzer:
         Returns:
             Net object if pin is connected, None otherwise
         """
-        for pin in self._pin_to_net.keys():
-            if pin.reference == reference and pin.pin_number == pin_number:
-                return self._pin_to_net[pin]
-
-        return None
+        return self._pin_to_net.get((reference, pin_number))
 
     def get_connected_pins(self, reference: str, pin_number: str) -> List[Tuple[str, str]]:
         """
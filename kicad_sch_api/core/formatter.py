@@ -5,15 +5,52 @@ This module provides precise S-expression formatting that matches KiCAD's native
 ensuring round-trip compatibility and professional output quality.
 """
 
+import functools
 import logging
 import re
-from dataclasses import dataclass
+import types
+from dataclasses import dataclass, replace
 from typing import Any, Callable, Dict, List, Optional, Set, Union
 
 import sexpdata
 
+from ._symbols import EFFECTS, FONT, SIZE
+
 logger = logging.getLogger(__name__)
 
+# Indentation strings for the nesting depths KiCAD schematics actually reach
+_INDENTS = tuple("\t" * level for level in range(32))
+
+
+def _indent(level: int) -> str:
+    """Return the tab indentation for a nesting level."""
+    return _INDENTS[level] if level < len(_INDENTS) else "\t" * level
+
+
+@functools.lru_cache(maxsize=None)
+def _default_effects_template(level: int) -> str:
+    """Layout the generic multiline path gives (effects (font (size W H))) at a nesting level."""
+    return (
+        f"(effects\n{_indent(level + 1)}(font\n{_indent(level + 2)}(size %s %s)"
+        f"\n{_indent(level + 1)})\n{_indent(level)})"
+    )
+
+
+def _is_tag(element: Any, tag: sexpdata.Symbol) -> bool:
+    """Check a list head against a tag Symbol; identity catches parsed trees without __eq__."""
+    return element is tag or (isinstance(element, sexpdata.Symbol) and element == tag)
+
+
+# Deletion table for characters that force quoting: space, double quote and S-expression specials
+_UNSAFE_CHARS_TABLE = str.maketrans("", "", ' "()[]{}#')
+
+
+@functools.lru_cache(maxsize=4096)
+def _needs_quoting_cached(text: str) -> bool:
+    """Check if string needs to be quoted (memoized; tokens recur heavily across a schematic)."""
+    # Quote if empty or if deleting the unsafe characters shortens it (single C-level pass)
+    return not text or len(text.translate(_UNSAFE_CHARS_TABLE)) != len(text)
+
 
 @dataclass
 class FormatRule:
@@ -30,6 +67,13 @@ class FormatRule:
             self.quote_indices = set()
 
 
+# Rule for tags without an entry in the rules table; shared, never mutated
+_DEFAULT_RULE = FormatRule()
+
+# Rules tables by formatter class; built on first use and copied into each instance
+_RULES_BY_CLASS: Dict[type, Dict[str, FormatRule]] = {}
+
+
 class ExactFormatter:
     """
     S-expression formatter that produces output identical to KiCAD's native formatting.
@@ -40,8 +84,22 @@ class ExactFormatter:
 
     def __init__(self):
         """Initialize the formatter with KiCAD-specific rules."""
-        self.rules = {}
-        self._initialize_kicad_rules()
+        # The rules only depend on the class, so each class builds its table once
+        cls = type(self)
+        rules = _RULES_BY_CLASS.get(cls)
+        if rules is None:
+            self.rules = {}
+            self._initialize_kicad_rules()
+            rules = _RULES_BY_CLASS[cls] = self.rules
+        # Each instance gets its own table, with handlers bound to it rather than to
+        # the formatter that built the class's table
+        self.rules = dict(rules)
+        for tag, rule in rules.items():
+            handler = rule.custom_handler
+            if isinstance(getattr(handler, "__self__", None), ExactFormatter):
+                self.rules[tag] = replace(
+                    rule, custom_handler=types.MethodType(handler.__func__, self)
+                )
         logger.debug("Exact formatter initialized with KiCAD rules")
 
     def _initialize_kicad_rules(self):
@@ -235,7 +293,7 @@ class ExactFormatter:
 
         # Get the tag (first element)
         tag = str(lst[0]) if isinstance(lst[0], sexpdata.Symbol) else None
-        rule = self.rules.get(tag, FormatRule())
+        rule = self.rules.get(tag, _DEFAULT_RULE)
 
         # Use custom handler if available
         if rule.custom_handler:
@@ -263,9 +321,6 @@ class ExactFormatter:
         if not lst:
             return "()"
 
-        result = []
-        indent = "\t" * indent_level
-
         # First element (tag) on opening line
         tag = str(lst[0])
 
@@ -297,31 +352,54 @@ class ExactFormatter:
         if len(lst) < 3:
             return self._format_inline(lst, FormatRule(quote_indices={1, 2}))
 
-        indent = "\t" * indent_level
-        next_indent = "\t" * (indent_level + 1)
+        indent = _indent(indent_level)
+        next_indent = _indent(indent_level + 1)
 
         # Property format: (property "Name" "Value" (at x y rotation) (effects ...))
         escaped_name = self._escape_string(str(lst[1]))
         escaped_value = self._escape_string(str(lst[2]))
-        result = f'({lst[0]} "{escaped_name}" "{escaped_value}"'
+        parts = [f'({lst[0]} "{escaped_name}" "{escaped_value}"']
 
         # Add position and effects on separate lines
         for element in lst[3:]:
             if isinstance(element, list):
-                result += f"\n{next_indent}{self._format_element(element, indent_level + 1)}"
+                formatted = self._format_default_effects(element, indent_level + 1)
+                if formatted is None:
+                    formatted = self._format_list(element, indent_level + 1)
+                parts.append(f"\n{next_indent}{formatted}")
             else:
-                result += f" {element}"
+                parts.append(f" {element}")
 
-        result += f"\n{indent})"
-        return result
+        parts.append(f"\n{indent})")
+        return "".join(parts)
+
+    def _format_default_effects(self, lst: List[Any], indent_level: int) -> Optional[str]:
+        """
+        Format the plain (effects (font (size W H))) block most properties carry.
+
+        Fills a per-level template instead of recursing through three lists.
+        Returns None for any other shape so the caller uses the generic path.
+        """
+        if len(lst) != 2 or not _is_tag(lst[0], EFFECTS):
+            return None
+        font = lst[1]
+        if not isinstance(font, list) or len(font) != 2 or not _is_tag(font[0], FONT):
+            return None
+        size = font[1]
+        if not isinstance(size, list) or len(size) != 3 or not _is_tag(size[0], SIZE):
+            return None
+        return _default_effects_template(indent_level) % (
+            self._format_element(size[1], 0),
+            self._format_element(size[2], 0),
+        )
 
     def _format_pin(self, lst: List[Any], indent_level: int) -> str:
         """Format pin elements with context-aware quoting."""
         if len(lst) < 2:
             return self._format_inline(lst, FormatRule())
 
-        indent = "\t" * indent_level
-        next_indent = "\t" * (indent_level + 1)
+        indent = _indent(indent_level)
+        next_indent = _indent(indent_level + 1)
 
         # Check if this is a lib_symbols pin (passive/line) or sheet pin ("NET1" input)
         if (
@@ -344,80 +422,80 @@ class ExactFormatter:
             ]
         ):
             # lib_symbols context: (pin passive line ...)
-            result = f"({lst[0]} {lst[1]} {lst[2]}"
+            parts = [f"({lst[0]} {lst[1]} {lst[2]}"]
             start_index = 3
 
             # Add remaining elements on separate lines with proper indentation
             for element in lst[start_index:]:
                 if isinstance(element, list):
-                    result += f"\n{next_indent}{self._format_element(element, indent_level + 1)}"
+                    parts.append(f"\n{next_indent}{self._format_list(element, indent_level + 1)}")
 
-            result += f"\n{indent})"
-            return result
+            parts.append(f"\n{indent})")
+            return "".join(parts)
         else:
             # sheet pin or component pin context: (pin "NET1" input) or (pin "1" ...)
             # Pin name should always be quoted
             pin_name = str(lst[1])
-            result = f'({lst[0]} "{pin_name}"'
+            parts = [f'({lst[0]} "{pin_name}"']
             start_index = 2
 
             # Add remaining elements (type and others)
             for i, element in enumerate(lst[start_index:], start_index):
                 if isinstance(element, list):
-                    result += f"\n{next_indent}{self._format_element(element, indent_level + 1)}"
+                    parts.append(f"\n{next_indent}{self._format_list(element, indent_level + 1)}")
                 else:
                     # Convert pin type to symbol if it's a string
                     if i == 2 and isinstance(element, str):
-                        result += f" {element}"  # Pin type as bare symbol
+                        parts.append(f" {element}")  # Pin type as bare symbol
                     else:
-                        result += f" {self._format_element(element, 0)}"
+                        parts.append(f" {self._format_element(element, 0)}")
 
-            result += f"\n{indent})"
-            return result
+            parts.append(f"\n{indent})")
+            return "".join(parts)
 
     def _format_component_like(self, lst: List[Any], indent_level: int, rule: FormatRule) -> str:
         """Format component-like elements (symbol, wire, etc.)."""
-        indent = "\t" * indent_level
-        next_indent = "\t" * (indent_level + 1)
+        indent = _indent(indent_level)
+        next_indent = _indent(indent_level + 1)
 
         tag = str(lst[0])
-        result = f"({tag}"
+        parts = [f"({tag}"]
 
         # Add quoted elements if specified
         for i in range(1, len(lst)):
             element = lst[i]
             if isinstance(element, list):
-                result += f"\n{next_indent}{self._format_element(element, indent_level + 1)}"
+                parts.append(f"\n{next_indent}{self._format_list(element, indent_level + 1)}")
             else:
                 if i in rule.quote_indices and isinstance(element, str):
                     escaped_element = self._escape_string(element)
-                    result += f' "{escaped_element}"'
+                    parts.append(f' "{escaped_element}"')
                 else:
-                    result += f" {self._format_element(element, 0)}"
+                    parts.append(f" {self._format_element(element, 0)}")
 
-        result += f"\n{indent})"
-        return result
+        parts.append(f"\n{indent})")
+        return "".join(parts)
 
     def _format_generic_multiline(self, lst: List[Any], indent_level: int, rule: FormatRule) -> str:
         """Generic multiline formatting."""
-        indent = "\t" * indent_level
-        next_indent = "\t" * (indent_level + 1)
+        indent = _indent(indent_level)
+        next_indent = _indent(indent_level + 1)
 
         tag = str(lst[0])
-        result = f"({tag}"
+        parts = [f"({tag}"]
 
         for i, element in enumerate(lst[1:], 1):
             if isinstance(element, list):
-                result += f"\n{next_indent}{self._format_element(element, indent_level + 1)}"
+                parts.append(f"\n{next_indent}{self._format_list(element, indent_level + 1)}")
             else:
                 if i in rule.quote_indices and isinstance(element, str):
                     escaped_element = self._escape_string(element)
-                    result += f' "{escaped_element}"'
+                    parts.append(f' "{escaped_element}"')
                 else:
-                    result += f" {self._format_element(element, 0)}"
+                    parts.append(f" {self._format_element(element, 0)}")
 
-        result += f"\n{indent})"
-        return result
+        parts.append(f"\n{indent})")
+        return "".join(parts)
 
     def _should_format_inline(self, lst: List[Any], rule: FormatRule) -> bool:
         """Determine if list should be formatted inline."""
@@ -448,13 +526,7 @@ class ExactFormatter:
 
     def _needs_quoting(self, text: str) -> bool:
         """Check if string needs to be quoted."""
-        # Quote if contains spaces, special characters, or is empty
-        if not text or " " in text or '"' in text:
-            return True
-
-        # Quote if contains S-expression special characters
-        special_chars = "()[]{}#"
-        return any(c in text for c in special_chars)
+        return _needs_quoting_cached(text)
 
     def _format_kicad_sch(self, lst: List[Any], indent_level: int) -> str:
         """
@@ -495,14 +567,14 @@ class ExactFormatter:
                         body_parts.append(item)
 
             # Build single-line header + body format
-            result = f"({' '.join(header_parts)}"
+            parts = [f"({' '.join(header_parts)}"]
             for item in body_parts:
                 if isinstance(item, list) and len(item) == 1:
-                    result += f"\n  ({item[0]})"
+                    parts.append(f"\n  ({item[0]})")
                 else:
-                    result += f"\n  {self._format_element(item, 1)}"
-            result += "\n)\n"
-            return result
+                    parts.append(f"\n  {self._format_element(item, 1)}")
+            parts.append("\n)\n")
+            return "".join(parts)
 
         # For normal schematics, use standard multiline formatting
         return self._format_multiline(lst, indent_level, FormatRule())
@@ -512,8 +584,8 @@ class ExactFormatter:
         if len(lst) < 2:
             return self._format_inline(lst, FormatRule())
 
-        indent = "\t" * indent_level
-        next_indent = "\t" * (indent_level + 1)
+        indent = _indent(indent_level)
+        next_indent = _indent(indent_level + 1)
 
         # Format as:
         # (pts
@@ -538,10 +610,10 @@ class ExactFormatter:
 
     def _format_image(self, lst: List[Any], indent_level: int) -> str:
         """Format image elements with base64 data split across lines."""
-        indent = "\t" * indent_level
-        next_indent = "\t" * (indent_level + 1)
+        indent = _indent(indent_level)
+        next_indent = _indent(indent_level + 1)
 
-        result = f"({lst[0]}"
+        parts = [f"({lst[0]}"]
 
         # Process each element
         for element in lst[1:]:
@@ -551,18 +623,18 @@ class ExactFormatter:
                     # Special handling for data element
                     # First chunk on same line as (data, rest on subsequent lines
                     if len(element) > 1:
-                        result += f'\n{next_indent}({element[0]} "{element[1]}"'
+                        parts.append(f'\n{next_indent}({element[0]} "{element[1]}"')
                         for chunk in element[2:]:
-                            result += f'\n{next_indent}\t"{chunk}"'
-                        result += f"\n{next_indent})"
+                            parts.append(f'\n{next_indent}\t"{chunk}"')
+                        parts.append(f"\n{next_indent})")
                     else:
-                        result += f"\n{next_indent}({element[0]})"
+                        parts.append(f"\n{next_indent}({element[0]})")
                 else:
                     # Regular element formatting
-                    result += f"\n{next_indent}{self._format_element(element, indent_level + 1)}"
+                    parts.append(f"\n{next_indent}{self._format_list(element, indent_level + 1)}")
 
-        result += f"\n{indent})"
-        return result
+        parts.append(f"\n{indent})")
+        return "".join(parts)
 
 
 class CompactFormatter(ExactFormatter):
@@ -573,6 +645,11 @@ class CompactFormatter(ExactFormatter):
         # Use single spaces instead of tabs for compact output
         return super()._format_multiline(lst, indent_level, rule).replace("\t", " ")
 
+    def _format_default_effects(self, lst: List[Any], indent_level: int) -> Optional[str]:
+        """Keep the effects fast path consistent with the compact multiline spacing."""
+        formatted = super()._format_default_effects(lst, indent_level)
+        return formatted.replace("\t", " ") if formatted is not None else None
+
 
 class DebugFormatter(ExactFormatter):
     """Debug formatter with extra spacing and comments."""
@@ -8,7 +8,7 @@ while maintaining exact format preservation.
 import logging
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from ...utils.validation import ValidationError
 from ..config import config
@@ -35,6 +35,9 @@ class FileIOManager(BaseManager):
         super().__init__()
         self._parser = SExpressionParser(preserve_format=True)
         self._formatter = ExactFormatter()
+        # (content, tree) of the last original content compared in format_schematic().
+        # The tree is a private copy that is only ever compared, never handed out.
+        self._original_tree: Optional[Tuple[str, Any]] = None
 
     def load_schematic(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """
@@ -77,7 +80,8 @@ class FileIOManager(BaseManager):
         schematic_data: Dict[str, Any],
         file_path: Union[str, Path],
         preserve_format: bool = True,
-    ) -> None:
+        original_content: Optional[str] = None,
+    ) -> str:
         """
         Save schematic data to file.
 
@@ -85,6 +89,11 @@ class FileIOManager(BaseManager):
             schematic_data: Schematic data to save
             file_path: Target file path
             preserve_format: Whether to preserve exact formatting
+            original_content: Content the schematic was loaded from, written back
+                verbatim if the data still matches it (only with preserve_format)
+
+        Returns:
+            Content written to the file
 
         Raises:
             PermissionError: If file cannot be written
@@ -99,15 +108,18 @@ class FileIOManager(BaseManager):
             # Ensure parent directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Convert to S-expression format and save
-            sexp_data = self._parser._schematic_data_to_sexp(schematic_data)
-            formatted_content = self._formatter.format(sexp_data)
+            formatted_content = self.format_schematic(
+                schematic_data, original_content if preserve_format else None
+            )
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(formatted_content)
+            # One binary write of the encoded content: no text-layer buffering, and no
+            # newline translation, so the file holds exactly the content returned
+            with open(file_path, "wb") as f:
+                f.write(formatted_content.encode("utf-8"))
 
             save_time = time.time() - start_time
             logger.info(f"Saved schematic in {save_time:.3f}s")
+            return formatted_content
 
         except PermissionError as e:
             logger.error(f"Permission denied saving to {file_path}: {e}")
@@ -116,6 +128,38 @@ class FileIOManager(BaseManager):
             logger.error(f"Failed to save schematic to {file_path}: {e}")
             raise ValidationError(f"Save failed: {e}") from e
 
+    def format_schematic(
+        self, schematic_data: Dict[str, Any], original_content: Optional[str] = None
+    ) -> str:
+        """
+        Format schematic data as KiCAD S-expression text without writing it.
+
+        Args:
+            schematic_data: Schematic data to format
+            original_content: Content the schematic was loaded from. If the data
+                still converts to the same S-expression tree, this content is
+                returned as-is and the formatter is skipped.
+
+        Returns:
+            Formatted .kicad_sch file content
+        """
+        sexp_data = self._parser._schematic_data_to_sexp(schematic_data)
+        # Comparing trees is far cheaper than formatting, and keeps KiCAD's own layout
+        if original_content and sexp_data == self._get_original_tree(original_content):
+            logger.debug("Schematic unchanged since load, reusing original content")
+            return original_content
+        return self._formatter.format(sexp_data)
+
+    def _get_original_tree(self, original_content: str) -> Any:
+        """Parse tree of the original content, reused across saves of an unchanged schematic."""
+        cached = self._original_tree
+        if cached is None or cached[0] != original_content:
+            cached = self._original_tree = (
+                original_content,
+                self._parser.parse_string(original_content),
+            )
+        return cached[1]
+
     def create_backup(self, file_path: Union[str, Path], suffix: str = ".backup") -> Path:
         """
         Create a backup copy of the schematic file.
@@ -7,9 +7,10 @@ validation issues systematically.
 """
 
 import logging
+from collections import Counter
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-from ...utils.validation import ValidationError, ValidationIssue
+from ...utils.validation import ValidationError, ValidationIssue, ValidationLevel
 from ..types import Point
 from .base import BaseManager
 
@@ -309,22 +310,22 @@ class ValidationManager(BaseManager):
         Returns:
             Summary dictionary with counts and severity
         """
+        # Tally levels and categories in a single pass over the issues
+        level_counts: Counter = Counter()
+        categories: Dict[str, int] = {}
+        for issue in issues:
+            level_counts[issue.level] += 1
+            categories[issue.category] = categories.get(issue.category, 0) + 1
+
         summary = {
             "total_issues": len(issues),
-            "error_count": len([i for i in issues if i.level == "error"]),
-            "warning_count": len([i for i in issues if i.level == "warning"]),
-            "info_count": len([i for i in issues if i.level == "info"]),
-            "categories": {},
+            "error_count": level_counts[ValidationLevel.ERROR],
+            "warning_count": level_counts[ValidationLevel.WARNING],
+            "info_count": level_counts[ValidationLevel.INFO],
+            "categories": categories,
             "severity": "info",
         }
 
-        # Count by category
-        for issue in issues:
-            category = issue.category
-            if category not in summary["categories"]:
-                summary["categories"][category] = 0
-            summary["categories"][category] += 1
-
         # Determine overall severity
         if summary["error_count"] > 0:
             summary["severity"] = "error"
@@ -56,6 +56,10 @@ class WireManager(BaseManager):
         self._connectivity_analyzer: Optional[ConnectivityAnalyzer] = None
         self._connectivity_valid = False
 
+        # Absolute pin positions per component reference, stored with the component
+        # state they were computed from so moved or replaced components are recomputed
+        self._pin_positions: Dict[str, Tuple[Tuple, List[Tuple[str, Point]], Dict[str, Point]]] = {}
+
     def add_wire(
         self, start: Union[Point, Tuple[float, float]], end: Union[Point, Tuple[float, float]]
     ) -> str:
@@ -83,6 +87,38 @@ class WireManager(BaseManager):
         logger.debug(f"Added wire: {start} -> {end}")
         return wire_uuid
 
+    def add_wires(self, points: List[Union[Point, Tuple[float, float]]]) -> List[str]:
+        """
+        Add a wire for each consecutive pair of points along a route.
+
+        All points are checked before any wire is added, so an invalid point
+        adds no wires.
+
+        Args:
+            points: Route points; N points give N - 1 wires
+
+        Returns:
+            UUIDs of created wires, in route order
+
+        Raises:
+            ValueError: If a point is neither a Point nor a tuple
+        """
+        route = []
+        for p in points:
+            if isinstance(p, tuple):
+                p = Point(p[0], p[1])
+            elif not isinstance(p, Point):
+                raise ValueError(f"Route point must be Point or tuple, got {type(p)}")
+            route.append(p)
+        wire_uuids = [self._wires.add(start=a, end=b) for a, b in zip(route, route[1:])]
+
+        if wire_uuids:
+            # Invalidate connectivity cache
+            self._invalidate_connectivity()
+
+        logger.debug(f"Added {len(wire_uuids)} wires along {len(route)}-point route")
+        return wire_uuids
+
     def remove_wire(self, wire_uuid: str) -> bool:
         """
         Remove wire by UUID.
@@ -178,20 +214,14 @@ class WireManager(BaseManager):
         Returns:
             Absolute pin position or None if not found
         """
-        from ..pin_utils import list_component_pins
-
-        # Find component
-        component = self._components.get(component_ref)
-        if not component:
+        pin_positions = self._get_pin_positions(component_ref)
+        if pin_positions is None:
             logger.warning(f"Component not found: {component_ref}")
             return None
 
-        # Use pin_utils to get correct transformed positions
-        pins = list_component_pins(component)
-
-        for pin_num, pin_pos in pins:
-            if pin_num == pin_number:
-                return pin_pos
+        pin_pos = pin_positions[1].get(pin_number)
+        if pin_pos is not None:
+            return pin_pos
 
         logger.warning(f"Pin {pin_number} not found on component {component_ref}")
         return None
@@ -209,15 +239,52 @@ class WireManager(BaseManager):
         Returns:
             List of (pin_number, absolute_position) tuples
         """
+        pin_positions = self._get_pin_positions(component_ref)
+        if pin_positions is None:
+            return []
+
+        return list(pin_positions[0])
+
+    def _get_pin_positions(
+        self, component_ref: str
+    ) -> Optional[Tuple[List[Tuple[str, Point]], Dict[str, Point]]]:
+        """
+        Get a component's absolute pin positions as a list and by pin number.
+
+        Positions are computed once per component state and reused until the
+        component is moved, rotated, or replaced under the same reference.
+        """
         from ..pin_utils import list_component_pins
 
         # Find component
         component = self._components.get(component_ref)
         if not component:
-            return []
+            self._pin_positions.pop(component_ref, None)
+            return None
+
+        state = (
+            component.uuid,
+            component.lib_id,
+            component.position,
+            getattr(component, "rotation", 0),
+            getattr(component, "mirror", None),
+            len(component.pins),
+        )
+        cached = self._pin_positions.get(component_ref)
+        if cached is not None and cached[0] == state:
+            return cached[1], cached[2]
 
         # Use pin_utils to get correct transformed positions
-        return list_component_pins(component)
+        pins = list_component_pins(component)
+        by_number: Dict[str, Point] = {}
+        for pin_num, pin_pos in pins:
+            # First match wins, as with a linear scan
+            by_number.setdefault(pin_num, pin_pos)
+
+        # A component without resolvable pins is retried, e.g. once its library is found
+        if pins:
+            self._pin_positions[component_ref] = (state, pins, by_number)
+        return pins, by_number
 
     def auto_route_pins(
         self,
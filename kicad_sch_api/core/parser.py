@@ -5,8 +5,15 @@ This module provides robust parsing and writing capabilities for KiCAD's S-expre
 with exact format preservation and enhanced error handling.
 """
 
+import hashlib
+import io
 import logging
+import os
+import pickle
+import re
+import tempfile
 import uuid
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -22,11 +29,154 @@ from ..parsers.elements.text_parser import TextParser
 from ..parsers.elements.wire_parser import WireParser
 from ..parsers.utils import color_to_rgb255, color_to_rgba
 from ..utils.validation import ValidationError, ValidationIssue
+from ._symbols import (
+    AT,
+    EFFECTS,
+    FONT,
+    HIDE,
+    JUSTIFY,
+    PICKLE_DISPATCH_TABLE,
+    PROPERTY,
+    SIZE,
+    YES,
+    intern_symbol,
+)
 from .formatter import ExactFormatter
 from .types import Junction, Label, Net, Point, SchematicSymbol, Wire
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the shape of parse_string() output changes so cached trees are ignored
+PARSER_VERSION = 2
+
+# Pickled parse trees of recently parsed strings, keyed by BLAKE2b digest of the content.
+# Kept small: each entry holds a whole schematic's tree for the life of the process.
+_PARSE_STRING_CACHE: "OrderedDict[bytes, bytes]" = OrderedDict()
+_PARSE_STRING_CACHE_SIZE = 8
+
+# Total size the on-disk parse cache may grow to before its oldest entries are removed
+_PARSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Tokens of the S-expression subset KiCAD writes: parens, quoted strings and bare atoms.
+# Whitespace (string.whitespace, as sexpdata uses) is skipped by findall; any other
+# character that starts none of the first three alternatives is returned on its own.
+# There are no groups, so findall() hands back plain strings without a Match per token.
+_TOKEN_RE = re.compile(
+    r"[()]|\"(?:[^\"\\]|\\.)*\""
+    r"|[^ \t\n\r\x0b\x0c()\[\]\"\\;'][^ \t\n\r\x0b\x0c()\[\]\"\\;]*"
+    r"|[^ \t\n\r\x0b\x0c]",
+    re.DOTALL,
+)
+# First characters of stray tokens that sexpdata treats as syntax (or a lone, unclosed quote)
+_UNSUPPORTED_FIRST_CHARS = frozenset("[]\\;'\"")
+_STRING_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+_STRING_ESCAPES = {"\\": "\\", '"': '"', "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_FLOAT_WORDS = {"inf", "infinity", "nan"}
+
+
+def _pickle_tree(sexp_data: Any, file: Any) -> None:
+    """Pickle a parse tree so that keyword Symbols load back as the shared instances."""
+    pickler = pickle.Pickler(file, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = PICKLE_DISPATCH_TABLE
+    pickler.dump(sexp_data)
+
+
+def _pickle_tree_bytes(sexp_data: Any) -> bytes:
+    buffer = io.BytesIO()
+    _pickle_tree(sexp_data, buffer)
+    return buffer.getvalue()
+
+
+class _UnsupportedSyntax(Exception):
+    """Input uses S-expression syntax outside the KiCAD subset (or is malformed)."""
+
+
+def _unescape_string(match: "re.Match") -> str:
+    """Resolve a backslash escape the way sexpdata does; unknown escapes are kept verbatim."""
+    char = match.group(1)
+    return _STRING_ESCAPES.get(char, "\\" + char)
+
+
+def _kicad_atom(token: str) -> Any:
+    """
+    Convert a bare atom exactly like sexpdata: t/nil, then int, then float, else Symbol.
+
+    KiCAD keywords come back as the shared instances from _symbols.
+    """
+    if token[0].isalpha():
+        if token == "t":
+            return True
+        if token == "nil":
+            return []
+        # float() also strips (unicode) whitespace, which atoms may legitimately end in
+        if token.rstrip().lower() in _FLOAT_WORDS:
+            return float(token)
+        return intern_symbol(token)
+
+    # int() never accepts '.', 'e' or 'E', so skip straight to float() for those
+    if "." not in token and "e" not in token and "E" not in token:
+        try:
+            return int(token)
+        except ValueError:
+            pass
+    try:
+        return float(token)
+    except ValueError:
+        return sexpdata.Symbol(token)
+
+
+def _loads_kicad(content: str) -> Any:
+    """
+    Parse a single S-expression using the KiCAD subset of sexpdata's grammar.
+
+    Produces the same tree as sexpdata.loads() with default options. Raises
+    _UnsupportedSyntax for anything else (brackets, quote/comment characters,
+    escapes in atoms, unbalanced parens, zero or several top-level forms) so the
+    caller can defer to sexpdata for full handling and error reporting.
+    """
+    root: List[Any] = []
+    current = root
+    stack: List[List[Any]] = []
+    # Tokens repeat heavily (keywords, 0, 1.27, yes, lib_ids...); convert each distinct
+    # one once, keyed by its raw text so quoted strings never collide with atoms.
+    # "nil" is never cached since it becomes a fresh, mutable list every time.
+    tokens: Dict[str, Any] = {}
+    # Different escapes can spell the same string; share one object per value
+    strings: Dict[str, str] = {}
+
+    for token in _TOKEN_RE.findall(content):
+        if token == "(":
+            child: List[Any] = []
+            current.append(child)
+            stack.append(current)
+            current = child
+        elif token == ")":
+            if not stack:
+                raise _UnsupportedSyntax
+            current = stack.pop()
+        elif token in tokens:
+            current.append(tokens[token])
+        else:
+            first = token[0]
+            if first == '"' and len(token) > 1:
+                text = token[1:-1]
+                if "\\" in text:
+                    text = _STRING_ESCAPE_RE.sub(_unescape_string, text)
+                value = strings.setdefault(text, text)
+            elif first in _UNSUPPORTED_FIRST_CHARS:
+                raise _UnsupportedSyntax
+            else:
+                value = _kicad_atom(token)
+                if token == "nil":
+                    current.append(value)
+                    continue
+            tokens[token] = value
+            current.append(value)
+
+    if stack or len(root) != 1:
+        raise _UnsupportedSyntax
+    return root[0]
+
 
 class SExpressionParser:
     """
@@ -39,14 +189,25 @@ class SExpressionParser:
     - Support for KiCAD 9 format
     """
 
-    def __init__(self, preserve_format: bool = True):
+    def __init__(
+        self,
+        preserve_format: bool = True,
+        cache_dir: Optional[Path] = None,
+        enable_persistence: bool = False,
+    ):
         """
         Initialize the parser.
 
         Args:
             preserve_format: If True, preserve exact formatting when writing
+            cache_dir: Directory for cached parse trees of schematic files
+            enable_persistence: Whether parse_file may reuse and store cached parse trees.
+                Cache entries are unpickled, so only enable this for a trusted cache_dir.
         """
         self.preserve_format = preserve_format
+        # Resolved on first use; most parsers never persist a parse tree
+        self._cache_dir = cache_dir
+        self._enable_persistence = enable_persistence
         self._formatter = ExactFormatter() if preserve_format else None
         self._validation_issues = []
         self._graphics_parser = GraphicsParser()
@@ -98,8 +259,8 @@ class SExpressionParser:
             with open(filepath, "r", encoding="utf-8") as f:
                 content = f.read()
 
-            # Parse S-expression
-            sexp_data = self.parse_string(content)
+            # Parse S-expression, reusing the cached tree if the file is unchanged
+            sexp_data = self._parse_file_content(filepath, content)
 
             # Validate structure
             self._validate_schematic_structure(sexp_data, filepath)
@@ -131,10 +292,99 @@ class SExpressionParser:
         Raises:
             ValidationError: If parsing fails
         """
+        return self._parse_string_pickled(content)[0]
+
+    def _parse_string_pickled(self, content: str) -> Tuple[Any, bytes]:
+        """Parse content and also return the tree's pickled bytes, as cached in memory."""
+        key = hashlib.blake2b(content.encode("utf-8")).digest()
+        cached = _PARSE_STRING_CACHE.get(key)
+        if cached is not None:
+            _PARSE_STRING_CACHE.move_to_end(key)
+            # Unpickle rather than share the tree, callers are free to mutate it
+            return pickle.loads(cached), cached
+
+        try:
+            sexp_data = _loads_kicad(content)
+        except _UnsupportedSyntax:
+            # Outside the KiCAD subset: let sexpdata handle it (or report the error)
+            try:
+                sexp_data = sexpdata.loads(content)
+            except Exception as e:
+                raise ValidationError(f"Invalid S-expression format: {e}") from e
+
+        pickled = _pickle_tree_bytes(sexp_data)
+        _PARSE_STRING_CACHE[key] = pickled
+        if len(_PARSE_STRING_CACHE) > _PARSE_STRING_CACHE_SIZE:
+            _PARSE_STRING_CACHE.popitem(last=False)
+        return sexp_data, pickled
+
+    def _parse_file_content(self, filepath: Path, content: str) -> Any:
+        """
+        Parse file content, using the on-disk parse tree cache when enabled.
+
+        Cache entries are keyed by a BLAKE2b digest of the content and PARSER_VERSION,
+        so a cached tree always matches the text being parsed. Cache I/O failures
+        fall back to a normal parse.
+        """
+        if not self._enable_persistence:
+            return self.parse_string(content)
+
+        hasher = hashlib.blake2b(content.encode("utf-8"))
+        hasher.update(f":{PARSER_VERSION}".encode())
+        if self._cache_dir is None:
+            self._cache_dir = Path.home() / ".cache" / "kicad-sch-api" / "parse"
+        cache_file = self._cache_dir / f"{hasher.hexdigest()}.pickle"
+
         try:
-            return sexpdata.loads(content)
+            with open(cache_file, "rb") as f:
+                logger.debug(f"Using cached parse tree for {filepath}")
+                return pickle.load(f)
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            raise ValidationError(f"Invalid S-expression format: {e}") from e
+            logger.debug(f"Ignoring unreadable parse cache {cache_file}: {e}")
+
+        # The in-memory cache already pickled the tree; write those bytes as-is
+        sexp_data, pickled = self._parse_string_pickled(content)
+
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see a partial pickle
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(pickled)
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._prune_parse_cache()
+        except OSError as e:
+            logger.debug(f"Could not write parse cache for {filepath}: {e}")
+
+        return sexp_data
+
+    def _prune_parse_cache(self) -> None:
+        """Remove the oldest parse cache entries until the directory fits the size cap."""
+        entries = []
+        total = 0
+        for entry in self._cache_dir.glob("*.pickle"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, entry in entries:
+            if total <= _PARSE_CACHE_MAX_BYTES:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
 
     def write_file(self, schematic_data: Dict[str, Any], filepath: Union[str, Path]):
         """
@@ -162,9 +412,9 @@ class SExpressionParser:
         # Ensure directory exists
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to file
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Write to file in binary, so no newline translation happens
+        with open(filepath, "wb") as f:
+            f.write(content.encode("utf-8"))
 
         logger.info(f"Schematic written to: {filepath}")
 
@@ -543,24 +793,21 @@ class SExpressionParser:
         )
 
         # Build effects section based on hide status
-        effects = [
-            sexpdata.Symbol("effects"),
-            [sexpdata.Symbol("font"), [sexpdata.Symbol("size"), 1.27, 1.27]],
-        ]
+        effects = [EFFECTS, [FONT, [SIZE, 1.27, 1.27]]]
 
         # Only add justify for visible properties or Reference/Value
         if not hide or prop_name in ["Reference", "Value"]:
-            effects.append([sexpdata.Symbol("justify"), sexpdata.Symbol(justify)])
+            effects.append([JUSTIFY, intern_symbol(justify)])
 
         if hide:
-            effects.append([sexpdata.Symbol("hide"), sexpdata.Symbol("yes")])
+            effects.append([HIDE, YES])
 
         prop_sexp = [
-            sexpdata.Symbol("property"),
+            PROPERTY,
             prop_name,
             prop_value,
             [
-                sexpdata.Symbol("at"),
+                AT,
                 round(prop_x, 4) if prop_x != int(prop_x) else int(prop_x),
                 round(prop_y, 4) if prop_y != int(prop_y) else int(prop_y),
                 rotation,
@@ -589,19 +836,16 @@ class SExpressionParser:
             prop_y = component_pos.y + 3.556
 
         prop_sexp = [
-            sexpdata.Symbol("property"),
+            PROPERTY,
             "Value",
             value,
             [
-                sexpdata.Symbol("at"),
+                AT,
                 round(prop_x, 4) if prop_x != int(prop_x) else int(prop_x),
                 round(prop_y, 4) if prop_y != int(prop_y) else int(prop_y),
                 0,
             ],
-            [
-                sexpdata.Symbol("effects"),
-                [sexpdata.Symbol("font"), [sexpdata.Symbol("size"), 1.27, 1.27]],
-            ],
+            [EFFECTS, [FONT, [SIZE, 1.27, 1.27]]],
         ]
 
         return prop_sexp
@@ -6,11 +6,12 @@ composition with specialized manager classes for better separation of concerns
 and maintainability.
 """
 
+import copy
 import logging
 import time
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import sexpdata
 
@@ -23,7 +24,12 @@ from ..collections import (
     WireCollection,
 )
 from ..library.cache import get_symbol_cache
-from ..utils.validation import SchematicValidator, ValidationError, ValidationIssue
+from ..utils.validation import (
+    SchematicValidator,
+    ValidationError,
+    ValidationIssue,
+    ValidationLevel,
+)
 from .factories import ElementFactory
 from .formatter import ExactFormatter
 from .managers import (
@@ -39,7 +45,6 @@ from .managers import (
 )
 from .nets import NetCollection
 from .no_connects import NoConnectCollection
-from .parser import SExpressionParser
 from .texts import TextCollection
 from .types import (
     BusEntry,
@@ -60,8 +65,14 @@ from .types import (
     point_from_dict_or_tuple,
 )
 
+if TYPE_CHECKING:
+    from .component_bounds import BoundingBox
+
 logger = logging.getLogger(__name__)
 
+# Issue levels that prevent writing a schematic
+_BLOCKING_VALIDATION_LEVELS = frozenset({ValidationLevel.ERROR, ValidationLevel.CRITICAL})
+
 
 class Schematic:
     """
@@ -100,12 +111,14 @@ class Schematic:
         self._original_content = self._data.get("_original_content", "")
         self.name = name or "simple_circuit"
 
-        # Initialize parser and formatter
-        self._parser = SExpressionParser(preserve_format=True)
-        self._parser.project_name = self.name
+        # Initialize formatter; the parser is shared with the file I/O manager below
         self._formatter = ExactFormatter()
         self._legacy_validator = SchematicValidator()  # Keep for compatibility
 
+        # Converted lib_symbols definitions, keyed by (lib_id, project name). Each entry keeps
+        # the SymbolDefinition it was built from so reloaded symbols are re-converted.
+        self._lib_symbol_definitions: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+
         # Initialize component collection
         component_symbols = [
             SchematicSymbol(**comp) if isinstance(comp, dict) else comp
@@ -161,6 +174,8 @@ class Schematic:
 
         # Initialize specialized managers
         self._file_io_manager = FileIOManager()
+        self._parser = self._file_io_manager._parser
+        self._parser.project_name = self.name
         self._format_sync_manager = FormatSyncManager(self._data)
         self._graphics_manager = GraphicsManager(self._data)
         self._hierarchy_manager = HierarchyManager(self._data)
@@ -170,8 +185,9 @@ class Schematic:
         self._wire_manager = WireManager(self._data, self._wires, self._components, self)
         self._validation_manager = ValidationManager(self._data, self._components, self._wires)
 
-        # Track modifications for save optimization
-        self._modified = False
+        # Track modifications for save optimization; populating the collections
+        # above is not a modification
+        self._mark_saved()
         self._last_save_time = None
 
         # Performance tracking
@@ -285,6 +301,40 @@ class Schematic:
         logger.info(f"Created new schematic: {name}")
         return cls(schematic_data, name=name)
 
+    @classmethod
+    def clone_from(cls, other: "Schematic", name: Optional[str] = None) -> "Schematic":
+        """
+        Create an independent copy of another schematic.
+
+        Copies the other schematic's parsed data instead of re-adding its
+        elements one by one, so component validation and placement are not
+        repeated. The copy has no file path; an unmodified copy of a loaded
+        schematic saves its original content.
+
+        Args:
+            other: Schematic to copy
+            name: Project name for the copy (defaults to other's name)
+
+        Returns:
+            New Schematic object sharing no state with other
+        """
+        other._sync_collections_to_data()
+
+        # Synced component data is in file form; copy the symbols' fields instead
+        data = {k: copy.deepcopy(v) for k, v in other._data.items() if k != "components"}
+        data["components"] = [
+            copy.deepcopy(comp._data).field_values() for comp in other._components
+        ]
+        clone = cls(data, name=name or other.name)
+
+        # Hierarchical design context
+        clone._parent_uuid = other._parent_uuid
+        clone._sheet_uuid = other._sheet_uuid
+        clone._hierarchy_path = other._hierarchy_path
+
+        logger.info(f"Cloned schematic: {clone.name}")
+        return clone
+
     # Core properties
     @property
     def components(self) -> ComponentCollection:
@@ -532,7 +582,9 @@ class Schematic:
         return self._wire_manager.get_connected_pins(component_ref, pin_number)
 
     # File operations (delegated to FileIOManager)
-    def save(self, file_path: Optional[Union[str, Path]] = None, preserve_format: bool = True):
+    def save(
+        self, file_path: Optional[Union[str, Path]] = None, preserve_format: bool = True
+    ) -> str:
         """
         Save schematic to file.
 
@@ -540,6 +592,9 @@ class Schematic:
             file_path: Output file path (uses current path if None)
             preserve_format: Whether to preserve exact formatting
 
+        Returns:
+            Content written to the file, so callers need not read it back
+
         Raises:
             ValidationError: If schematic data is invalid
         """
@@ -554,29 +609,45 @@ class Schematic:
             file_path = Path(file_path)
             self._file_path = file_path
 
-        # Validate before saving
-        issues = self.validate()
-        errors = [issue for issue in issues if issue.level.value in ("error", "critical")]
-        if errors:
-            raise ValidationError("Cannot save schematic with validation errors", errors)
-
-        # Sync collection state back to data structure (critical for save)
-        self._sync_components_to_data()
-        self._sync_wires_to_data()
-        self._sync_junctions_to_data()
-        self._sync_texts_to_data()
-        self._sync_labels_to_data()
-        self._sync_hierarchical_labels_to_data()
-        self._sync_no_connects_to_data()
-        self._sync_nets_to_data()
-
-        # Ensure FileIOManager's parser has the correct project name
-        self._file_io_manager._parser.project_name = self.name
+        original_content = self._unmodified_original_content()
+        self._prepare_for_write()
 
         # Use FileIOManager for saving
-        self._file_io_manager.save_schematic(self._data, file_path, preserve_format)
+        content = self._file_io_manager.save_schematic(
+            self._data, file_path, preserve_format, original_content=original_content
+        )
 
         # Update state
+        self._mark_saved()
+        self._last_save_time = time.time()
+
+        save_time = time.time() - start_time
+        logger.info(f"Saved schematic to {file_path} in {save_time:.3f}s")
+        return content
+
+    def save_as(self, file_path: Union[str, Path], preserve_format: bool = True) -> str:
+        """Save schematic to a new file path."""
+        return self.save(file_path, preserve_format)
+
+    def dumps(self) -> str:
+        """
+        Return the schematic as .kicad_sch file content without writing it.
+
+        Produces the same content save() would write, but leaves the file path
+        and the modified/saved state untouched.
+
+        Returns:
+            Formatted schematic content
+
+        Raises:
+            ValidationError: If schematic data is invalid
+        """
+        original_content = self._unmodified_original_content()
+        self._prepare_for_write()
+        return self._file_io_manager.format_schematic(self._data, original_content)
+
+    def _mark_saved(self):
+        """Clear the modified flags of the schematic and its collections."""
         self._modified = False
         self._components.mark_saved()
         self._wires.mark_saved()
@@ -584,14 +655,41 @@ class Schematic:
         self._labels.mark_saved()
         self._hierarchical_labels.mark_saved()
         self._format_sync_manager.clear_dirty_flags()
-        self._last_save_time = time.time()
 
-        save_time = time.time() - start_time
-        logger.info(f"Saved schematic to {file_path} in {save_time:.3f}s")
+    def _unmodified_original_content(self) -> Optional[str]:
+        """
+        Loaded file content, if no tracked modification has been made since.
 
-    def save_as(self, file_path: Union[str, Path], preserve_format: bool = True):
-        """Save schematic to a new file path."""
-        self.save(file_path, preserve_format)
+        FileIOManager still checks the content against the current data before
+        reusing it, so untracked edits (e.g. to wire dataclasses) are not lost.
+        """
+        if self._original_content and not self.modified:
+            return self._original_content
+        return None
+
+    def _prepare_for_write(self):
+        """Validate and sync collection state into _data ahead of formatting."""
+        # Validate before saving
+        issues = self.validate()
+        errors = [issue for issue in issues if issue.level in _BLOCKING_VALIDATION_LEVELS]
+        if errors:
+            raise ValidationError("Cannot save schematic with validation errors", errors)
+
+        self._sync_collections_to_data()
+
+        # Ensure FileIOManager's parser has the correct project name
+        self._file_io_manager._parser.project_name = self.name
+
+    def _sync_collections_to_data(self):
+        """Sync collection state back to data structure (critical for save)."""
+        self._sync_components_to_data()
+        self._sync_wires_to_data()
+        self._sync_junctions_to_data()
+        self._sync_texts_to_data()
+        self._sync_labels_to_data()
+        self._sync_hierarchical_labels_to_data()
+        self._sync_no_connects_to_data()
+        self._sync_nets_to_data()
 
     def backup(self, suffix: str = ".backup") -> Path:
         """
@@ -701,6 +799,53 @@ class Schematic:
         self._modified = True
         return wire_uuid
 
+    def add_wires(
+        self,
+        points: List[Union[Point, Tuple[float, float]]],
+        grid_units: Optional[bool] = None,
+        grid_size: Optional[float] = None,
+    ) -> List[str]:
+        """
+        Add wires along a route, one per consecutive pair of points.
+
+        Equivalent to calling add_wire() for each segment, with the config
+        lookup and connectivity invalidation done once for the whole route.
+        A route with an invalid point adds no wires.
+
+        Args:
+            points: Route points in mm (or grid units if grid_units=True)
+            grid_units: If True, interpret positions as grid units; if None, use config.positioning.use_grid_units
+            grid_size: Grid size in mm; if None, use config.positioning.grid_size
+
+        Returns:
+            UUIDs of created wires, in route order
+        """
+        from .config import config
+
+        if grid_units is None:
+            grid_units = config.positioning.use_grid_units
+        if grid_size is None:
+            grid_size = config.positioning.grid_size
+
+        # Convert grid units to mm if requested
+        if grid_units:
+            # Anything else is left for the wire manager to reject
+            points = [
+                (
+                    (p[0] * grid_size, p[1] * grid_size)
+                    if isinstance(p, tuple)
+                    else Point(p.x * grid_size, p.y * grid_size) if isinstance(p, Point) else p
+                )
+                for p in points
+            ]
+
+        wire_uuids = self._wire_manager.add_wires(points)
+        for wire_uuid in wire_uuids:
+            self._format_sync_manager.mark_dirty("wire", "add", {"uuid": wire_uuid})
+        if wire_uuids:
+            self._modified = True
+        return wire_uuids
+
     def remove_wire(self, wire_uuid: str) -> bool:
         """
         Remove a wire by UUID.
@@ -1001,6 +1146,57 @@ class Schematic:
         self._modified = True
         return text_elem.uuid
 
+    def add_texts(
+        self,
+        items: List[Tuple[str, Union[Point, Tuple[float, float]], float]],
+        rotation: float = 0.0,
+        grid_units: Optional[bool] = None,
+        grid_size: Optional[float] = None,
+    ) -> List[str]:
+        """
+        Add several free text annotations at once.
+
+        Equivalent to calling add_text() for each item, but the text data is
+        synced once for the whole batch instead of once per text. Every item is
+        validated before any is added, so an invalid item adds no texts.
+
+        Args:
+            items: (text, position, size) tuples
+            rotation: Text rotation in degrees, applied to every text
+            grid_units: If True, interpret positions as grid units; if None, use config.positioning.use_grid_units
+            grid_size: Grid size in mm; if None, use config.positioning.grid_size
+
+        Returns:
+            UUIDs of created texts, in order
+
+        Raises:
+            ValidationError: If any item's text, position or size is invalid
+        """
+        from .config import config
+
+        if grid_units is None:
+            grid_units = config.positioning.use_grid_units
+        if grid_size is None:
+            grid_size = config.positioning.grid_size
+
+        validated = []
+        for text, position, size in items:
+            position = self._texts.validate_text(text, position, size)
+            if grid_units:
+                position = Point(position.x * grid_size, position.y * grid_size)
+            validated.append((text, position, size))
+
+        uuids = []
+        for text, position, size in validated:
+            text_elem = self._texts.add(text, position, rotation=rotation, size=size)
+            self._format_sync_manager.mark_dirty("text", "add", {"uuid": text_elem.uuid})
+            uuids.append(text_elem.uuid)
+
+        if uuids:
+            self._sync_texts_to_data()
+            self._modified = True
+        return uuids
+
     def add_text_box(
         self,
         text: str,
@@ -1446,6 +1642,7 @@ class Schematic:
         stroke_width: float = 0.127,
         stroke_color: str = "green",
         stroke_type: str = "solid",
+        bboxes: Optional[List["BoundingBox"]] = None,
     ) -> List[str]:
         """
         Draw bounding boxes for all components.
@@ -1455,16 +1652,20 @@ class Schematic:
             stroke_width: Line width
             stroke_color: Line color
             stroke_type: Line type
+            bboxes: Bounding boxes already computed for the components, e.g. for
+                obstacle checks; computed here if None
 
         Returns:
             List of rectangle UUIDs created
         """
-        from .component_bounds import get_component_bounding_box
+        from .component_bounds import get_schematic_component_bboxes
 
         uuids = []
 
-        for component in self._components:
-            bbox = get_component_bounding_box(component, include_properties)
+        if bboxes is None:
+            bboxes = get_schematic_component_bboxes(list(self._components), include_properties)
+
+        for bbox in bboxes:
             rect_uuid = self.draw_bounding_box(bbox, stroke_width, stroke_color, stroke_type)
             uuids.append(rect_uuid)
 
@@ -1630,9 +1831,14 @@ class Schematic:
         logger.debug("🔍 _sync_components_to_data: Syncing components to _data")
 
         components_data = []
+        # Unique lib_ids in first-use order; definitions are resolved once each below
+        required_lib_ids: Dict[str, None] = {}
         for comp in self._components:
+            if comp.lib_id:
+                required_lib_ids[comp.lib_id] = None
+
             # Start with base component data
-            comp_dict = {k: v for k, v in comp._data.__dict__.items() if not k.startswith("_")}
+            comp_dict = comp._data.field_values()
 
             # CRITICAL FIX: Explicitly preserve instances if user set them
             if hasattr(comp._data, "instances") and comp._data.instances:
@@ -1665,18 +1871,19 @@ class Schematic:
         self._data["components"] = components_data
         logger.debug(f"   Synced {len(components_data)} components to _data")
 
-        # Populate lib_symbols with actual symbol definitions used by components
+        # Populate lib_symbols with actual symbol definitions used by components,
+        # keeping entries copied by add_from() for symbols the libraries cannot provide
         lib_symbols = {}
+        existing_lib_symbols = self._data.get("lib_symbols") or {}
         cache = get_symbol_cache()
 
-        for comp in self._components:
-            if comp.lib_id and comp.lib_id not in lib_symbols:
-                # Get the actual symbol definition
-                symbol_def = cache.get_symbol(comp.lib_id)
+        for lib_id in required_lib_ids:
+            converted_symbol = self._get_lib_symbol_definition(cache, lib_id)
+            if converted_symbol is None:
+                converted_symbol = existing_lib_symbols.get(lib_id)
 
-                if symbol_def:
-                    converted_symbol = self._convert_symbol_to_kicad_format(symbol_def, comp.lib_id)
-                    lib_symbols[comp.lib_id] = converted_symbol
+            if converted_symbol is not None:
+                lib_symbols[lib_id] = converted_symbol
 
         self._data["lib_symbols"] = lib_symbols
 
@@ -1806,29 +2013,38 @@ class Schematic:
 
         self._data["nets"] = net_data
 
+    def _get_lib_symbol_definition(self, cache, lib_id: str):
+        """
+        Get the lib_symbols definition for lib_id, converting it at most once per project name.
+
+        Definitions are cached on this schematic only, so no two schematics share one.
+
+        Returns None if the library has no symbol for lib_id.
+        """
+        symbol_def = cache.get_symbol(lib_id)
+        if not symbol_def:
+            return None
+
+        key = (lib_id, self.name)
+        cached = self._lib_symbol_definitions.get(key)
+        if cached is not None and cached[0] is symbol_def:
+            return cached[1]
+
+        converted_symbol = self._convert_symbol_to_kicad_format(symbol_def, lib_id)
+        self._lib_symbol_definitions[key] = (symbol_def, converted_symbol)
+        return converted_symbol
+
     def _convert_symbol_to_kicad_format(self, symbol_def, lib_id: str):
         """Convert symbol definition to KiCAD format."""
         # Use raw data if available, but fix the symbol name to use full lib_id
         if hasattr(symbol_def, "raw_kicad_data") and symbol_def.raw_kicad_data:
             raw_data = symbol_def.raw_kicad_data
 
-            # Check if raw data already contains instances with project info
-            project_refs_found = []
-
-            def find_project_refs(data, path="root"):
-                if isinstance(data, list):
-                    for i, item in enumerate(data):
-                        if hasattr(item, "__str__") and str(item) == "project":
-                            if i < len(data) - 1:
-                                project_refs_found.append(f"{path}[{i}] = '{data[i+1]}'")
-                        elif isinstance(item, list):
-                            find_project_refs(item, f"{path}[{i}]")
-
-            find_project_refs(raw_data)
-
             # Make a copy and fix the symbol name (index 1) to use full lib_id
             if isinstance(raw_data, list) and len(raw_data) > 1:
-                fixed_data = raw_data.copy()
+                # Deep copy: project references are rewritten in place below and the
+                # library's raw data (and other projects' cached definitions) must not change
+                fixed_data = copy.deepcopy(raw_data)
                 fixed_data[1] = lib_id  # Replace short name with full lib_id
 
                 # Also fix any project references in instances to use current project name
@@ -269,16 +269,7 @@ class TextCollection(BaseCollection[TextElement]):
             ValidationError: If text data is invalid
         """
         # Validate inputs
-        if not isinstance(text, str) or not text.strip():
-            raise ValidationError("Text content cannot be empty")
-
-        if isinstance(position, tuple):
-            position = Point(position[0], position[1])
-        elif not isinstance(position, Point):
-            raise ValidationError(f"Position must be Point or tuple, got {type(position)}")
-
-        if size <= 0:
-            raise ValidationError(f"Text size must be positive, got {size}")
+        position = self.validate_text(text, position, size)
 
         # Validate color if provided
         if color is not None:
@@ -323,6 +314,35 @@ class TextCollection(BaseCollection[TextElement]):
         logger.debug(f"Added text: {text_element}")
         return text_element
 
+    @staticmethod
+    def validate_text(text: str, position: Union[Point, Tuple[float, float]], size: float) -> Point:
+        """
+        Validate text content, position and size as add() does.
+
+        Args:
+            text: Text content
+            position: Text position
+            size: Text size
+
+        Returns:
+            The position as a Point
+
+        Raises:
+            ValidationError: If text data is invalid
+        """
+        if not isinstance(text, str) or not text.strip():
+            raise ValidationError("Text content cannot be empty")
+
+        if isinstance(position, tuple):
+            position = Point(position[0], position[1])
+        elif not isinstance(position, Point):
+            raise ValidationError(f"Position must be Point or tuple, got {type(position)}")
+
+        if size <= 0:
+            raise ValidationError(f"Text size must be positive, got {size}")
+
+        return position
+
     def remove(self, text_uuid: str) -> bool:
         """
         Remove text by UUID.
@@ -5,13 +5,14 @@ This module defines the fundamental data structures used throughout kicad-sch-ap
 providing a clean, type-safe interface for working with schematic elements.
 """
 
-from dataclasses import dataclass, field
+import math
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Point:
     """2D point with x,y coordinates in mm."""
 
@@ -19,13 +20,16 @@ class Point:
     y: float
 
     def __post_init__(self) -> None:
-        # Ensure coordinates are float
-        object.__setattr__(self, "x", float(self.x))
-        object.__setattr__(self, "y", float(self.y))
+        # Ensure coordinates are float; parsed and computed coordinates usually
+        # already are, and skipping the frozen-field write then saves about a third
+        if type(self.x) is not float:
+            object.__setattr__(self, "x", float(self.x))
+        if type(self.y) is not float:
+            object.__setattr__(self, "y", float(self.y))
 
     def distance_to(self, other: "Point") -> float:
         """Calculate distance to another point."""
-        return float(((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5)
+        return math.hypot(self.x - other.x, self.y - other.y)
 
     def offset(self, dx: float, dy: float) -> "Point":
         """Create new point offset by dx, dy."""
@@ -203,7 +207,7 @@ class PinInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SchematicSymbol:
     """Component symbol in a schematic."""
 
@@ -231,6 +235,10 @@ class SchematicSymbol:
         if not self.uuid:
             self.uuid = str(uuid4())
 
+    def field_values(self) -> Dict[str, Any]:
+        """Shallow field name -> value dict (slotted, so there is no __dict__)."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
     @property
     def library(self) -> str:
         """Extract library name from lib_id."""
@@ -524,10 +532,8 @@ class Wire:
     @property
     def length(self) -> float:
         """Total wire length (sum of all segments)."""
-        total = 0.0
-        for i in range(len(self.points) - 1):
-            total += self.points[i].distance_to(self.points[i + 1])
-        return total
+        points = self.points
+        return sum(math.hypot(b.x - a.x, b.y - a.y) for a, b in zip(points, points[1:]))
 
     def is_simple(self) -> bool:
         """Check if wire is a simple 2-point wire."""
@@ -116,27 +116,17 @@ def _calculate_corner_point(
     Returns:
         Corner point position
     """
-    if corner_direction == CornerDirection.HORIZONTAL_FIRST:
-        # Route horizontally first, then vertically
+    if corner_direction is CornerDirection.AUTO:
+        # Heuristic: prefer horizontal first if horizontal distance >= vertical distance
+        horizontal_first = abs(to_pos.x - from_pos.x) >= abs(to_pos.y - from_pos.y)
+    else:
+        horizontal_first = corner_direction is CornerDirection.HORIZONTAL_FIRST
+
+    if horizontal_first:
         # Corner is at destination X, source Y
         return Point(to_pos.x, from_pos.y)
-
-    elif corner_direction == CornerDirection.VERTICAL_FIRST:
-        # Route vertically first, then horizontally
-        # Corner is at source X, destination Y
-        return Point(from_pos.x, to_pos.y)
-
-    else:  # AUTO
-        # Heuristic: prefer horizontal first if horizontal distance >= vertical distance
-        dx = abs(to_pos.x - from_pos.x)
-        dy = abs(to_pos.y - from_pos.y)
-
-        if dx >= dy:
-            # Horizontal distance is greater - route horizontally first
-            return Point(to_pos.x, from_pos.y)
-        else:
-            # Vertical distance is greater - route vertically first
-            return Point(from_pos.x, to_pos.y)
+    # Corner is at source X, destination Y
+    return Point(from_pos.x, to_pos.y)
 
 
 def validate_routing_result(result: RoutingResult) -> bool:
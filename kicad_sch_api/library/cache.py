@@ -12,6 +12,7 @@ import logging
 import os
 import platform
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
@@ -344,6 +345,9 @@ class SymbolLibraryCache:
     - Cache invalidation based on file modification time
     """
 
+    # Parsed library files kept in memory at once (see _get_library_symbols)
+    _PARSED_LIBRARY_CACHE_SIZE = 4
+
     def __init__(self, cache_dir: Optional[Path] = None, enable_persistence: bool = True):
         """
         Initialize the symbol cache.
@@ -367,6 +371,10 @@ class SymbolLibraryCache:
         self._library_index: Dict[str, Path] = {}  # library_name -> path
         self._lib_stats: Dict[str, LibraryStats] = {}
 
+        # Top-level symbols of recently parsed library files, keyed by (path, mtime).
+        # Loading several symbols from one library then parses the file only once.
+        self._parsed_libraries: "OrderedDict[Tuple[Path, int], Dict[str, List]]" = OrderedDict()
+
         # Performance tracking
         self._cache_hits = 0
         self._cache_misses = 0
@@ -631,6 +639,7 @@ class SymbolLibraryCache:
         """Clear all cached symbol data."""
         self._symbols.clear()
         self._symbol_index.clear()
+        self._parsed_libraries.clear()
         self._cache_hits = 0
         self._cache_misses = 0
         self._total_load_time = 0.0
@@ -710,15 +719,8 @@ class SymbolLibraryCache:
             # Extract symbol name from lib_id
             library_name, symbol_name = lib_id.split(":", 1)
 
-            with open(library_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Parse the S-expression with symbol preservation
-            parsed = sexpdata.loads(content, true=None, false=None, nil=None)
-            logger.debug(f"🔧 PARSE: Parsed library file with {len(parsed)} top-level items")
-
             # Find the symbol we're looking for
-            symbol_data = self._find_symbol_in_parsed_data(parsed, symbol_name)
+            symbol_data = self._get_library_symbols(library_path).get(symbol_name)
             if not symbol_data:
                 logger.debug(f"🔧 PARSE: Symbol {symbol_name} not found in {library_path}")
                 return None
@@ -798,6 +800,38 @@ class SymbolLibraryCache:
             logger.error(f"Error parsing {library_path}: {e}")
             return None
 
+    def _get_library_symbols(self, library_path: Path) -> Dict[str, List]:
+        """
+        Get the top-level symbols of a library file by name, parsing it at most once.
+
+        Entries are keyed by (path, mtime), so an edited library is parsed again. Only
+        the most recently used _PARSED_LIBRARY_CACHE_SIZE libraries are kept in memory.
+        """
+        key = (library_path, library_path.stat().st_mtime_ns)
+        symbols = self._parsed_libraries.get(key)
+        if symbols is not None:
+            self._parsed_libraries.move_to_end(key)
+            return symbols
+
+        with open(library_path, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        # Parse the S-expression with symbol preservation
+        parsed = sexpdata.loads(content, true=None, false=None, nil=None)
+        logger.debug(f"🔧 PARSE: Parsed library file with {len(parsed)} top-level items")
+
+        symbols = {}
+        symbol_keyword = sexpdata.Symbol("symbol")
+        for item in parsed:
+            if isinstance(item, list) and len(item) >= 2 and item[0] == symbol_keyword:
+                # First definition wins, as in _find_symbol_in_parsed_data()
+                symbols.setdefault(str(item[1]).strip('"'), item)
+
+        self._parsed_libraries[key] = symbols
+        if len(self._parsed_libraries) > self._PARSED_LIBRARY_CACHE_SIZE:
+            self._parsed_libraries.popitem(last=False)
+        return symbols
+
     def _find_symbol_in_parsed_data(self, parsed_data: List, symbol_name: str) -> Optional[List]:
         """Find a specific symbol in parsed KiCAD library data."""
         logger.debug(f"🔧 FIND: Looking for symbol '{symbol_name}' in parsed data")
@@ -852,11 +886,7 @@ class SymbolLibraryCache:
 
         try:
             # Load the parent symbol from the same library
-            with open(library_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            parsed = sexpdata.loads(content, true=None, false=None, nil=None)
-            parent_symbol_data = self._find_symbol_in_parsed_data(parsed, parent_name)
+            parent_symbol_data = self._get_library_symbols(library_path).get(parent_name)
 
             if not parent_symbol_data:
                 logger.warning(f"🔧 RESOLVE: Parent symbol {parent_name} not found in library")
@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Optional
 import sexpdata
 
 from ...core.parsing_utils import parse_bool_property
-from ...core.types import Point
+from ...core.types import Point, SymbolInstance
 from ..base import BaseElementParser
 
 logger = logging.getLogger(__name__)
@@ -46,49 +46,58 @@ class SymbolParser(BaseElementParser):
                 "instances": [],
             }
 
+            properties = symbol_data["properties"]
+
             for sub_item in item[1:]:
-                if not isinstance(sub_item, list) or len(sub_item) == 0:
+                if not isinstance(sub_item, list) or not sub_item:
                     continue
 
-                element_type = (
-                    str(sub_item[0]) if isinstance(sub_item[0], sexpdata.Symbol) else None
-                )
+                head = sub_item[0]
+                element_type = str(head) if isinstance(head, sexpdata.Symbol) else None
 
-                if element_type == "lib_id":
-                    symbol_data["lib_id"] = sub_item[1] if len(sub_item) > 1 else None
-                elif element_type == "at":
-                    if len(sub_item) >= 3:
-                        symbol_data["position"] = Point(float(sub_item[1]), float(sub_item[2]))
-                        if len(sub_item) > 3:
-                            symbol_data["rotation"] = float(sub_item[3])
-                elif element_type == "uuid":
-                    symbol_data["uuid"] = sub_item[1] if len(sub_item) > 1 else None
-                elif element_type == "unit":
-                    # Parse unit number for multi-unit components
-                    symbol_data["unit"] = int(sub_item[1]) if len(sub_item) > 1 else 1
-                elif element_type == "property":
+                # Properties and pins repeat within every symbol, so test them first
+                if element_type == "property":
                     prop_data = self._parse_property(sub_item)
                     if prop_data:
-                        prop_name = prop_data.get("name")
+                        prop_name = prop_data["name"]
 
                         # Store original S-expression for format preservation
-                        sexp_key = f"__sexp_{prop_name}"
-                        symbol_data["properties"][sexp_key] = sub_item
+                        properties[f"__sexp_{prop_name}"] = sub_item
 
                         # Store parsed property dict for easy access (used by tests and API)
-                        symbol_data["properties"][prop_name] = prop_data
+                        properties[prop_name] = prop_data
 
                         # Check if property is hidden
-                        if prop_data.get("hidden", False):
+                        if prop_data["hidden"]:
                             symbol_data["hidden_properties"].add(prop_name)
 
                         # Also extract standard properties to dedicated fields for backward compatibility
                         if prop_name == "Reference":
-                            symbol_data["reference"] = prop_data.get("value")
+                            symbol_data["reference"] = prop_data["value"]
                         elif prop_name == "Value":
-                            symbol_data["value"] = prop_data.get("value")
+                            symbol_data["value"] = prop_data["value"]
                         elif prop_name == "Footprint":
-                            symbol_data["footprint"] = prop_data.get("value")
+                            symbol_data["footprint"] = prop_data["value"]
+                elif element_type == "pin":
+                    # Parse pin UUID: (pin "1" (uuid "..."))
+                    pin_data = self._parse_pin_uuid(sub_item)
+                    if pin_data:
+                        pin_number = pin_data.get("number")
+                        pin_uuid = pin_data.get("uuid")
+                        if pin_number and pin_uuid:
+                            symbol_data["pin_uuids"][pin_number] = pin_uuid
+                elif element_type == "lib_id":
+                    symbol_data["lib_id"] = sub_item[1] if len(sub_item) > 1 else None
+                elif element_type == "at":
+                    if len(sub_item) >= 3:
+                        symbol_data["position"] = Point(float(sub_item[1]), float(sub_item[2]))
+                        if len(sub_item) > 3:
+                            symbol_data["rotation"] = float(sub_item[3])
+                elif element_type == "uuid":
+                    symbol_data["uuid"] = sub_item[1] if len(sub_item) > 1 else None
+                elif element_type == "unit":
+                    # Parse unit number for multi-unit components
+                    symbol_data["unit"] = int(sub_item[1]) if len(sub_item) > 1 else 1
                 elif element_type == "in_bom":
                     symbol_data["in_bom"] = parse_bool_property(
                         sub_item[1] if len(sub_item) > 1 else None, default=True
@@ -106,14 +115,6 @@ class SymbolParser(BaseElementParser):
                     instances = self._parse_instances(sub_item)
                     if instances:
                         symbol_data["instances"] = instances
-                elif element_type == "pin":
-                    # Parse pin UUID: (pin "1" (uuid "..."))
-                    pin_data = self._parse_pin_uuid(sub_item)
-                    if pin_data:
-                        pin_number = pin_data.get("number")
-                        pin_uuid = pin_data.get("uuid")
-                        if pin_number and pin_uuid:
-                            symbol_data["pin_uuids"][pin_number] = pin_uuid
 
             return symbol_data
 
@@ -187,8 +188,8 @@ class SymbolParser(BaseElementParser):
             return None
 
         # Extract name and value
-        prop_name = item[1] if len(item) > 1 else None
-        prop_value = item[2] if len(item) > 2 else None
+        prop_name = item[1]
+        prop_value = item[2]
 
         # Initialize parsed data
         position = None
@@ -198,10 +199,11 @@ class SymbolParser(BaseElementParser):
 
         # Parse sub-elements (at, effects, etc.)
         for sub_item in item[3:]:
-            if not isinstance(sub_item, list) or len(sub_item) == 0:
+            if not isinstance(sub_item, list) or not sub_item:
                 continue
 
-            element_type = str(sub_item[0]) if isinstance(sub_item[0], sexpdata.Symbol) else None
+            head = sub_item[0]
+            element_type = str(head) if isinstance(head, sexpdata.Symbol) else None
 
             if element_type == "at":
                 # Parse position: (at x y rotation)
@@ -214,18 +216,24 @@ class SymbolParser(BaseElementParser):
             elif element_type == "effects":
                 # Parse effects section
                 for effect_item in sub_item[1:]:
-                    if not isinstance(effect_item, list) or len(effect_item) == 0:
+                    if not isinstance(effect_item, list) or not effect_item:
                         continue
 
+                    effect_head = effect_item[0]
                     effect_type = (
-                        str(effect_item[0]) if isinstance(effect_item[0], sexpdata.Symbol) else None
+                        str(effect_head) if isinstance(effect_head, sexpdata.Symbol) else None
                     )
 
-                    if effect_type == "hide":
+                    # Every property has a font; hide and justify are optional
+                    if effect_type == "font":
+                        # Store font info if needed
+                        effects_dict["font"] = effect_item
+
+                    elif effect_type == "hide":
                         # Check if value is "yes"
                         if len(effect_item) > 1:
                             hide_value = str(effect_item[1])
-                            is_hidden = hide_value.lower() in ["yes", "true"]
+                            is_hidden = hide_value.lower() in ("yes", "true")
                         else:
                             # Just (hide) with no value defaults to yes
                             is_hidden = True
@@ -237,10 +245,6 @@ class SymbolParser(BaseElementParser):
                             justify = str(effect_item[1])
                             effects_dict["justify"] = justify
 
-                    elif effect_type == "font":
-                        # Store font info if needed
-                        effects_dict["font"] = effect_item
-
         result = {
             "name": prop_name,
             "value": prop_value,
@@ -266,8 +270,6 @@ class SymbolParser(BaseElementParser):
                     (reference "R1")
                     (unit 1))))
         """
-        from ...core.types import SymbolInstance
-
         instances = []
 
         for sub_item in item[1:]:
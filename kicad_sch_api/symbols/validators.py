@@ -6,10 +6,11 @@ and symbol data integrity.
 """
 
 import logging
+from collections import Counter
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ..library.cache import SymbolDefinition
-from ..utils.validation import ValidationError, ValidationIssue
+from ..utils.validation import ValidationError, ValidationIssue, ValidationLevel
 from .cache import ISymbolCache
 
 logger = logging.getLogger(__name__)
@@ -489,16 +490,16 @@ class SymbolValidator:
         Returns:
             Summary dictionary with issue counts and severity
         """
+        level_counts = Counter(issue.level for issue in issues)
+        error_count = level_counts[ValidationLevel.ERROR]
+        warning_count = level_counts[ValidationLevel.WARNING]
+
         summary = {
             "total_issues": len(issues),
-            "error_count": len([i for i in issues if i.level.value == "error"]),
-            "warning_count": len([i for i in issues if i.level.value == "warning"]),
-            "info_count": len([i for i in issues if i.level.value == "info"]),
-            "severity": (
-                "error"
-                if any(i.level.value == "error" for i in issues)
-                else "warning" if any(i.level.value == "warning" for i in issues) else "info"
-            ),
+            "error_count": error_count,
+            "warning_count": warning_count,
+            "info_count": level_counts[ValidationLevel.INFO],
+            "severity": "error" if error_count else "warning" if warning_count else "info",
         }
 
         return summary
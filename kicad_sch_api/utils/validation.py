@@ -16,6 +16,13 @@ from ..core.exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import time; every components.add() call validates through these
+_REFERENCE_RX = re.compile(r"^(#[A-Z]+[0-9]+|[A-Z]+[0-9]*[A-Z]?|[A-Z]+\?)$")
+_LIB_ID_RX = re.compile(r"^[^:]+:[^:]+$")
+_UUID_RX = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+
 # Export list for public API
 __all__ = [
     "ValidationError",
@@ -81,8 +88,8 @@ class SchematicValidator:
         """
         self.strict = strict
         self.issues = []
-        self._valid_reference_pattern = re.compile(r"^(#[A-Z]+[0-9]+|[A-Z]+[0-9]*[A-Z]?|[A-Z]+\?)$")
-        self._valid_lib_id_pattern = re.compile(r"^[^:]+:[^:]+$")
+        self._valid_reference_pattern = _REFERENCE_RX
+        self._valid_lib_id_pattern = _LIB_ID_RX
 
     def validate_schematic_data(self, schematic_data: Dict[str, Any]) -> List[ValidationIssue]:
         """
@@ -374,10 +381,7 @@ class SchematicValidator:
 
     def _validate_uuid(self, uuid_str: str) -> bool:
         """Validate UUID format."""
-        uuid_pattern = re.compile(
-            r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
-        )
-        return bool(uuid_pattern.match(uuid_str))
+        return bool(_UUID_RX.match(uuid_str))
 
     def has_errors(self) -> bool:
         """Check if any error-level issues were found."""
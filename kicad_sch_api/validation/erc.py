@@ -79,13 +79,14 @@ class ElectricalRulesChecker:
 
         all_violations: List[ERCViolation] = []
 
-        # Run each validator
+        # Run each validator, applying configuration (severity overrides, suppression)
         for validator in self.validators:
-            violations = validator.validate()
+            violations = self._apply_config(validator.validate())
             all_violations.extend(violations)
 
-        # Apply configuration (severity overrides, suppression)
-        all_violations = self._apply_config(all_violations)
+            # A pass/fail caller has its answer once any error is found
+            if self.config.fail_fast and any(v.severity == "error" for v in violations):
+                break
 
         # Categorize by severity
         errors = [v for v in all_violations if v.severity == "error"]
@@ -146,6 +146,8 @@ class ERCConfig:
         severity_overrides: Custom severity levels for specific rules
         suppressed_warnings: Set of suppressed warning codes
         custom_rules: List of custom validation rules (not yet implemented)
+        fail_fast: Stop running validators after the first one that reports an error;
+            the result then lacks violations from the validators that did not run
     """
 
     def __init__(self) -> None:
@@ -153,6 +155,7 @@ class ERCConfig:
         self.severity_overrides: Dict[str, str] = {}
         self.suppressed_warnings: Set[str] = set()
         self.custom_rules: List[Any] = []
+        self.fail_fast = False
 
     def set_severity(self, rule: str, severity: str) -> None:
         """Override default severity for a rule.
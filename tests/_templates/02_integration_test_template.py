@@ -263,16 +263,18 @@ class TestPinConnectionWorkflow:
         """
         logger.info("Integration test: Rotation affects pin orientation")
 
+        # One scratch schematic for all rotations; each gets its own reference
+        sch = ksa.create_schematic("Rotation Test")
+
         # Test at multiple rotations
-        for rotation in [0, 90, 180, 270]:
+        for i, rotation in enumerate([0, 90, 180, 270]):
             logger.info(f"Testing rotation: {rotation}°")
 
-            sch = ksa.create_schematic(f"Rotation {rotation}")
             comp = sch.components.add(
                 lib_id="Device:R",
-                reference="R1",
+                reference=f"R{i + 1}",
                 value="10k",
-                position=(100.0, 100.0),
+                position=(100.0 + i * 25.4, 100.0),
                 rotation=rotation,
             )
 
@@ -339,12 +341,14 @@ class TestPinConnectionErrorHandling:
             ("Large Position", (1000.0, 1000.0)),
         ]
 
-        for description, position in test_cases:
+        # One scratch schematic for all positions; each gets its own reference
+        sch = ksa.create_schematic("Grid Boundary Test")
+
+        for i, (description, position) in enumerate(test_cases):
             logger.info(f"Testing: {description} at {position}")
 
-            sch = ksa.create_schematic(f"{description} Test")
             comp = sch.components.add(
-                lib_id="Device:R", reference="R1", value="10k", position=position
+                lib_id="Device:R", reference=f"R{i + 1}", value="10k", position=position
             )
 
             pin1 = comp.get_pin_position("1")
@@ -27,9 +27,9 @@ class TestSemanticPinLookupPerformance:
         """Test that find_pins_by_name is fast for single component."""
         comp = schematic.components.add("Device:R", "R1", "10k", position=(100.0, 100.0))
 
-        start = time.time()
+        start = time.perf_counter()
         pins = schematic.components.find_pins_by_name("R1", "~")
-        elapsed = (time.time() - start) * 1000  # Convert to ms
+        elapsed = (time.perf_counter() - start) * 1000  # Convert to ms
 
         assert pins is not None
         assert elapsed < 50, f"find_pins_by_name took {elapsed:.2f}ms (should be <50ms)"
@@ -38,9 +38,9 @@ class TestSemanticPinLookupPerformance:
         """Test that find_pins_by_type is fast for single component."""
         comp = schematic.components.add("Device:R", "R1", "10k", position=(100.0, 100.0))
 
-        start = time.time()
+        start = time.perf_counter()
         pins = schematic.components.find_pins_by_type("R1", "passive")
-        elapsed = (time.time() - start) * 1000  # Convert to ms
+        elapsed = (time.perf_counter() - start) * 1000  # Convert to ms
 
         assert pins is not None
         assert elapsed < 50, f"find_pins_by_type took {elapsed:.2f}ms (should be <50ms)"
@@ -54,11 +54,11 @@ class TestSemanticPinLookupPerformance:
             )
 
         # Do 50 lookups
-        start = time.time()
+        start = time.perf_counter()
         for i in range(10):
             pins = schematic.components.find_pins_by_name(f"R{i+1}", "~")
             assert pins is not None
-        elapsed = (time.time() - start) * 1000  # Convert to ms
+        elapsed = (time.perf_counter() - start) * 1000  # Convert to ms
 
         avg_time = elapsed / 10
         assert avg_time < 50, f"Average lookup took {avg_time:.2f}ms (should be <50ms)"
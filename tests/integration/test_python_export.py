@@ -5,39 +5,34 @@ These tests use real KiCad reference schematics to verify end-to-end
 export functionality.
 """
 
-import shutil
-import tempfile
 from pathlib import Path
 
 import pytest
 
 import kicad_sch_api as ksa
 
+REF_PATH = Path(
+    "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
+)
+
+# Every test here exports the same reference; checked once at collection time
+pytestmark = pytest.mark.skipif(
+    not REF_PATH.exists(), reason=f"Reference schematic not found: {REF_PATH}"
+)
+
 
 class TestPythonExportIntegration:
     """Integration tests for schematic to Python export."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for test outputs."""
-        temp = tempfile.mkdtemp()
-        yield Path(temp)
-        shutil.rmtree(temp)
-
-    def test_export_simple_schematic(self, temp_dir):
+    def test_export_simple_schematic(self, tmp_path):
         """Test exporting a simple rotated resistor schematic."""
         # Load reference schematic
-        ref_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
-
-        if not ref_path.exists():
-            pytest.skip(f"Reference schematic not found: {ref_path}")
+        ref_path = REF_PATH
 
         sch = ksa.Schematic.load(ref_path)
 
         # Export to Python
-        output_path = temp_dir / "exported.py"
+        output_path = tmp_path / "exported.py"
         result = sch.export_to_python(output_path, format_code=False)
 
         # Verify file was created
@@ -55,16 +50,11 @@ class TestPythonExportIntegration:
         assert "return sch" in code
         assert "if __name__ ==" in code
 
-    def test_export_with_utility_function(self, temp_dir):
+    def test_export_with_utility_function(self, tmp_path):
         """Test export using the schematic_to_python utility function."""
-        ref_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
+        ref_path = REF_PATH
 
-        if not ref_path.exists():
-            pytest.skip(f"Reference schematic not found: {ref_path}")
-
-        output_path = temp_dir / "utility_exported.py"
+        output_path = tmp_path / "utility_exported.py"
 
         # Use utility function
         result = ksa.schematic_to_python(str(ref_path), str(output_path))
@@ -76,17 +66,12 @@ class TestPythonExportIntegration:
         code = output_path.read_text()
         compile(code, str(output_path), "exec")
 
-    def test_generated_code_is_executable(self, temp_dir):
+    def test_generated_code_is_executable(self, tmp_path):
         """Test that generated Python code can be executed."""
-        ref_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
-
-        if not ref_path.exists():
-            pytest.skip(f"Reference schematic not found: {ref_path}")
+        ref_path = REF_PATH
 
         # Export
-        output_path = temp_dir / "executable_test.py"
+        output_path = tmp_path / "executable_test.py"
         ksa.schematic_to_python(str(ref_path), str(output_path), format_code=False)
 
         # Try to execute the generated code
@@ -99,17 +84,12 @@ class TestPythonExportIntegration:
         except Exception as e:
             pytest.fail(f"Generated code failed to execute: {e}")
 
-    def test_export_with_components(self, temp_dir):
+    def test_export_with_components(self, tmp_path):
         """Test export of schematic with components."""
-        ref_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
-
-        if not ref_path.exists():
-            pytest.skip(f"Reference schematic not found: {ref_path}")
+        ref_path = REF_PATH
 
         sch = ksa.Schematic.load(ref_path)
-        output_path = temp_dir / "with_components.py"
+        output_path = tmp_path / "with_components.py"
 
         # Export
         sch.export_to_python(output_path, format_code=False)
@@ -120,17 +100,12 @@ class TestPythonExportIntegration:
         # Should have component addition code
         assert ".components.add(" in code or "components.add(" in code
 
-    def test_export_minimal_template(self, temp_dir):
+    def test_export_minimal_template(self, tmp_path):
         """Test export using minimal template."""
-        ref_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
-
-        if not ref_path.exists():
-            pytest.skip(f"Reference schematic not found: {ref_path}")
+        ref_path = REF_PATH
 
         sch = ksa.Schematic.load(ref_path)
-        output_path = temp_dir / "minimal.py"
+        output_path = tmp_path / "minimal.py"
 
         # Export with minimal template
         sch.export_to_python(output_path, template="minimal", format_code=False)
@@ -141,36 +116,26 @@ class TestPythonExportIntegration:
         code = output_path.read_text()
         compile(code, str(output_path), "exec")
 
-    def test_export_without_formatting(self, temp_dir):
+    def test_export_without_formatting(self, tmp_path):
         """Test export with formatting disabled."""
-        ref_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
-
-        if not ref_path.exists():
-            pytest.skip(f"Reference schematic not found: {ref_path}")
+        ref_path = REF_PATH
 
         sch = ksa.Schematic.load(ref_path)
-        output_path = temp_dir / "unformatted.py"
+        output_path = tmp_path / "unformatted.py"
 
         # Export without formatting
         sch.export_to_python(output_path, format_code=False)
 
         assert output_path.exists()
 
-    def test_export_preserves_component_properties(self, temp_dir):
+    def test_export_preserves_component_properties(self, tmp_path):
         """Test that component properties are preserved in export."""
-        ref_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
-
-        if not ref_path.exists():
-            pytest.skip(f"Reference schematic not found: {ref_path}")
+        ref_path = REF_PATH
 
         # Load schematic and check what properties exist
         sch = ksa.Schematic.load(ref_path)
 
-        output_path = temp_dir / "with_props.py"
+        output_path = tmp_path / "with_props.py"
         sch.export_to_python(output_path, format_code=False)
 
         code = output_path.read_text()
@@ -178,17 +143,12 @@ class TestPythonExportIntegration:
         # Should have position information
         assert "position=" in code
 
-    def test_export_file_permissions(self, temp_dir):
+    def test_export_file_permissions(self, tmp_path):
         """Test that exported file has executable permissions on Unix."""
-        ref_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
-
-        if not ref_path.exists():
-            pytest.skip(f"Reference schematic not found: {ref_path}")
+        ref_path = REF_PATH
 
         sch = ksa.Schematic.load(ref_path)
-        output_path = temp_dir / "executable.py"
+        output_path = tmp_path / "executable.py"
 
         sch.export_to_python(output_path)
 
@@ -209,25 +169,13 @@ class TestPythonExportIntegration:
 class TestCLIIntegration:
     """Integration tests for kicad-to-python CLI command."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for test outputs."""
-        temp = tempfile.mkdtemp()
-        yield Path(temp)
-        shutil.rmtree(temp)
-
-    def test_cli_basic_usage(self, temp_dir):
+    def test_cli_basic_usage(self, tmp_path):
         """Test basic CLI usage."""
         from kicad_sch_api.cli.kicad_to_python import main
 
-        ref_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
+        ref_path = REF_PATH
 
-        if not ref_path.exists():
-            pytest.skip(f"Reference schematic not found: {ref_path}")
-
-        output_path = temp_dir / "cli_output.py"
+        output_path = tmp_path / "cli_output.py"
 
         # Call CLI main function
         args = [str(ref_path), str(output_path)]
@@ -243,18 +191,13 @@ class TestCLIIntegration:
         code = output_path.read_text()
         compile(code, str(output_path), "exec")
 
-    def test_cli_with_verbose_flag(self, temp_dir):
+    def test_cli_with_verbose_flag(self, tmp_path):
         """Test CLI with verbose flag."""
         from kicad_sch_api.cli.kicad_to_python import main
 
-        ref_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
-
-        if not ref_path.exists():
-            pytest.skip(f"Reference schematic not found: {ref_path}")
+        ref_path = REF_PATH
 
-        output_path = temp_dir / "verbose_output.py"
+        output_path = tmp_path / "verbose_output.py"
 
         # Call with verbose flag
         args = [str(ref_path), str(output_path), "--verbose"]
@@ -263,11 +206,11 @@ class TestCLIIntegration:
         assert exit_code == 0
         assert output_path.exists()
 
-    def test_cli_with_invalid_input(self, temp_dir):
+    def test_cli_with_invalid_input(self, tmp_path):
         """Test CLI with invalid input file."""
         from kicad_sch_api.cli.kicad_to_python import main
 
-        output_path = temp_dir / "output.py"
+        output_path = tmp_path / "output.py"
 
         # Call with non-existent file
         args = ["/nonexistent/file.kicad_sch", str(output_path)]
@@ -276,18 +219,13 @@ class TestCLIIntegration:
         # Should fail
         assert exit_code != 0
 
-    def test_cli_template_selection(self, temp_dir):
+    def test_cli_template_selection(self, tmp_path):
         """Test CLI with template selection."""
         from kicad_sch_api.cli.kicad_to_python import main
 
-        ref_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
-
-        if not ref_path.exists():
-            pytest.skip(f"Reference schematic not found: {ref_path}")
+        ref_path = REF_PATH
 
-        output_path = temp_dir / "template_output.py"
+        output_path = tmp_path / "template_output.py"
 
         # Call with minimal template
         args = [str(ref_path), str(output_path), "--template", "minimal"]
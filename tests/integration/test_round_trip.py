@@ -12,72 +12,94 @@ These tests verify the complete workflow:
 This is the gold standard test for the export feature.
 """
 
-import shutil
-import tempfile
 from pathlib import Path
 
 import pytest
 
 import kicad_sch_api as ksa
 
+ORIGINAL_PATH = Path(
+    "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
+)
+
+# Every test here round-trips the same reference; checked once at collection time
+pytestmark = pytest.mark.skipif(
+    not ORIGINAL_PATH.exists(), reason=f"Reference schematic not found: {ORIGINAL_PATH}"
+)
+
+
+def _run_generated_code(python_file: Path) -> "ksa.Schematic":
+    """Execute exported Python code and return the schematic its create_* function builds."""
+    code = python_file.read_text()
+    exec_globals = {}
+    exec(compile(code, str(python_file), "exec"), exec_globals)
+
+    create_func = next(
+        (obj for name, obj in exec_globals.items() if callable(obj) and name.startswith("create_")),
+        None,
+    )
+    assert create_func is not None, "No create_* function found"
+
+    return create_func()
+
+
+def _component_signature(sch: "ksa.Schematic") -> frozenset:
+    """Canonical (reference, lib_id, value) set for comparing components in one step."""
+    return frozenset((comp.reference, comp.lib_id, comp.value) for comp in sch.components)
+
+
+def _wire_signature(sch: "ksa.Schematic") -> tuple:
+    """Ordered (start.x, start.y, end.x, end.y) endpoints of every wire."""
+    return tuple((wire.start.x, wire.start.y, wire.end.x, wire.end.y) for wire in sch.wires)
+
 
 class TestRoundTrip:
     """Round-trip tests: KiCad → Python → KiCad"""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for test outputs."""
-        temp = tempfile.mkdtemp()
-        yield Path(temp)
-        shutil.rmtree(temp)
+    @pytest.fixture(scope="class")
+    def exported(self, tmp_path_factory):
+        """
+        Export the reference once via schematic_to_python and regenerate it.
+
+        Shared by the assertion tests below so the load/export/exec pipeline
+        runs once per class rather than once per test.
 
-    def test_round_trip_rotated_resistor(self, temp_dir):
+        Returns:
+            (original_sch, python_file, regenerated_sch)
+        """
+        original_sch = ksa.Schematic.load(ORIGINAL_PATH)
+
+        python_file = tmp_path_factory.mktemp("round_trip") / "exported.py"
+        ksa.schematic_to_python(str(ORIGINAL_PATH), str(python_file))
+
+        return original_sch, python_file, _run_generated_code(python_file)
+
+    def test_round_trip_rotated_resistor(self, tmp_path):
         """
         Test complete round-trip with rotated resistor schematic.
 
         This is the definitive test that proves the feature works.
         """
         # Step 1: Load original schematic
-        original_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
-
-        if not original_path.exists():
-            pytest.skip(f"Reference schematic not found: {original_path}")
-
-        original_sch = ksa.Schematic.load(original_path)
+        original_sch = ksa.Schematic.load(ORIGINAL_PATH)
         original_components = list(original_sch.components)
         original_wires = list(original_sch.wires)
         original_labels = list(original_sch.labels)
 
         # Step 2: Export to Python
-        python_file = temp_dir / "exported.py"
+        python_file = tmp_path / "exported.py"
         original_sch.export_to_python(python_file, format_code=False)
 
         assert python_file.exists()
 
-        # Step 3: Execute generated Python code
-        code = python_file.read_text()
-        exec_globals = {}
-        exec(compile(code, str(python_file), "exec"), exec_globals)
-
-        # Find the create function
-        create_func = None
-        for name, obj in exec_globals.items():
-            if callable(obj) and name.startswith("create_"):
-                create_func = obj
-                break
-
-        assert create_func is not None, "No create_* function found"
-
-        # Step 4: Create schematic from generated code
-        regenerated_sch = create_func()
+        # Step 3-4: Execute generated Python code and create schematic
+        regenerated_sch = _run_generated_code(python_file)
         regenerated_components = list(regenerated_sch.components)
         regenerated_wires = list(regenerated_sch.wires)
         regenerated_labels = list(regenerated_sch.labels)
 
         # Step 5: Save regenerated schematic
-        regenerated_path = temp_dir / "regenerated.kicad_sch"
+        regenerated_path = tmp_path / "regenerated.kicad_sch"
         regenerated_sch.save(regenerated_path)
 
         assert regenerated_path.exists()
@@ -102,107 +124,32 @@ class TestRoundTrip:
         ), f"Label count mismatch: {len(original_labels)} → {len(reloaded_labels)}"
 
         # Step 8: Compare component details
-        for orig_comp, regen_comp in zip(original_components, reloaded_components):
-            assert (
-                orig_comp.reference == regen_comp.reference
-            ), f"Reference mismatch: {orig_comp.reference} → {regen_comp.reference}"
-
-            assert (
-                orig_comp.value == regen_comp.value
-            ), f"Value mismatch: {orig_comp.value} → {regen_comp.value}"
-
-            assert (
-                orig_comp.lib_id == regen_comp.lib_id
-            ), f"Lib ID mismatch: {orig_comp.lib_id} → {regen_comp.lib_id}"
+        original_signature = _component_signature(original_sch)
+        reloaded_signature = _component_signature(reloaded_sch)
+        assert original_signature == reloaded_signature, (
+            f"Component mismatch: missing {sorted(original_signature - reloaded_signature)}, "
+            f"unexpected {sorted(reloaded_signature - original_signature)}"
+        )
 
         # Step 9: Compare wire positions
-        for orig_wire, regen_wire in zip(original_wires, reloaded_wires):
-            assert (
-                orig_wire.start.x == regen_wire.start.x
-            ), f"Wire start X mismatch: {orig_wire.start.x} → {regen_wire.start.x}"
+        original_wire_signature = _wire_signature(original_sch)
+        reloaded_wire_signature = _wire_signature(reloaded_sch)
+        assert (
+            original_wire_signature == reloaded_wire_signature
+        ), f"Wire position mismatch: {original_wire_signature} → {reloaded_wire_signature}"
 
-            assert (
-                orig_wire.start.y == regen_wire.start.y
-            ), f"Wire start Y mismatch: {orig_wire.start.y} → {regen_wire.start.y}"
-
-            assert (
-                orig_wire.end.x == regen_wire.end.x
-            ), f"Wire end X mismatch: {orig_wire.end.x} → {regen_wire.end.x}"
-
-            assert (
-                orig_wire.end.y == regen_wire.end.y
-            ), f"Wire end Y mismatch: {orig_wire.end.y} → {regen_wire.end.y}"
-
-    def test_round_trip_with_utility_function(self, temp_dir):
+    def test_round_trip_with_utility_function(self, exported):
         """Test round-trip using the utility function."""
-        original_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
-
-        if not original_path.exists():
-            pytest.skip(f"Reference schematic not found: {original_path}")
-
-        # Load original
-        original_sch = ksa.Schematic.load(original_path)
-        original_comp_count = len(list(original_sch.components))
-
-        # Export using utility function
-        python_file = temp_dir / "utility_export.py"
-        ksa.schematic_to_python(str(original_path), str(python_file))
-
-        # Execute
-        code = python_file.read_text()
-        exec_globals = {}
-        exec(compile(code, str(python_file), "exec"), exec_globals)
-
-        # Find and call create function
-        create_func = next(
-            (
-                obj
-                for name, obj in exec_globals.items()
-                if callable(obj) and name.startswith("create_")
-            ),
-            None,
-        )
-
-        assert create_func is not None
+        original_sch, _, regenerated_sch = exported
 
-        # Create and verify
-        regenerated_sch = create_func()
-        regenerated_comp_count = len(list(regenerated_sch.components))
+        assert len(original_sch.components) == len(regenerated_sch.components)
 
-        assert original_comp_count == regenerated_comp_count
-
-    def test_round_trip_preserves_wire_connectivity(self, temp_dir):
+    def test_round_trip_preserves_wire_connectivity(self, exported, tmp_path):
         """Test that wire connectivity is preserved through round-trip."""
-        original_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
-
-        if not original_path.exists():
-            pytest.skip(f"Reference schematic not found: {original_path}")
-
-        # Export and execute
-        python_file = temp_dir / "wire_test.py"
-        ksa.schematic_to_python(str(original_path), str(python_file))
-
-        code = python_file.read_text()
-        exec_globals = {}
-        exec(compile(code, str(python_file), "exec"), exec_globals)
-
-        create_func = next(
-            (
-                obj
-                for name, obj in exec_globals.items()
-                if callable(obj) and name.startswith("create_")
-            ),
-            None,
-        )
-
-        regenerated_sch = create_func()
+        _, _, regenerated_sch = exported
 
         # Save and reload
-        output_path = temp_dir / "wire_output.kicad_sch"
+        output_path = tmp_path / "wire_output.kicad_sch"
         regenerated_sch.save(output_path)
         reloaded_sch = ksa.Schematic.load(output_path)
 
@@ -216,56 +163,18 @@ class TestRoundTrip:
                 wire.start.x == 0 and wire.start.y == 0 and wire.end.x == 0 and wire.end.y == 0
             ), "Wire has all-zero coordinates"
 
-    def test_round_trip_generated_code_is_idempotent(self, temp_dir):
+    def test_round_trip_generated_code_is_idempotent(self, exported):
         """
         Test that running generated code multiple times produces same result.
 
         This verifies that the generated code is deterministic.
         """
-        original_path = Path(
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
-
-        if not original_path.exists():
-            pytest.skip(f"Reference schematic not found: {original_path}")
-
-        # Export once
-        python_file = temp_dir / "idempotent_test.py"
-        ksa.schematic_to_python(str(original_path), str(python_file))
-
-        code = python_file.read_text()
-
-        # Execute twice
-        exec_globals_1 = {}
-        exec(compile(code, str(python_file), "exec"), exec_globals_1)
-
-        exec_globals_2 = {}
-        exec(compile(code, str(python_file), "exec"), exec_globals_2)
-
-        # Get create functions
-        create_func_1 = next(
-            (
-                obj
-                for name, obj in exec_globals_1.items()
-                if callable(obj) and name.startswith("create_")
-            ),
-            None,
-        )
-
-        create_func_2 = next(
-            (
-                obj
-                for name, obj in exec_globals_2.items()
-                if callable(obj) and name.startswith("create_")
-            ),
-            None,
-        )
+        _, python_file, sch1 = exported
 
-        # Create schematics
-        sch1 = create_func_1()
-        sch2 = create_func_2()
+        # Execute the same exported code a second time
+        sch2 = _run_generated_code(python_file)
 
         # Compare
-        assert len(list(sch1.components)) == len(list(sch2.components))
-        assert len(list(sch1.wires)) == len(list(sch2.wires))
-        assert len(list(sch1.labels)) == len(list(sch2.labels))
+        assert len(sch1.components) == len(sch2.components)
+        assert len(sch1.wires) == len(sch2.wires)
+        assert len(sch1.labels) == len(sch2.labels)
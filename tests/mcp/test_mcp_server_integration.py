@@ -952,13 +952,13 @@ class TestMCPPerformance:
         # Do 10 lookups
         import time
 
-        start = time.time()
+        start = time.perf_counter()
 
         for i in range(10):
             result = await get_component_pins(f"R{i+1}")
             assert result.success is True
 
-        elapsed = (time.time() - start) * 1000  # Convert to ms
+        elapsed = (time.perf_counter() - start) * 1000  # Convert to ms
         avg_time = elapsed / 10
 
         # Should be fast (< 50ms average)
@@ -0,0 +1,17 @@
+"""Shared fixtures for reference schematic tests."""
+
+import pytest
+
+import kicad_sch_api as ksa
+
+
+@pytest.fixture(scope="class")
+def reference_schematic(request):
+    """
+    Load the reference schematic at the indirectly parametrized path.
+
+    Returns (path, schematic). Class scoped, so each reference is parsed on
+    first use and shared by the tests of a class that request the same path.
+    """
+    ref_path = request.param
+    return ref_path, ksa.Schematic.load(ref_path)
@@ -8,11 +8,10 @@ This framework:
 3. Reports exact format preservation and functional correctness
 """
 
-import difflib
 import os
 import subprocess
 import sys
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -21,6 +20,53 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 import pytest
 
+import kicad_sch_api as ksa
+
+try:
+    # C-accelerated drop-in replacement; only used to render failure diffs
+    import cydifflib as difflib
+except ImportError:
+    import difflib
+
+
+def _files_byte_equal(a: Path, b: Path, bufsize: int = 1 << 16) -> bool:
+    """Compare two files chunk by chunk, stopping at the first differing block."""
+    if a.stat().st_size != b.stat().st_size:
+        return False
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        while True:
+            ba = fa.read(bufsize)
+            bb = fb.read(bufsize)
+            if ba != bb:
+                return False
+            if not ba:
+                return True
+
+
+def _read_texts(*paths: Path) -> List[str]:
+    """Read files concurrently; the reads release the GIL, so cold-cache seeks overlap."""
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        return list(pool.map(lambda path: path.read_text(encoding="utf-8"), paths))
+
+
+# Mapping of test script names to reference project names
+TEST_TO_REFERENCE: Dict[str, Optional[str]] = {
+    "test_single_resistor.py": "single_resistor",
+    "test_two_resistors.py": "two_resistors",
+    "test_resistor_divider.py": "resistor_divider",
+    "test_single_wire.py": "single_wire",
+    "test_single_label.py": "single_label",
+    "test_single_label_hierarchical.py": "single_label_hierarchical",
+    "test_single_text.py": "single_text",
+    "test_single_text_box.py": "single_text_box",
+    "test_single_hierarchical_sheet.py": "single_hierarchical_sheet",
+    "test_blank_schematic.py": "blank_schematic",
+    "test_multi_component.py": None,  # No reference for this yet
+}
+
+# Reference projects under reference_kicad_projects/, one test id per project
+REFERENCE_PROJECTS = tuple(name for name in TEST_TO_REFERENCE.values() if name)
+
 
 class TestAgainstReferences:
     """Test suite that validates generated schematics against KiCAD references."""
@@ -32,110 +78,106 @@ class TestAgainstReferences:
         cls.test_dir = Path(__file__).parent  # reference_tests directory
         cls.reference_dir = Path(__file__).parent / "reference_kicad_projects"
         cls.test_scripts = list(cls.test_dir.glob("test_*.py"))
+        cls.test_to_reference = TEST_TO_REFERENCE
 
-        # Mapping of test script names to reference project names
-        cls.test_to_reference = {
-            "test_single_resistor.py": "single_resistor",
-            "test_two_resistors.py": "two_resistors",
-            "test_resistor_divider.py": "resistor_divider",
-            "test_single_wire.py": "single_wire",
-            "test_single_label.py": "single_label",
-            "test_single_label_hierarchical.py": "single_label_hierarchical",
-            "test_single_text.py": "single_text",
-            "test_single_text_box.py": "single_text_box",
-            "test_single_hierarchical_sheet.py": "single_hierarchical_sheet",
-            "test_blank_schematic.py": "blank_schematic",
-            "test_multi_component.py": None,  # No reference for this yet
-        }
-
-    def _run_test_script(self, script_path: Path) -> Tuple[bool, str, Optional[Path]]:
+    def _run_test_script(
+        self, script_path: Path, output_dir: Path
+    ) -> Tuple[bool, str, Optional[Path]]:
         """
         Run a test script and return success status, output, and generated file path.
 
         Args:
             script_path: Path to the test script
+            output_dir: Per-test directory for the modified script and its output
 
         Returns:
             (success, output, generated_file_path)
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Modify the script to output to temp directory
-            script_name = script_path.stem
-            output_file = Path(tmpdir) / f"{script_name}.kicad_sch"
-
-            # Read the script and modify the output path
-            with open(script_path, "r") as f:
-                script_content = f.read()
-
-            # Replace the save path to use temp directory
-            modified_script = script_content.replace(
-                f'"{script_name}.kicad_sch"', f'"{output_file}"'
+        # Modify the script to output to the per-test directory
+        script_name = script_path.stem
+        output_file = output_dir / f"{script_name}.kicad_sch"
+
+        # Read the script and modify the output path
+        with open(script_path, "r") as f:
+            script_content = f.read()
+
+        # Replace the save path to use the output directory
+        modified_script = script_content.replace(f'"{script_name}.kicad_sch"', f'"{output_file}"')
+
+        # Write modified script next to its output
+        temp_script = output_dir / "test_script.py"
+        with open(temp_script, "w") as f:
+            f.write(modified_script)
+
+        # Run the script
+        try:
+            result = subprocess.run(
+                [sys.executable, str(temp_script)],
+                capture_output=True,
+                text=True,
+                timeout=10,
+                cwd=str(self.project_root),
+                # Never launch the viewer the scripts open on KSA_OPEN_VIEWER
+                env={k: v for k, v in os.environ.items() if k != "KSA_OPEN_VIEWER"},
             )
 
-            # Remove the subprocess.run line that opens the file
-            lines = modified_script.split("\n")
-            filtered_lines = [line for line in lines if 'subprocess.run(["open"' not in line]
-            modified_script = "\n".join(filtered_lines)
-
-            # Write modified script to temp file
-            temp_script = Path(tmpdir) / "test_script.py"
-            with open(temp_script, "w") as f:
-                f.write(modified_script)
-
-            # Run the script
-            try:
-                result = subprocess.run(
-                    [sys.executable, str(temp_script)],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    cwd=str(self.project_root),
-                )
-
-                success = result.returncode == 0
-                output = result.stdout + result.stderr
-
-                # Check if output file was created
-                if output_file.exists():
-                    # Copy the content for comparison
-                    with open(output_file, "r") as f:
-                        generated_content = f.read()
-
-                    # Save to a temporary file that persists after tmpdir is deleted
-                    persistent_file = Path(tmpdir).parent / f"{script_name}_generated.kicad_sch"
-                    with open(persistent_file, "w") as f:
-                        f.write(generated_content)
-
-                    return success, output, persistent_file
-                else:
-                    return success, output, None
-
-            except subprocess.TimeoutExpired:
-                return False, "Test script timed out", None
-            except Exception as e:
-                return False, f"Error running script: {e}", None
-
-    def _compare_schematics(self, generated_path: Path, reference_path: Path) -> Tuple[bool, str]:
+            success = result.returncode == 0
+            output = result.stdout + result.stderr
+
+            # Check if output file was created
+            if output_file.exists():
+                return success, output, output_file
+            else:
+                return success, output, None
+
+        except subprocess.TimeoutExpired:
+            return False, "Test script timed out", None
+        except Exception as e:
+            return False, f"Error running script: {e}", None
+
+    def _compare_schematics(self, generated_path: Path, reference_path: Path) -> Tuple[str, str]:
         """
         Compare generated schematic with reference.
 
+        Each step stops as soon as it decides: byte-identical files are never
+        read whole, and the diff is only rendered when the files also differ
+        after normalization.
+
         Args:
             generated_path: Path to generated schematic
             reference_path: Path to reference schematic
 
         Returns:
-            (is_identical, diff_output)
+            (match, diff_output) where match is "identical", "equivalent"
+            (only UUIDs/generator version differ) or "different"
         """
-        with open(generated_path, "r") as f:
-            generated = f.read()
+        # Constant-memory streamed compare; files are only read whole if they differ
+        if _files_byte_equal(generated_path, reference_path):
+            return "identical", ""
 
-        with open(reference_path, "r") as f:
-            reference = f.read()
+        generated, reference = _read_texts(generated_path, reference_path)
+        if self._normalize_for_comparison(generated) == self._normalize_for_comparison(reference):
+            return "equivalent", ""
 
-        if generated == reference:
-            return True, "Files are identical"
+        return "different", self._diff_schematics(
+            generated, reference, generated_path, reference_path
+        )
 
-        # Generate diff
+    def _diff_schematics(
+        self, generated: str, reference: str, generated_path: Path, reference_path: Path
+    ) -> str:
+        """
+        Render a unified diff between reference and generated schematic content.
+
+        Args:
+            generated: Generated schematic content
+            reference: Reference schematic content
+            generated_path: Path to generated schematic (diff header)
+            reference_path: Path to reference schematic (diff header)
+
+        Returns:
+            Unified diff text
+        """
         diff = difflib.unified_diff(
             reference.splitlines(keepends=True),
             generated.splitlines(keepends=True),
@@ -144,8 +186,7 @@ class TestAgainstReferences:
             n=3,
         )
 
-        diff_output = "".join(diff)
-        return False, diff_output
+        return "".join(diff)
 
     def _normalize_for_comparison(self, content: str) -> str:
         """
@@ -171,9 +212,29 @@ class TestAgainstReferences:
 
         return "\n".join(normalized)
 
-    def test_single_resistor(self):
-        """Test single resistor generation against reference."""
-        script_path = self.test_dir / "test_single_resistor.py"
+    @pytest.mark.parametrize("project", REFERENCE_PROJECTS)
+    def test_reference_loads(self, project):
+        """Test that each reference project's schematic loads."""
+        reference_path = self.reference_dir / project / f"{project}.kicad_sch"
+
+        sch = ksa.load_schematic(str(reference_path))
+
+        assert sch is not None, f"Failed to load {reference_path.name}"
+
+    @pytest.mark.parametrize(
+        "script_name",
+        [
+            "test_single_resistor.py",
+            "test_two_resistors.py",
+            "test_blank_schematic.py",
+            "test_single_wire.py",
+            "test_single_label.py",
+            "test_single_hierarchical_sheet.py",
+        ],
+    )
+    def test_script_matches_reference(self, script_name, tmp_path):
+        """Test a reference script's generated schematic against its KiCAD reference."""
+        script_path = self.test_dir / script_name
         reference_name = self.test_to_reference[script_path.name]
 
         if not reference_name:
@@ -182,236 +243,25 @@ class TestAgainstReferences:
         reference_path = self.reference_dir / reference_name / f"{reference_name}.kicad_sch"
 
         # Run the test script
-        success, output, generated_path = self._run_test_script(script_path)
+        success, output, generated_path = self._run_test_script(script_path, tmp_path)
 
         assert success, f"Test script failed: {output}"
         assert generated_path and generated_path.exists(), "No output file generated"
 
         # Compare with reference
-        is_identical, diff = self._compare_schematics(generated_path, reference_path)
-
-        if not is_identical:
-            # Try semantic comparison (ignoring UUIDs, etc)
-            with open(generated_path, "r") as f:
-                gen_normalized = self._normalize_for_comparison(f.read())
-            with open(reference_path, "r") as f:
-                ref_normalized = self._normalize_for_comparison(f.read())
-
-            if gen_normalized == ref_normalized:
-                print(f"✅ {script_path.name}: Semantically equivalent (UUIDs differ)")
-            else:
-                print(f"❌ {script_path.name}: Files differ")
-                print("Diff output:")
-                print(diff[:2000])  # Show first 2000 chars of diff
-                pytest.fail("Generated schematic differs from reference")
-        else:
-            print(f"✅ {script_path.name}: Exact match with reference")
-
-        # Clean up
-        if generated_path and generated_path.exists():
-            generated_path.unlink()
-
-    def test_two_resistors(self):
-        """Test two resistors generation against reference."""
-        script_path = self.test_dir / "test_two_resistors.py"
-        reference_name = self.test_to_reference[script_path.name]
-
-        if not reference_name:
-            pytest.skip(f"No reference project for {script_path.name}")
-
-        reference_path = self.reference_dir / reference_name / f"{reference_name}.kicad_sch"
-
-        # Run the test script
-        success, output, generated_path = self._run_test_script(script_path)
-
-        assert success, f"Test script failed: {output}"
-        assert generated_path and generated_path.exists(), "No output file generated"
-
-        # Compare with reference
-        is_identical, diff = self._compare_schematics(generated_path, reference_path)
-
-        if not is_identical:
-            # Try semantic comparison
-            with open(generated_path, "r") as f:
-                gen_normalized = self._normalize_for_comparison(f.read())
-            with open(reference_path, "r") as f:
-                ref_normalized = self._normalize_for_comparison(f.read())
-
-            if gen_normalized == ref_normalized:
-                print(f"✅ {script_path.name}: Semantically equivalent (UUIDs differ)")
-            else:
-                print(f"❌ {script_path.name}: Files differ")
-                print("Diff output:")
-                print(diff[:2000])
-                pytest.fail("Generated schematic differs from reference")
-        else:
-            print(f"✅ {script_path.name}: Exact match with reference")
-
-        # Clean up
-        if generated_path and generated_path.exists():
-            generated_path.unlink()
-
-    def test_blank_schematic(self):
-        """Test blank schematic generation against reference."""
-        script_path = self.test_dir / "test_blank_schematic.py"
-        reference_name = self.test_to_reference[script_path.name]
-
-        if not reference_name:
-            pytest.skip(f"No reference project for {script_path.name}")
-
-        reference_path = self.reference_dir / reference_name / f"{reference_name}.kicad_sch"
-
-        # Run the test script
-        success, output, generated_path = self._run_test_script(script_path)
-
-        assert success, f"Test script failed: {output}"
-        assert generated_path and generated_path.exists(), "No output file generated"
-
-        # Compare with reference
-        is_identical, diff = self._compare_schematics(generated_path, reference_path)
-
-        if not is_identical:
-            # Try semantic comparison
-            with open(generated_path, "r") as f:
-                gen_normalized = self._normalize_for_comparison(f.read())
-            with open(reference_path, "r") as f:
-                ref_normalized = self._normalize_for_comparison(f.read())
-
-            if gen_normalized == ref_normalized:
-                print(f"✅ {script_path.name}: Semantically equivalent (UUIDs differ)")
-            else:
-                print(f"❌ {script_path.name}: Files differ")
-                print("Diff output:")
-                print(diff[:2000])
-                pytest.fail("Generated schematic differs from reference")
-        else:
-            print(f"✅ {script_path.name}: Exact match with reference")
-
-        # Clean up
-        if generated_path and generated_path.exists():
-            generated_path.unlink()
-
-    # TODO: Add more test methods for other test scripts as they're implemented
-
-    def test_single_wire(self):
-        """Test single wire generation against reference."""
-        script_path = self.test_dir / "test_single_wire.py"
-        reference_name = self.test_to_reference[script_path.name]
-
-        if not reference_name:
-            pytest.skip(f"No reference project for {script_path.name}")
-
-        reference_path = self.reference_dir / reference_name / f"{reference_name}.kicad_sch"
-
-        # Run the test script
-        success, output, generated_path = self._run_test_script(script_path)
-
-        assert success, f"Test script failed: {output}"
-        assert generated_path and generated_path.exists(), "No output file generated"
-
-        # Compare with reference
-        is_identical, diff = self._compare_schematics(generated_path, reference_path)
-
-        if not is_identical:
-            # Try semantic comparison
-            with open(generated_path, "r") as f:
-                gen_normalized = self._normalize_for_comparison(f.read())
-            with open(reference_path, "r") as f:
-                ref_normalized = self._normalize_for_comparison(f.read())
-
-            if gen_normalized == ref_normalized:
-                print(f"✅ {script_path.name}: Semantically equivalent (UUIDs differ)")
-            else:
-                print(f"❌ {script_path.name}: Files differ")
-                print("Diff output:")
-                print(diff[:2000])
-                pytest.fail("Generated schematic differs from reference")
-        else:
-            print(f"✅ {script_path.name}: Exact match with reference")
-
-        # Clean up
-        if generated_path and generated_path.exists():
-            generated_path.unlink()
-
-    def test_single_label(self):
-        """Test single label generation against reference."""
-        script_path = self.test_dir / "test_single_label.py"
-        reference_name = self.test_to_reference[script_path.name]
-
-        if not reference_name:
-            pytest.skip(f"No reference project for {script_path.name}")
-
-        reference_path = self.reference_dir / reference_name / f"{reference_name}.kicad_sch"
-
-        # Run the test script
-        success, output, generated_path = self._run_test_script(script_path)
-
-        assert success, f"Test script failed: {output}"
-        assert generated_path and generated_path.exists(), "No output file generated"
-
-        # Compare with reference
-        is_identical, diff = self._compare_schematics(generated_path, reference_path)
-
-        if not is_identical:
-            # Try semantic comparison
-            with open(generated_path, "r") as f:
-                gen_normalized = self._normalize_for_comparison(f.read())
-            with open(reference_path, "r") as f:
-                ref_normalized = self._normalize_for_comparison(f.read())
-
-            if gen_normalized == ref_normalized:
-                print(f"✅ {script_path.name}: Semantically equivalent (UUIDs differ)")
-            else:
-                print(f"❌ {script_path.name}: Files differ")
-                print("Diff output:")
-                print(diff[:2000])
-                pytest.fail("Generated schematic differs from reference")
-        else:
-            print(f"✅ {script_path.name}: Exact match with reference")
-
-        # Clean up
-        if generated_path and generated_path.exists():
-            generated_path.unlink()
-
-    def test_single_hierarchical_sheet(self):
-        """Test hierarchical sheet generation against reference."""
-        script_path = self.test_dir / "test_single_hierarchical_sheet.py"
-        reference_name = self.test_to_reference[script_path.name]
-
-        if not reference_name:
-            pytest.skip(f"No reference project for {script_path.name}")
-
-        reference_path = self.reference_dir / reference_name / f"{reference_name}.kicad_sch"
-
-        # Run the test script
-        success, output, generated_path = self._run_test_script(script_path)
-
-        assert success, f"Test script failed: {output}"
-        assert generated_path and generated_path.exists(), "No output file generated"
-
-        # Compare with reference
-        is_identical, diff = self._compare_schematics(generated_path, reference_path)
-
-        if not is_identical:
-            # Try semantic comparison
-            with open(generated_path, "r") as f:
-                gen_normalized = self._normalize_for_comparison(f.read())
-            with open(reference_path, "r") as f:
-                ref_normalized = self._normalize_for_comparison(f.read())
-
-            if gen_normalized == ref_normalized:
-                print(f"✅ {script_path.name}: Semantically equivalent (UUIDs differ)")
-            else:
-                print(f"❌ {script_path.name}: Files differ")
-                print("Diff output:")
-                print(diff[:2000])
-                pytest.fail("Generated schematic differs from reference")
+        match, diff = self._compare_schematics(generated_path, reference_path)
+
+        if match == "different":
+            print(f"❌ {script_path.name}: Files differ")
+            print("Diff output:")
+            print(diff[:2000])  # Show first 2000 chars of diff
+            pytest.fail("Generated schematic differs from reference")
+        elif match == "equivalent":
+            print(f"✅ {script_path.name}: Semantically equivalent (UUIDs differ)")
         else:
             print(f"✅ {script_path.name}: Exact match with reference")
 
-        # Clean up
-        if generated_path and generated_path.exists():
-            generated_path.unlink()
+    # TODO: Add more scripts to the parametrization as they're implemented
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test: Single extended component (Device:Filter_EMI_CommonMode extends Filter_EMI_LL)."""
 
+import os
+
 import kicad_sch_api as ksa
 
 
@@ -34,9 +36,11 @@ def main():
     sch.save("test_extends_component.kicad_sch")
     print("✅ Created extends component test")
 
-    import subprocess
+    # Open the result in KiCad only when asked; batch and CI runs skip the viewer
+    if os.environ.get("KSA_OPEN_VIEWER"):
+        import subprocess
 
-    subprocess.run(["open", "test_extends_component.kicad_sch"])
+        subprocess.run(["open", "test_extends_component.kicad_sch"], check=True)
 
 
 if __name__ == "__main__":
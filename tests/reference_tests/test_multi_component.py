@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test: Multiple components with different types."""
 
+import os
+
 import kicad_sch_api as ksa
 
 
@@ -44,9 +46,11 @@ def main():
     sch.save("test_multi_component.kicad_sch")
     print("✅ Saved multi component test")
 
-    import subprocess
+    # Open the result in KiCad only when asked; batch and CI runs skip the viewer
+    if os.environ.get("KSA_OPEN_VIEWER"):
+        import subprocess
 
-    subprocess.run(["open", "test_multi_component.kicad_sch"])
+        subprocess.run(["open", "test_multi_component.kicad_sch"], check=True)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test: 74xx:7400 extends 74xx:74LS00 - Multi-unit NAND gate (for future multi-unit work)."""
 
+import os
+
 import kicad_sch_api as ksa
 
 
@@ -26,9 +28,11 @@ def main():
     sch.save("test_multi_unit_7400.kicad_sch")
     print("✅ Created multi-unit 7400 NAND gates (all 5 units)")
 
-    import subprocess
+    # Open the result in KiCad only when asked; batch and CI runs skip the viewer
+    if os.environ.get("KSA_OPEN_VIEWER"):
+        import subprocess
 
-    subprocess.run(["open", "test_multi_unit_7400.kicad_sch"])
+        subprocess.run(["open", "test_multi_unit_7400.kicad_sch"], check=True)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,40 @@
 """Reference schematic validation for pin UUID preservation."""
 
+import hashlib
 import os
 import re
 import tempfile
 
 import pytest
+import sexpdata
 
 import kicad_sch_api as ksa
 
 
+def _canonical_digest(path: str) -> bytes:
+    """
+    Digest of a schematic's parsed S-expression tree.
+
+    One pass over the tree; sensitive to element order and atom types (1 vs 1.0,
+    Symbol vs string) but not to whitespace.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    def feed(node):
+        if isinstance(node, list):
+            digest.update(b"(")
+            for item in node:
+                feed(item)
+            digest.update(b")")
+        else:
+            digest.update(repr(node).encode("utf-8"))
+            digest.update(b"\0")
+
+    with open(path, "r", encoding="utf-8") as f:
+        feed(sexpdata.loads(f.read()))
+    return digest.digest()
+
+
 class TestPinUUIDReferenceSchematic:
     """Tests against reference schematics with pin UUIDs."""
 
@@ -19,16 +45,14 @@ class TestPinUUIDReferenceSchematic:
         "tests/reference_kicad_projects/rotated_resistor_270deg/rotated_resistor_270deg.kicad_sch",
     ]
 
-    @pytest.mark.parametrize("ref_path", REFERENCE_PATHS)
-    def test_parse_pin_uuids_from_reference(self, ref_path):
+    @pytest.mark.parametrize("reference_schematic", REFERENCE_PATHS, indirect=True)
+    def test_parse_pin_uuids_from_reference(self, reference_schematic):
         """Validates: Can parse reference schematic with pin UUIDs"""
-        sch = ksa.Schematic.load(ref_path)
+        ref_path, sch = reference_schematic
 
         # Get component
-        components = list(sch.components)
-        assert len(components) > 0, f"Reference {ref_path} should have components"
-
-        resistor = components[0]
+        resistor = next(iter(sch.components), None)
+        assert resistor is not None, f"Reference {ref_path} should have components"
 
         # Verify pin UUIDs were extracted
         assert hasattr(resistor, "pin_uuids"), "Component should have pin_uuids field"
@@ -37,11 +61,10 @@ class TestPinUUIDReferenceSchematic:
         assert "2" in resistor.pin_uuids, "Should have UUID for pin 2"
 
     @pytest.mark.format
-    @pytest.mark.parametrize("ref_path", REFERENCE_PATHS)
-    def test_exact_format_preservation_pin_uuids(self, ref_path):
+    @pytest.mark.parametrize("reference_schematic", REFERENCE_PATHS, indirect=True)
+    def test_exact_format_preservation_pin_uuids(self, reference_schematic):
         """Validates: FORMAT-2 (exact format preservation against reference)"""
-        # Load reference
-        sch = ksa.Schematic.load(ref_path)
+        ref_path, sch = reference_schematic
 
         # Save to temp
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -67,14 +90,12 @@ class TestPinUUIDReferenceSchematic:
                     orig == out
                 ), f"Pin {i+1} entry mismatch in {ref_path}:\nOriginal: {orig}\nOutput: {out}"
 
-    def test_rotated_resistor_0deg_exact_uuids(self):
+    @pytest.mark.parametrize("reference_schematic", REFERENCE_PATHS[:1], indirect=True)
+    def test_rotated_resistor_0deg_exact_uuids(self, reference_schematic):
         """Validates: Exact UUIDs for rotated_resistor_0deg reference"""
-        ref_path = (
-            "tests/reference_kicad_projects/rotated_resistor_0deg/rotated_resistor_0deg.kicad_sch"
-        )
-        sch = ksa.Schematic.load(ref_path)
+        _, sch = reference_schematic
 
-        resistor = list(sch.components)[0]
+        resistor = next(iter(sch.components))
 
         # These are the exact UUIDs from the reference file
         expected_uuids = {
@@ -86,14 +107,12 @@ class TestPinUUIDReferenceSchematic:
             resistor.pin_uuids == expected_uuids
         ), f"Pin UUIDs should match reference exactly: expected {expected_uuids}, got {resistor.pin_uuids}"
 
-    def test_rotated_resistor_90deg_exact_uuids(self):
+    @pytest.mark.parametrize("reference_schematic", REFERENCE_PATHS[1:2], indirect=True)
+    def test_rotated_resistor_90deg_exact_uuids(self, reference_schematic):
         """Validates: Exact UUIDs for rotated_resistor_90deg reference"""
-        ref_path = (
-            "tests/reference_kicad_projects/rotated_resistor_90deg/rotated_resistor_90deg.kicad_sch"
-        )
-        sch = ksa.Schematic.load(ref_path)
+        _, sch = reference_schematic
 
-        resistor = list(sch.components)[0]
+        resistor = next(iter(sch.components))
 
         # These are the exact UUIDs from the reference file (same as 0deg - rotation doesn't change UUIDs)
         expected_uuids = {
@@ -156,15 +175,20 @@ class TestPinUUIDReferenceSchematic:
             sch3.save(path3)
 
             # Extract pin UUIDs from each
-            resistor1 = list(sch1.components)[0]
-            resistor2 = list(sch2.components)[0]
-            resistor3 = list(sch3.components)[0]
+            resistor1 = next(iter(sch1.components))
+            resistor2 = next(iter(sch2.components))
+            resistor3 = next(iter(sch3.components))
 
             # All should have identical pin UUIDs
             assert (
                 resistor1.pin_uuids == resistor2.pin_uuids == resistor3.pin_uuids
             ), "Pin UUIDs should remain stable across multiple round-trips"
 
+            # Once saved by us, further round-trips must not change the structure at all
+            assert _canonical_digest(path1) == _canonical_digest(
+                path3
+            ), "Schematic structure should be stable across repeated round-trips"
+
     def _extract_pin_sections(self, content: str) -> list:
         """Extract pin sections from schematic content for comparison."""
         # Pattern matches: (pin "1" (uuid "..."))
@@ -206,7 +230,7 @@ class TestPinUUIDFormatValidation:
         )
         sch = ksa.Schematic.load(ref_path)
 
-        resistor = list(sch.components)[0]
+        resistor = next(iter(sch.components))
 
         # All pin UUIDs should be unique
         uuid_values = list(resistor.pin_uuids.values())
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test: Power symbols matching reference."""
 
+import os
+
 import kicad_sch_api as ksa
 
 
@@ -44,9 +46,11 @@ def main():
     sch.save("test_power_symbols.kicad_sch")
     print("✅ Created power symbols")
 
-    import subprocess
+    # Open the result in KiCad only when asked; batch and CI runs skip the viewer
+    if os.environ.get("KSA_OPEN_VIEWER"):
+        import subprocess
 
-    subprocess.run(["open", "test_power_symbols.kicad_sch"])
+        subprocess.run(["open", "test_power_symbols.kicad_sch"], check=True)
 
 
 if __name__ == "__main__":
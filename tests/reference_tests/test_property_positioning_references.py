@@ -2,7 +2,8 @@
 Reference tests for property positioning - validates against KiCAD native placement.
 
 Each test loads a reference schematic created manually in KiCAD with fields_autoplaced
-and verifies exact property positions match expected values.
+and verifies exact property positions match expected values. Reference schematics are
+read-only here, so each one is parsed once per test class and shared by its tests.
 
 Related:
 - Issue #150: Default component property text positioning doesn't match KiCAD auto-placement
@@ -11,10 +12,48 @@ Related:
 - References: tests/reference_kicad_projects/property_positioning_*/
 """
 
+import hashlib
+from pathlib import Path
+
 import pytest
 
 import kicad_sch_api as ksa
 
+REFERENCE_DIR = Path("tests/reference_kicad_projects")
+
+PROPERTY_POSITIONING_REFERENCES = [
+    "property_positioning_resistor/resistor.kicad_sch",
+    "property_positioning_capacitor/capacitor.kicad_sch",
+    "property_positioning_inductor/inductor.kicad_sch",
+    "property_positioning_diode/diode.kicad_sch",
+    "property_positioning_led/led.kicad_sch",
+    "property_positioning_transistor_bjt/transistor_bjt.kicad_sch",
+    "property_positioning_op_amp/op_amp.kicad_sch",
+    "property_positioning_logic_ic/logic_ic.kicad_sch",
+    "property_positioning_connector/connector.kicad_sch",
+    "property_positioning_capacitor_electrolytic/capacitor_electrolytic.kicad_sch",
+]
+
+
+def _file_digest(path: Path) -> bytes:
+    """BLAKE2b digest of a file's raw bytes, streamed rather than read whole."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "blake2b").digest()
+        digest = hashlib.blake2b()
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+        return digest.digest()
+
+
+@pytest.fixture(scope="session")
+def reference_digests():
+    """Digest of every property positioning reference, hashed once per session."""
+    return {
+        ref_file: _file_digest(REFERENCE_DIR / ref_file)
+        for ref_file in PROPERTY_POSITIONING_REFERENCES
+    }
+
 
 class TestResistorReferencePositioning:
     """Validate resistor property positioning against KiCAD reference.
@@ -24,7 +63,7 @@ class TestResistorReferencePositioning:
     Pattern: Properties positioned RIGHT and STACKED vertically
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def resistor_sch(self):
         """Load resistor reference schematic."""
         return ksa.Schematic.load(
@@ -102,7 +141,7 @@ class TestCapacitorReferencePositioning:
     Pattern: Slight RIGHT offset, different from resistor
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def capacitor_sch(self):
         """Load capacitor reference schematic."""
         return ksa.Schematic.load(
@@ -137,7 +176,7 @@ class TestDiodeReferencePositioning:
     Pattern: CENTERED vertical stacking (no horizontal offset)
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def diode_sch(self):
         """Load diode reference schematic."""
         return ksa.Schematic.load(
@@ -175,7 +214,7 @@ class TestInductorReferencePositioning:
     Pattern: HORIZONTAL stacking with 90° text rotation
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def inductor_sch(self):
         """Load inductor reference schematic."""
         return ksa.Schematic.load(
@@ -222,7 +261,7 @@ class TestLEDReferencePositioning:
     Pattern: Same as diode (centered vertical stacking)
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def led_sch(self):
         """Load LED reference schematic."""
         return ksa.Schematic.load(
@@ -259,7 +298,7 @@ class TestTransistorReferencePositioning:
     Pattern: RIGHT side with larger offset than 2-pin components
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def transistor_sch(self):
         """Load transistor reference schematic."""
         return ksa.Schematic.load(
@@ -289,7 +328,7 @@ class TestOpAmpReferencePositioning:
     Pattern: Centered with LARGE vertical spacing for IC
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def op_amp_sch(self):
         """Load op-amp reference schematic."""
         return ksa.Schematic.load(
@@ -329,7 +368,7 @@ class TestLogicICReferencePositioning:
     Pattern: LEFT side with VERY LARGE vertical spacing
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def logic_ic_sch(self):
         """Load logic IC reference schematic."""
         return ksa.Schematic.load(
@@ -367,7 +406,7 @@ class TestConnectorReferencePositioning:
     Pattern: Centered with multi-pin spacing
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def connector_sch(self):
         """Load connector reference schematic."""
         return ksa.Schematic.load(
@@ -404,7 +443,7 @@ class TestCapacitorPolarizedReferencePositioning:
     Pattern: Same as unpolarized capacitor
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def cap_polarized_sch(self):
         """Load polarized capacitor reference schematic."""
         return ksa.Schematic.load(
@@ -438,37 +477,23 @@ class TestFormatPreservationAcrossAllReferences:
 
     @pytest.mark.parametrize(
         "ref_file",
-        [
-            "property_positioning_resistor/resistor.kicad_sch",
-            "property_positioning_capacitor/capacitor.kicad_sch",
-            "property_positioning_inductor/inductor.kicad_sch",
-            "property_positioning_diode/diode.kicad_sch",
-            "property_positioning_led/led.kicad_sch",
-            "property_positioning_transistor_bjt/transistor_bjt.kicad_sch",
-            "property_positioning_op_amp/op_amp.kicad_sch",
-            "property_positioning_logic_ic/logic_ic.kicad_sch",
-            "property_positioning_connector/connector.kicad_sch",
-            "property_positioning_capacitor_electrolytic/capacitor_electrolytic.kicad_sch",
-        ],
+        PROPERTY_POSITIONING_REFERENCES,
     )
-    def test_round_trip_format_preservation(self, ref_file, tmp_path):
+    def test_round_trip_format_preservation(self, ref_file, reference_digests, tmp_path):
         """Each reference should round-trip with exact format preservation.
 
         Load → Save → Load should produce identical property positions.
         """
-        import filecmp
-
-        ref_path = f"tests/reference_kicad_projects/{ref_file}"
+        ref_path = REFERENCE_DIR / ref_file
 
         # Load reference
-        sch = ksa.Schematic.load(ref_path)
+        sch = ksa.Schematic.load(str(ref_path))
 
         # Save to temp
         temp_file = tmp_path / "roundtrip.kicad_sch"
-        sch.save(str(temp_file))
+        sch.save(temp_file)
 
-        # Files should be byte-identical (or semantically equivalent)
-        # Note: Some whitespace/formatting differences may be acceptable
-        assert filecmp.cmp(
-            ref_path, str(temp_file), shallow=False
+        # Files should be byte-identical; the reference side is hashed once per session
+        assert (
+            _file_digest(temp_file) == reference_digests[ref_file]
         ), f"Round-trip failed for {ref_file}"
@@ -1,52 +1,54 @@
 #!/usr/bin/env python3
 """Test: Resistor divider with wire connections matching reference."""
 
+import os
+
 import kicad_sch_api as ksa
 
 
 def main():
     sch = ksa.create_schematic("Resistor Divider")
 
-    # Add power symbols (matching reference positions)
-    pwr_3v3 = sch.components.add(
-        lib_id="power:+3.3V",
-        reference="#PWR02",
-        value="+3.3V",
-        position=(91.44, 69.85),
-        footprint="",
-        datasheet="",
-        description="Power symbol creates a global label with name +3.3V",
-    )
-
-    gnd = sch.components.add(
-        lib_id="power:GND",
-        reference="#PWR01",
-        value="GND",
-        position=(91.44, 95.25),
-        footprint="",
-        datasheet="",
-        description="Power symbol creates a global label with name GND, ground",
-    )
-
-    # Add resistors (matching reference positions)
-    r1 = sch.components.add(
-        lib_id="Device:R",
-        reference="R1",
-        value="10k",
-        position=(91.44, 73.66),
-        footprint="Resistor_SMD:R_0603_1608Metric",
-        datasheet="~",
-        description="Resistor",
-    )
-
-    r2 = sch.components.add(
-        lib_id="Device:R",
-        reference="R2",
-        value="10k",
-        position=(91.44, 91.44),
-        footprint="Resistor_SMD:R_0603_1608Metric",
-        datasheet="~",
-        description="Resistor",
+    # Add power symbols and resistors (matching reference positions)
+    sch.components.add_many(
+        [
+            {
+                "lib_id": "power:+3.3V",
+                "reference": "#PWR02",
+                "value": "+3.3V",
+                "position": (91.44, 69.85),
+                "footprint": "",
+                "datasheet": "",
+                "description": "Power symbol creates a global label with name +3.3V",
+            },
+            {
+                "lib_id": "power:GND",
+                "reference": "#PWR01",
+                "value": "GND",
+                "position": (91.44, 95.25),
+                "footprint": "",
+                "datasheet": "",
+                "description": "Power symbol creates a global label with name GND, ground",
+            },
+            {
+                "lib_id": "Device:R",
+                "reference": "R1",
+                "value": "10k",
+                "position": (91.44, 73.66),
+                "footprint": "Resistor_SMD:R_0603_1608Metric",
+                "datasheet": "~",
+                "description": "Resistor",
+            },
+            {
+                "lib_id": "Device:R",
+                "reference": "R2",
+                "value": "10k",
+                "position": (91.44, 91.44),
+                "footprint": "Resistor_SMD:R_0603_1608Metric",
+                "datasheet": "~",
+                "description": "Resistor",
+            },
+        ]
     )
 
     # Add wire connections (matching reference)
@@ -68,9 +70,11 @@ def main():
     sch.save("test_resistor_divider.kicad_sch")
     print("✅ Created complete resistor divider with wires, junction, and VOUT label")
 
-    import subprocess
+    # Open the result in KiCad only when asked; batch and CI runs skip the viewer
+    if os.environ.get("KSA_OPEN_VIEWER"):
+        import subprocess
 
-    subprocess.run(["open", "test_resistor_divider.kicad_sch"])
+        subprocess.run(["open", "test_resistor_divider.kicad_sch"], check=True)
 
 
 if __name__ == "__main__":
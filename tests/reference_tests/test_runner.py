@@ -11,7 +11,6 @@ This test runner:
 import os
 import subprocess
 import sys
-import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -46,12 +45,15 @@ class TestRunner:
             # "test_multi_component.py",
         ]
 
-    def _run_test_script(self, script_name: str) -> Tuple[bool, str, Optional[Path]]:
+    def _run_test_script(
+        self, script_name: str, output_dir: Path
+    ) -> Tuple[bool, str, Optional[Path]]:
         """
         Run a test script and return success status, output, and generated file path.
 
         Args:
             script_name: Name of the test script
+            output_dir: Per-test directory for the modified script and its output
 
         Returns:
             (success, output, generated_file_path)
@@ -61,58 +63,47 @@ class TestRunner:
         if not script_path.exists():
             return False, f"Script not found: {script_path}", None
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Determine output filename
-            output_name = script_name.replace(".py", ".kicad_sch")
-            output_file = Path(tmpdir) / output_name
-
-            # Read the script and modify the output path
-            with open(script_path, "r") as f:
-                script_content = f.read()
-
-            # Replace the save path to use temp directory
-            modified_script = script_content.replace(f'"{output_name}"', f'"{output_file}"')
-
-            # Remove the subprocess.run line that opens the file
-            lines = modified_script.split("\n")
-            filtered_lines = [line for line in lines if 'subprocess.run(["open"' not in line]
-            modified_script = "\n".join(filtered_lines)
-
-            # Write modified script to temp file
-            temp_script = Path(tmpdir) / "test_script.py"
-            with open(temp_script, "w") as f:
-                f.write(modified_script)
-
-            # Run the script
-            try:
-                result = subprocess.run(
-                    [sys.executable, str(temp_script)],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    cwd=str(self.project_root),
-                )
-
-                success = result.returncode == 0
-                output = result.stdout + result.stderr
-
-                # Check if output file was created
-                if output_file.exists():
-                    # Copy to persistent location for validation
-                    persistent_file = Path(tmpdir).parent / output_name
-                    with open(output_file, "r") as f:
-                        content = f.read()
-                    with open(persistent_file, "w") as f:
-                        f.write(content)
-
-                    return success, output, persistent_file
-                else:
-                    return success, output + "\nNo output file generated", None
-
-            except subprocess.TimeoutExpired:
-                return False, "Test script timed out", None
-            except Exception as e:
-                return False, f"Error running script: {e}", None
+        # Determine output filename
+        output_name = script_name.replace(".py", ".kicad_sch")
+        output_file = output_dir / output_name
+
+        # Read the script and modify the output path
+        with open(script_path, "r") as f:
+            script_content = f.read()
+
+        # Replace the save path to use the output directory
+        modified_script = script_content.replace(f'"{output_name}"', f'"{output_file}"')
+
+        # Write modified script next to its output
+        temp_script = output_dir / "test_script.py"
+        with open(temp_script, "w") as f:
+            f.write(modified_script)
+
+        # Run the script
+        try:
+            result = subprocess.run(
+                [sys.executable, str(temp_script)],
+                capture_output=True,
+                text=True,
+                timeout=10,
+                cwd=str(self.project_root),
+                # Never launch the viewer the scripts open on KSA_OPEN_VIEWER
+                env={k: v for k, v in os.environ.items() if k != "KSA_OPEN_VIEWER"},
+            )
+
+            success = result.returncode == 0
+            output = result.stdout + result.stderr
+
+            # Check if output file was created
+            if output_file.exists():
+                return success, output, output_file
+            else:
+                return success, output + "\nNo output file generated", None
+
+        except subprocess.TimeoutExpired:
+            return False, "Test script timed out", None
+        except Exception as e:
+            return False, f"Error running script: {e}", None
 
     def _validate_schematic(self, schematic_path: Path) -> Tuple[bool, str]:
         """
@@ -198,9 +189,9 @@ class TestRunner:
         except Exception:
             return -1
 
-    def test_single_resistor(self):
+    def test_single_resistor(self, tmp_path):
         """Test single resistor generation."""
-        success, output, generated_path = self._run_test_script("test_single_resistor.py")
+        success, output, generated_path = self._run_test_script("test_single_resistor.py", tmp_path)
 
         assert success, f"Test script failed: {output}"
         assert generated_path and generated_path.exists(), "No output file generated"
@@ -215,13 +206,9 @@ class TestRunner:
 
         print(f"✅ test_single_resistor.py: Generated valid schematic with 1 component")
 
-        # Clean up
-        if generated_path.exists():
-            generated_path.unlink()
-
-    def test_two_resistors(self):
+    def test_two_resistors(self, tmp_path):
         """Test two resistors generation."""
-        success, output, generated_path = self._run_test_script("test_two_resistors.py")
+        success, output, generated_path = self._run_test_script("test_two_resistors.py", tmp_path)
 
         assert success, f"Test script failed: {output}"
         assert generated_path and generated_path.exists(), "No output file generated"
@@ -236,13 +223,9 @@ class TestRunner:
 
         print(f"✅ test_two_resistors.py: Generated valid schematic with 2 components")
 
-        # Clean up
-        if generated_path.exists():
-            generated_path.unlink()
-
-    def test_blank_schematic(self):
+    def test_blank_schematic(self, tmp_path):
         """Test blank schematic generation."""
-        success, output, generated_path = self._run_test_script("test_blank_schematic.py")
+        success, output, generated_path = self._run_test_script("test_blank_schematic.py", tmp_path)
 
         assert success, f"Test script failed: {output}"
         assert generated_path and generated_path.exists(), "No output file generated"
@@ -257,13 +240,11 @@ class TestRunner:
 
         print(f"✅ test_blank_schematic.py: Generated valid blank schematic")
 
-        # Clean up
-        if generated_path.exists():
-            generated_path.unlink()
-
-    def test_resistor_divider(self):
+    def test_resistor_divider(self, tmp_path):
         """Test resistor divider generation."""
-        success, output, generated_path = self._run_test_script("test_resistor_divider.py")
+        success, output, generated_path = self._run_test_script(
+            "test_resistor_divider.py", tmp_path
+        )
 
         assert success, f"Test script failed: {output}"
         assert generated_path and generated_path.exists(), "No output file generated"
@@ -289,13 +270,11 @@ class TestRunner:
             f"✅ test_resistor_divider.py: Generated complete resistor divider with components, wires, junction, and VOUT label"
         )
 
-        # Clean up
-        if generated_path.exists():
-            generated_path.unlink()
-
-    def test_single_label_hierarchical(self):
+    def test_single_label_hierarchical(self, tmp_path):
         """Test hierarchical label generation."""
-        success, output, generated_path = self._run_test_script("test_single_label_hierarchical.py")
+        success, output, generated_path = self._run_test_script(
+            "test_single_label_hierarchical.py", tmp_path
+        )
 
         assert success, f"Test script failed: {output}"
         assert generated_path and generated_path.exists(), "No output file generated"
@@ -318,13 +297,9 @@ class TestRunner:
             f"✅ test_single_label_hierarchical.py: Generated valid schematic with hierarchical label"
         )
 
-        # Clean up
-        if generated_path.exists():
-            generated_path.unlink()
-
-    def test_single_wire(self):
+    def test_single_wire(self, tmp_path):
         """Test single wire generation."""
-        success, output, generated_path = self._run_test_script("test_single_wire.py")
+        success, output, generated_path = self._run_test_script("test_single_wire.py", tmp_path)
 
         assert success, f"Test script failed: {output}"
         assert generated_path and generated_path.exists(), "No output file generated"
@@ -346,13 +321,9 @@ class TestRunner:
 
         print(f"✅ test_single_wire.py: Generated valid schematic with wire")
 
-        # Clean up
-        if generated_path.exists():
-            generated_path.unlink()
-
-    def test_power_symbols(self):
+    def test_power_symbols(self, tmp_path):
         """Test power symbols generation."""
-        success, output, generated_path = self._run_test_script("test_power_symbols.py")
+        success, output, generated_path = self._run_test_script("test_power_symbols.py", tmp_path)
 
         assert success, f"Test script failed: {output}"
         assert generated_path and generated_path.exists(), "No output file generated"
@@ -375,13 +346,9 @@ class TestRunner:
 
         print(f"✅ test_power_symbols.py: Generated valid schematic with 3 power symbols")
 
-        # Clean up
-        if generated_path.exists():
-            generated_path.unlink()
-
-    def test_single_label(self):
+    def test_single_label(self, tmp_path):
         """Test local label generation."""
-        success, output, generated_path = self._run_test_script("test_single_label.py")
+        success, output, generated_path = self._run_test_script("test_single_label.py", tmp_path)
 
         assert success, f"Test script failed: {output}"
         assert generated_path and generated_path.exists(), "No output file generated"
@@ -403,13 +370,11 @@ class TestRunner:
 
         print(f"✅ test_single_label.py: Generated valid schematic with local label")
 
-        # Clean up
-        if generated_path.exists():
-            generated_path.unlink()
-
-    def test_single_hierarchical_sheet(self):
+    def test_single_hierarchical_sheet(self, tmp_path):
         """Test hierarchical sheet generation."""
-        success, output, generated_path = self._run_test_script("test_single_hierarchical_sheet.py")
+        success, output, generated_path = self._run_test_script(
+            "test_single_hierarchical_sheet.py", tmp_path
+        )
 
         assert success, f"Test script failed: {output}"
         assert generated_path and generated_path.exists(), "No output file generated"
@@ -435,13 +400,9 @@ class TestRunner:
             f"✅ test_single_hierarchical_sheet.py: Generated valid schematic with hierarchical sheet"
         )
 
-        # Clean up
-        if generated_path.exists():
-            generated_path.unlink()
-
-    def test_single_text(self):
+    def test_single_text(self, tmp_path):
         """Test text element generation."""
-        success, output, generated_path = self._run_test_script("test_single_text.py")
+        success, output, generated_path = self._run_test_script("test_single_text.py", tmp_path)
 
         assert success, f"Test script failed: {output}"
         assert generated_path and generated_path.exists(), "No output file generated"
@@ -462,13 +423,9 @@ class TestRunner:
 
         print(f"✅ test_single_text.py: Generated valid schematic with text element")
 
-        # Clean up
-        if generated_path.exists():
-            generated_path.unlink()
-
-    def test_single_text_box(self):
+    def test_single_text_box(self, tmp_path):
         """Test text box element generation."""
-        success, output, generated_path = self._run_test_script("test_single_text_box.py")
+        success, output, generated_path = self._run_test_script("test_single_text_box.py", tmp_path)
 
         assert success, f"Test script failed: {output}"
         assert generated_path and generated_path.exists(), "No output file generated"
@@ -491,11 +448,7 @@ class TestRunner:
 
         print(f"✅ test_single_text_box.py: Generated valid schematic with text box element")
 
-        # Clean up
-        if generated_path.exists():
-            generated_path.unlink()
-
-    def test_all_scripts_exist(self):
+    def test_all_scripts_exist(self, tmp_path):
         """Verify all expected test scripts exist."""
         missing = []
         for script_name in self.test_scripts:
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test: Complete title block with date, revision, company, and comments."""
 
+import os
+
 import kicad_sch_api as ksa
 
 
@@ -19,9 +21,11 @@ def main():
     sch.save("test_sch_title.kicad_sch")
     print("✅ Created schematic with complete title block")
 
-    import subprocess
+    # Open the result in KiCad only when asked; batch and CI runs skip the viewer
+    if os.environ.get("KSA_OPEN_VIEWER"):
+        import subprocess
 
-    subprocess.run(["open", "test_sch_title.kicad_sch"])
+        subprocess.run(["open", "test_sch_title.kicad_sch"], check=True)
 
 
 if __name__ == "__main__":
@@ -15,14 +15,14 @@ import kicad_sch_api as ksa
 class TestSheetPinEdgesReference:
     """Test sheet pin edge positioning against KiCAD reference."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def reference_dir(self):
         """Get reference project directory."""
         return Path(__file__).parent / "reference_kicad_projects" / "sheet_pin_edges"
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def reference_schematic(self, reference_dir):
-        """Load the manually created reference schematic."""
+        """Load the manually created reference schematic once; tests only read it."""
         ref_path = reference_dir / "sheet_pin_edges.kicad_sch"
         return ksa.Schematic.load(str(ref_path))
 
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test: Single hierarchical sheet matching reference."""
 
+import os
+
 import kicad_sch_api as ksa
 
 
@@ -70,9 +72,11 @@ def main():
 
     print("✅ Created single hierarchical sheet with sub-schematic")
 
-    import subprocess
+    # Open the result in KiCad only when asked; batch and CI runs skip the viewer
+    if os.environ.get("KSA_OPEN_VIEWER"):
+        import subprocess
 
-    subprocess.run(["open", "test_single_hierarchical_sheet.kicad_sch"])
+        subprocess.run(["open", "test_single_hierarchical_sheet.kicad_sch"], check=True)
 
 
 if __name__ == "__main__":
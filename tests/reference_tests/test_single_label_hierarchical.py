@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test: Single hierarchical label matching reference."""
 
+import os
+
 import kicad_sch_api as ksa
 from kicad_sch_api.core.types import HierarchicalLabelShape
 
@@ -20,9 +22,11 @@ def main():
     sch.save("test_single_label_hierarchical.kicad_sch")
     print("✅ Created single hierarchical label")
 
-    import subprocess
+    # Open the result in KiCad only when asked; batch and CI runs skip the viewer
+    if os.environ.get("KSA_OPEN_VIEWER"):
+        import subprocess
 
-    subprocess.run(["open", "test_single_label_hierarchical.kicad_sch"])
+        subprocess.run(["open", "test_single_label_hierarchical.kicad_sch"], check=True)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test: Single text box matching reference."""
 
+import os
+
 import kicad_sch_api as ksa
 
 
@@ -26,9 +28,11 @@ def main():
     sch.save("test_single_text_box.kicad_sch")
     print("✅ Created single text box")
 
-    import subprocess
+    # Open the result in KiCad only when asked; batch and CI runs skip the viewer
+    if os.environ.get("KSA_OPEN_VIEWER"):
+        import subprocess
 
-    subprocess.run(["open", "test_single_text_box.kicad_sch"])
+        subprocess.run(["open", "test_single_text_box.kicad_sch"], check=True)
 
 
 if __name__ == "__main__":
@@ -23,32 +23,34 @@ REFERENCE_FILE = REFERENCE_DIR / "text_effects.kicad_sch"
 class TestTextEffectsReference:
     """Test text effects against reference schematic."""
 
+    @pytest.fixture(scope="class")
+    def reference_sch(self):
+        """Load the reference schematic once; these tests only read it."""
+        return ksa.Schematic.load(str(REFERENCE_FILE))
+
     def test_reference_exists(self):
         """Verify reference schematic exists."""
         assert REFERENCE_FILE.exists(), f"Reference not found: {REFERENCE_FILE}"
 
-    def test_load_reference_schematic(self):
+    def test_load_reference_schematic(self, reference_sch):
         """Load the reference schematic."""
-        sch = ksa.Schematic.load(str(REFERENCE_FILE))
-        assert sch is not None
-        assert len(sch.components) == 1
-        assert sch.components[0].reference == "R1"
-        assert sch.components[0].value == "10k"
+        assert reference_sch is not None
+        assert len(reference_sch.components) == 1
+        assert reference_sch.components[0].reference == "R1"
+        assert reference_sch.components[0].value == "10k"
 
-    def test_reference_has_preserved_sexpressions(self):
+    def test_reference_has_preserved_sexpressions(self, reference_sch):
         """Verify preserved S-expressions exist for all properties."""
-        sch = ksa.Schematic.load(str(REFERENCE_FILE))
-        r1 = sch.components[0]
+        r1 = reference_sch.components[0]
 
         # Check preserved S-expressions exist
         assert "__sexp_Reference" in r1.properties
         assert "__sexp_Value" in r1.properties
         assert "__sexp_Footprint" in r1.properties
 
-    def test_parse_reference_bold_flag(self):
+    def test_parse_reference_bold_flag(self, reference_sch):
         """Parse bold flag from Reference property in reference."""
-        sch = ksa.Schematic.load(str(REFERENCE_FILE))
-        r1 = sch.components[0]
+        r1 = reference_sch.components[0]
 
         # Parse effects from preserved S-expression
         sexp = r1.properties["__sexp_Reference"]
@@ -89,10 +91,9 @@ class TestTextEffectsReference:
 
         assert has_bold, "Bold flag not found in Reference property"
 
-    def test_parse_reference_font_size(self):
+    def test_parse_reference_font_size(self, reference_sch):
         """Parse font size from Reference property."""
-        sch = ksa.Schematic.load(str(REFERENCE_FILE))
-        r1 = sch.components[0]
+        r1 = reference_sch.components[0]
 
         sexp = r1.properties["__sexp_Reference"]
 
@@ -103,10 +104,9 @@ class TestTextEffectsReference:
         sexp_str = str(sexp)
         assert "size" in sexp_str
 
-    def test_parse_reference_font_face(self):
+    def test_parse_reference_font_face(self, reference_sch):
         """Parse Arial font face from Reference property."""
-        sch = ksa.Schematic.load(str(REFERENCE_FILE))
-        r1 = sch.components[0]
+        r1 = reference_sch.components[0]
 
         sexp = r1.properties["__sexp_Reference"]
         sexp_str = str(sexp)
@@ -114,10 +114,9 @@ class TestTextEffectsReference:
         # Expected: (face "Arial")
         assert "Arial" in sexp_str
 
-    def test_parse_reference_color(self):
+    def test_parse_reference_color(self, reference_sch):
         """Parse red color from Reference property."""
-        sch = ksa.Schematic.load(str(REFERENCE_FILE))
-        r1 = sch.components[0]
+        r1 = reference_sch.components[0]
 
         sexp = r1.properties["__sexp_Reference"]
         sexp_str = str(sexp)
@@ -125,10 +124,9 @@ class TestTextEffectsReference:
         # Expected: (color 255 0 0 1)
         assert "color" in sexp_str
 
-    def test_parse_value_italic_flag(self):
+    def test_parse_value_italic_flag(self, reference_sch):
         """Parse italic flag from Value property."""
-        sch = ksa.Schematic.load(str(REFERENCE_FILE))
-        r1 = sch.components[0]
+        r1 = reference_sch.components[0]
 
         sexp = r1.properties["__sexp_Value"]
 
@@ -137,10 +135,9 @@ class TestTextEffectsReference:
         sexp_str = str(sexp)
         assert "italic" in sexp_str
 
-    def test_parse_value_font_size(self):
+    def test_parse_value_font_size(self, reference_sch):
         """Parse 1.5mm font size from Value property."""
-        sch = ksa.Schematic.load(str(REFERENCE_FILE))
-        r1 = sch.components[0]
+        r1 = reference_sch.components[0]
 
         sexp = r1.properties["__sexp_Value"]
         sexp_str = str(sexp)
@@ -148,10 +145,9 @@ class TestTextEffectsReference:
         # Expected: (size 1.5 1.5)
         assert "size" in sexp_str
 
-    def test_parse_footprint_hidden_flag(self):
+    def test_parse_footprint_hidden_flag(self, reference_sch):
         """Parse hidden flag from Footprint property."""
-        sch = ksa.Schematic.load(str(REFERENCE_FILE))
-        r1 = sch.components[0]
+        r1 = reference_sch.components[0]
 
         sexp = r1.properties["__sexp_Footprint"]
 
@@ -172,7 +168,7 @@ class TestTextEffectsRoundTrip:
 
         # Save to temp file
         output_file = tmp_path / "roundtrip.kicad_sch"
-        sch.save(str(output_file))
+        sch.save(output_file)
 
         # Load again
         sch2 = ksa.Schematic.load(str(output_file))
@@ -195,7 +191,7 @@ class TestTextEffectsRoundTrip:
         """Verify Reference property effects preserved exactly."""
         sch = ksa.Schematic.load(str(REFERENCE_FILE))
         output_file = tmp_path / "roundtrip.kicad_sch"
-        sch.save(str(output_file))
+        sch.save(output_file)
         sch2 = ksa.Schematic.load(str(output_file))
 
         original_sexp = sch.components[0].properties["__sexp_Reference"]
@@ -208,7 +204,7 @@ class TestTextEffectsRoundTrip:
         """Verify Value property effects preserved exactly."""
         sch = ksa.Schematic.load(str(REFERENCE_FILE))
         output_file = tmp_path / "roundtrip.kicad_sch"
-        sch.save(str(output_file))
+        sch.save(output_file)
         sch2 = ksa.Schematic.load(str(output_file))
 
         original_sexp = sch.components[0].properties["__sexp_Value"]
@@ -221,7 +217,7 @@ class TestTextEffectsRoundTrip:
         """Verify Footprint hidden flag preserved."""
         sch = ksa.Schematic.load(str(REFERENCE_FILE))
         output_file = tmp_path / "roundtrip.kicad_sch"
-        sch.save(str(output_file))
+        sch.save(output_file)
         sch2 = ksa.Schematic.load(str(output_file))
 
         original_sexp = sch.components[0].properties["__sexp_Footprint"]
@@ -291,7 +287,7 @@ class TestEffectsAPI:
         #
         # # Save
         # output_file = tmp_path / "modified.kicad_sch"
-        # sch.save(str(output_file))
+        # sch.save(output_file)
         #
         # # Load and verify
         # sch2 = ksa.Schematic.load(str(output_file))
@@ -6,8 +6,6 @@ Tests the new draw_bounding_box() and draw_component_bounding_boxes() methods
 with proper KiCAD rectangle graphics generation and all stroke types.
 """
 
-import os
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -20,7 +18,7 @@ from kicad_sch_api.core.types import Point
 class TestBoundingBoxRectangles:
     """Test bounding box rectangle generation functionality."""
 
-    def test_basic_bounding_box_rectangle(self):
+    def test_basic_bounding_box_rectangle(self, tmp_path):
         """Test basic rectangle generation from bounding box."""
         sch = ksa.create_schematic("Basic Bounding Box Test")
 
@@ -38,21 +36,17 @@ class TestBoundingBoxRectangles:
         assert len(rect_uuid) > 0
 
         # Verify schematic can be saved
-        with tempfile.NamedTemporaryFile(suffix=".kicad_sch", delete=False) as tmp:
-            sch.save(tmp.name)
+        output_path = tmp_path / "bounding_box.kicad_sch"
+        sch.save(output_path)
 
-            # Verify file exists and has content
-            assert os.path.exists(tmp.name)
-            assert os.path.getsize(tmp.name) > 0
+        # Verify file exists and has content
+        assert output_path.exists()
+        assert output_path.stat().st_size > 0
 
-            # Read content to verify rectangle was saved
-            with open(tmp.name, "r") as f:
-                content = f.read()
-                assert "(rectangle" in content
-                assert rect_uuid in content
-
-            # Cleanup
-            os.unlink(tmp.name)
+        # Read content to verify rectangle was saved
+        content = output_path.read_text()
+        assert "(rectangle" in content
+        assert rect_uuid in content
 
     def test_colored_bounding_box_rectangle(self):
         """Test colored rectangle generation."""
@@ -70,17 +64,11 @@ class TestBoundingBoxRectangles:
         assert rect_uuid is not None
 
         # Verify in saved content
-        with tempfile.NamedTemporaryFile(suffix=".kicad_sch", delete=False) as tmp:
-            sch.save(tmp.name)
-
-            with open(tmp.name, "r") as f:
-                content = f.read()
-                assert "(rectangle" in content
-                assert "(width 1)" in content  # 1mm width
-                assert "(type dash)" in content
-                assert "(color 255 0 0 1)" in content  # Red color
-
-            os.unlink(tmp.name)
+        content = sch.dumps()
+        assert "(rectangle" in content
+        assert "(width 1)" in content  # 1mm width
+        assert "(type dash)" in content
+        assert "(color 255 0 0 1)" in content  # Red color
 
     def test_all_stroke_types(self):
         """Test all valid KiCAD stroke types."""
@@ -105,24 +93,18 @@ class TestBoundingBoxRectangles:
             assert rect_uuid is not None
 
         # Verify all stroke types in saved content
-        with tempfile.NamedTemporaryFile(suffix=".kicad_sch", delete=False) as tmp:
-            sch.save(tmp.name)
+        content = sch.dumps()
 
-            with open(tmp.name, "r") as f:
-                content = f.read()
+        # Verify all stroke types are present
+        for stroke_type in stroke_types:
+            if stroke_type == "default":
+                assert "(type default)" in content
+            else:
+                assert f"(type {stroke_type})" in content
 
-                # Verify all stroke types are present
-                for stroke_type in stroke_types:
-                    if stroke_type == "default":
-                        assert "(type default)" in content
-                    else:
-                        assert f"(type {stroke_type})" in content
-
-                # Verify all UUIDs are present
-                for rect_uuid in rect_uuids:
-                    assert rect_uuid in content
-
-            os.unlink(tmp.name)
+        # Verify all UUIDs are present
+        for rect_uuid in rect_uuids:
+            assert rect_uuid in content
 
     def test_body_vs_properties_bounding_boxes(self):
         """Test difference between body-only and with-properties bounding boxes."""
@@ -153,17 +135,11 @@ class TestBoundingBoxRectangles:
         assert height_expansion > 5.0  # Should be > 5mm expansion
 
         # Verify both rectangles in saved content
-        with tempfile.NamedTemporaryFile(suffix=".kicad_sch", delete=False) as tmp:
-            sch.save(tmp.name)
-
-            with open(tmp.name, "r") as f:
-                content = f.read()
-                assert rect_body_uuid in content
-                assert rect_props_uuid in content
-                assert "(color 0 0 255 1)" in content  # Blue
-                assert "(color 255 0 0 1)" in content  # Red
-
-            os.unlink(tmp.name)
+        content = sch.dumps()
+        assert rect_body_uuid in content
+        assert rect_props_uuid in content
+        assert "(color 0 0 255 1)" in content  # Blue
+        assert "(color 255 0 0 1)" in content  # Red
 
     def test_multiple_component_bounding_boxes(self):
         """Test drawing bounding boxes for multiple components at once."""
@@ -184,20 +160,14 @@ class TestBoundingBoxRectangles:
         assert len(rect_uuids) == len(components)
 
         # Verify all rectangles in saved content
-        with tempfile.NamedTemporaryFile(suffix=".kicad_sch", delete=False) as tmp:
-            sch.save(tmp.name)
-
-            with open(tmp.name, "r") as f:
-                content = f.read()
-
-                # Verify all UUIDs are present
-                for rect_uuid in rect_uuids:
-                    assert rect_uuid in content
+        content = sch.dumps()
 
-                # Should have at least 3 rectangles (some symbols might have internal rectangles)
-                assert content.count("(rectangle") >= len(components)
+        # Verify all UUIDs are present
+        for rect_uuid in rect_uuids:
+            assert rect_uuid in content
 
-            os.unlink(tmp.name)
+        # Should have at least 3 rectangles (some symbols might have internal rectangles)
+        assert content.count("(rectangle") >= len(components)
 
     def test_invalid_stroke_type_validation(self):
         """Test that invalid stroke types are handled gracefully."""
@@ -210,15 +180,9 @@ class TestBoundingBoxRectangles:
             rect_uuid = sch.draw_bounding_box(bbox, stroke_type="invalid_type")
 
             # If it succeeds, verify it used a fallback
-            with tempfile.NamedTemporaryFile(suffix=".kicad_sch", delete=False) as tmp:
-                sch.save(tmp.name)
-
-                with open(tmp.name, "r") as f:
-                    content = f.read()
-                    # Should contain a valid stroke type (fallback to default)
-                    assert "(type default)" in content or "(type solid)" in content
-
-                os.unlink(tmp.name)
+            content = sch.dumps()
+            # Should contain a valid stroke type (fallback to default)
+            assert "(type default)" in content or "(type solid)" in content
 
         except ValueError:
             # This is also acceptable behavior
@@ -234,17 +198,23 @@ class TestBoundingBoxRectangles:
         rect_uuid = sch.draw_bounding_box(test_bbox)
 
         # Verify coordinates in saved content
-        with tempfile.NamedTemporaryFile(suffix=".kicad_sch", delete=False) as tmp:
-            sch.save(tmp.name)
+        content = sch.dumps()
+
+        # Should contain start and end coordinates
+        assert "(start 10 20)" in content
+        assert "(end 30 40)" in content
 
-            with open(tmp.name, "r") as f:
-                content = f.read()
+    def test_precomputed_component_bounding_boxes(self):
+        """Test drawing bounding boxes already computed for obstacle checks."""
+        sch = ksa.create_schematic("Precomputed Test")
 
-                # Should contain start and end coordinates
-                assert "(start 10 20)" in content
-                assert "(end 30 40)" in content
+        bboxes = [BoundingBox(10.0, 20.0, 30.0, 40.0), BoundingBox(50.0, 20.0, 60.0, 40.0)]
+        rect_uuids = sch.draw_component_bounding_boxes(bboxes=bboxes)
 
-            os.unlink(tmp.name)
+        assert len(rect_uuids) == 2
+        content = sch.dumps()
+        assert "(start 10 20)" in content
+        assert "(end 60 40)" in content
 
 
 if __name__ == "__main__":
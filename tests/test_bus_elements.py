@@ -11,7 +11,6 @@ Tests bus functionality including:
 """
 
 import sys
-import tempfile
 import uuid
 from pathlib import Path
 
@@ -70,7 +69,7 @@ class TestBusWire:
     @pytest.mark.xfail(
         reason="Parser does not yet preserve wire_type='bus' during round-trip. See Issue #117 for parser implementation."
     )
-    def test_create_bus_wire(self):
+    def test_create_bus_wire(self, tmp_path):
         """Test creating a bus wire using WireType.BUS."""
         parser = SExpressionParser()
 
@@ -94,33 +93,28 @@ class TestBusWire:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
+        temp_file = tmp_path / "test.kicad_sch"
 
-        try:
-            # Write schematic
-            parser.write_file(schematic_data, temp_file)
+        # Write schematic
+        parser.write_file(schematic_data, temp_file)
 
-            # Read it back
-            read_data = parser.parse_file(temp_file)
+        # Read it back
+        read_data = parser.parse_file(temp_file)
 
-            # Verify bus wire was preserved
-            assert "wires" in read_data, "Wires field missing"
-            assert len(read_data["wires"]) == 1
+        # Verify bus wire was preserved
+        assert "wires" in read_data, "Wires field missing"
+        assert len(read_data["wires"]) == 1
 
-            wire = read_data["wires"][0]
-            assert wire.get("wire_type") == "bus", "Wire type should be 'bus'"
-            assert len(wire["points"]) == 2
-            assert wire["points"][0]["x"] == 50
-            assert wire["points"][1]["x"] == 100
-
-        finally:
-            temp_file.unlink()
+        wire = read_data["wires"][0]
+        assert wire.get("wire_type") == "bus", "Wire type should be 'bus'"
+        assert len(wire["points"]) == 2
+        assert wire["points"][0]["x"] == 50
+        assert wire["points"][1]["x"] == 100
 
     @pytest.mark.xfail(
         reason="Parser does not yet preserve wire_type='bus' during round-trip. See Issue #117 for parser implementation."
     )
-    def test_bus_wire_with_label(self):
+    def test_bus_wire_with_label(self, tmp_path):
         """Test creating a bus wire with a bus label."""
         parser = SExpressionParser()
 
@@ -152,25 +146,20 @@ class TestBusWire:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
-
-        try:
-            # Write schematic
-            parser.write_file(schematic_data, temp_file)
+        temp_file = tmp_path / "test.kicad_sch"
 
-            # Read it back
-            read_data = parser.parse_file(temp_file)
+        # Write schematic
+        parser.write_file(schematic_data, temp_file)
 
-            # Verify bus wire and label preserved
-            assert len(read_data["wires"]) == 1
-            assert read_data["wires"][0].get("wire_type") == "bus"
+        # Read it back
+        read_data = parser.parse_file(temp_file)
 
-            assert len(read_data["labels"]) == 1
-            assert read_data["labels"][0]["text"] == "DATA[0..7]"
+        # Verify bus wire and label preserved
+        assert len(read_data["wires"]) == 1
+        assert read_data["wires"][0].get("wire_type") == "bus"
 
-        finally:
-            temp_file.unlink()
+        assert len(read_data["labels"]) == 1
+        assert read_data["labels"][0]["text"] == "DATA[0..7]"
 
 
 class TestBusLabel:
@@ -243,7 +232,7 @@ class TestBusEntryRoundTrip:
     @pytest.mark.xfail(
         reason="Parser does not yet handle bus_entries field. See Issue #117 for parser implementation."
     )
-    def test_bus_entry_round_trip(self):
+    def test_bus_entry_round_trip(self, tmp_path):
         """Test that bus entries are preserved during write/read cycle."""
         parser = SExpressionParser()
 
@@ -267,30 +256,25 @@ class TestBusEntryRoundTrip:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
+        temp_file = tmp_path / "test.kicad_sch"
 
-        try:
-            # Write schematic
-            parser.write_file(schematic_data, temp_file)
+        # Write schematic
+        parser.write_file(schematic_data, temp_file)
 
-            # Read it back
-            read_data = parser.parse_file(temp_file)
+        # Read it back
+        read_data = parser.parse_file(temp_file)
 
-            # Verify bus entry preserved
-            assert "bus_entries" in read_data, "Bus entries field missing"
-            assert len(read_data["bus_entries"]) == 1
-
-            entry = read_data["bus_entries"][0]
-            assert entry["uuid"] == bus_entry_uuid
-            assert entry["position"]["x"] == 60.96
-            assert entry["position"]["y"] == 50.8
-            assert entry["size"]["x"] == 2.54
-            assert entry["size"]["y"] == 2.54
-            assert entry["rotation"] == 270
+        # Verify bus entry preserved
+        assert "bus_entries" in read_data, "Bus entries field missing"
+        assert len(read_data["bus_entries"]) == 1
 
-        finally:
-            temp_file.unlink()
+        entry = read_data["bus_entries"][0]
+        assert entry["uuid"] == bus_entry_uuid
+        assert entry["position"]["x"] == 60.96
+        assert entry["position"]["y"] == 50.8
+        assert entry["size"]["x"] == 2.54
+        assert entry["size"]["y"] == 2.54
+        assert entry["rotation"] == 270
 
 
 class TestCompleteBusCircuit:
@@ -299,7 +283,7 @@ class TestCompleteBusCircuit:
     @pytest.mark.xfail(
         reason="Parser does not yet preserve wire_type='bus' or bus_entries. See Issue #117 for parser implementation."
     )
-    def test_complete_8bit_data_bus(self):
+    def test_complete_8bit_data_bus(self, tmp_path):
         """Test creating a complete 8-bit data bus with entries."""
         parser = SExpressionParser()
 
@@ -344,30 +328,25 @@ class TestCompleteBusCircuit:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
-
-        try:
-            # Write schematic
-            parser.write_file(schematic_data, temp_file)
+        temp_file = tmp_path / "test.kicad_sch"
 
-            # Read it back
-            read_data = parser.parse_file(temp_file)
+        # Write schematic
+        parser.write_file(schematic_data, temp_file)
 
-            # Verify all elements preserved
-            assert len(read_data["wires"]) == 1
-            assert read_data["wires"][0].get("wire_type") == "bus"
+        # Read it back
+        read_data = parser.parse_file(temp_file)
 
-            assert len(read_data["bus_entries"]) == 8
-            for entry in read_data["bus_entries"]:
-                assert entry["size"]["x"] == 2.54
-                assert entry["rotation"] == 270
+        # Verify all elements preserved
+        assert len(read_data["wires"]) == 1
+        assert read_data["wires"][0].get("wire_type") == "bus"
 
-            assert len(read_data["labels"]) == 1
-            assert read_data["labels"][0]["text"] == "DATA[0..7]"
+        assert len(read_data["bus_entries"]) == 8
+        for entry in read_data["bus_entries"]:
+            assert entry["size"]["x"] == 2.54
+            assert entry["rotation"] == 270
 
-        finally:
-            temp_file.unlink()
+        assert len(read_data["labels"]) == 1
+        assert read_data["labels"][0]["text"] == "DATA[0..7]"
 
 
 if __name__ == "__main__":
@@ -6,27 +6,23 @@ Tests that component removal properly cleans up lib_symbols and maintains
 exact compatibility with KiCAD reference files.
 """
 
-import tempfile
 from pathlib import Path
 
 import pytest
 
 import kicad_sch_api as ksa
 
+REFERENCE_DIR = Path(__file__).parent / "reference_tests" / "reference_kicad_projects"
+
 
 class TestComponentRemoval:
     """Test component removal with exact reference matching."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.test_dir = Path(__file__).parent / "reference_tests"
-        self.reference_dir = self.test_dir / "reference_kicad_projects"
-
-    def test_resistor_to_blank_removal(self):
+    def test_resistor_to_blank_removal(self, tmp_path):
         """Test removing resistor from single_resistor should match blank_schematic."""
         # Load reference files for comparison
-        single_resistor_ref = self.reference_dir / "single_resistor" / "single_resistor.kicad_sch"
-        blank_ref = self.reference_dir / "blank_schematic" / "blank_schematic.kicad_sch"
+        single_resistor_ref = REFERENCE_DIR / "single_resistor" / "single_resistor.kicad_sch"
+        blank_ref = REFERENCE_DIR / "blank_schematic" / "blank_schematic.kicad_sch"
 
         assert single_resistor_ref.exists(), "single_resistor reference not found"
         assert blank_ref.exists(), "blank_schematic reference not found"
@@ -45,14 +41,11 @@ class TestComponentRemoval:
         )
 
         # Verify it matches single_resistor first
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "test.kicad_sch"
 
-        sch.save(temp_path)
+        generated_content = sch.save(temp_path)
 
         # Compare with single_resistor reference
-        with open(temp_path, "r") as f:
-            generated_content = f.read()
         with open(single_resistor_ref, "r") as f:
             reference_content = f.read()
 
@@ -70,16 +63,10 @@ class TestComponentRemoval:
         assert len(sch.components) == 0, "Should have 0 components after removal"
 
         # Save and compare with blank_schematic
-        sch.save(temp_path)
-
-        with open(temp_path, "r") as f:
-            generated_blank = f.read()
+        generated_blank = sch.save(temp_path)
         with open(blank_ref, "r") as f:
             blank_reference = f.read()
 
-        # Clean up
-        temp_path.unlink()
-
         # The generated blank schematic should match the reference
         # (allowing for different UUIDs since blank has no UUID)
         assert (
@@ -90,8 +77,8 @@ class TestComponentRemoval:
     def test_two_resistors_remove_one(self):
         """Test removing one resistor from two_resistors should match single_resistor."""
         # Load reference files
-        two_resistors_ref = self.reference_dir / "two_resistors" / "two_resistors.kicad_sch"
-        single_resistor_ref = self.reference_dir / "single_resistor" / "single_resistor.kicad_sch"
+        two_resistors_ref = REFERENCE_DIR / "two_resistors" / "two_resistors.kicad_sch"
+        single_resistor_ref = REFERENCE_DIR / "single_resistor" / "single_resistor.kicad_sch"
 
         assert two_resistors_ref.exists(), "two_resistors reference not found"
         assert single_resistor_ref.exists(), "single_resistor reference not found"
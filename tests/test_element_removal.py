@@ -5,9 +5,6 @@ Test removal functionality for wires, labels, and other schematic elements.
 Validates that all removal methods work correctly and maintain schematic integrity.
 """
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 import kicad_sch_api as ksa
@@ -16,11 +13,6 @@ import kicad_sch_api as ksa
 class TestElementRemoval:
     """Test removal of various schematic elements."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.test_dir = Path(__file__).parent / "reference_tests"
-        self.reference_dir = self.test_dir / "reference_kicad_projects"
-
     def test_wire_removal(self):
         """Test wire removal functionality."""
         sch = ksa.create_schematic("test_wire_removal")
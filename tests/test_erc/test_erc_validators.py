@@ -303,6 +303,39 @@ class TestElectricalRulesChecker:
 
         # Config should be applied
 
+    def test_erc_fail_fast_stops_after_first_error(self):
+        """Test that fail_fast skips the validators after one reports an error."""
+        from kicad_sch_api.validation.erc_models import ERCConfig, ERCViolation
+        from kicad_sch_api.validation.validators import BaseValidator
+
+        calls = []
+
+        class StubValidator(BaseValidator):
+            def __init__(self, schematic, name, severity):
+                super().__init__(schematic)
+                self.name = name
+                self.severity = severity
+
+            def validate(self):
+                calls.append(self.name)
+                return [ERCViolation("stub", self.severity, self.name, ["R1"], "E999")]
+
+        sch = ksa.create_schematic("Test")
+        config = ERCConfig()
+        config.fail_fast = True
+        erc = ElectricalRulesChecker(sch, config=config)
+        erc.validators = [
+            StubValidator(sch, "warns", "warning"),
+            StubValidator(sch, "fails", "error"),
+            StubValidator(sch, "skipped", "error"),
+        ]
+
+        result = erc.run_all_checks()
+
+        assert calls == ["warns", "fails"]
+        assert [v.message for v in result.errors] == ["fails"]
+        assert [v.message for v in result.warnings] == ["warns"]
+
     def test_erc_performance(self):
         """Test ERC performance on moderate-sized schematic."""
         import time
@@ -317,9 +350,9 @@ class TestElectricalRulesChecker:
 
         erc = ElectricalRulesChecker(sch)
 
-        start = time.time()
+        start = time.perf_counter()
         result = erc.run_all_checks()
-        duration = (time.time() - start) * 1000  # ms
+        duration = (time.perf_counter() - start) * 1000  # ms
 
         # Should be fast (<100ms for 50 components)
         assert duration < 100, f"ERC took {duration}ms for 50 components (target <100ms)"
@@ -11,6 +11,12 @@ import kicad_sch_api as ksa
 from kicad_sch_api.core.geometry import snap_to_grid
 
 
+def _assert_on_grid(coords, grid_size=1.27):
+    """Assert every coordinate is a whole number of grid units (within 0.001)."""
+    grid_units = [coord / grid_size for coord in coords]
+    assert grid_units == pytest.approx([round(units) for units in grid_units], abs=0.001)
+
+
 class TestGridSnapping:
     """Test grid snapping utilities and component placement."""
 
@@ -32,23 +38,10 @@ class TestGridSnapping:
             result = snap_to_grid(input_pos, grid_size)
 
             # Check result is close to expected (within 0.001mm tolerance)
-            assert (
-                abs(result[0] - expected_pos[0]) < 0.001
-            ), f"X snap failed for {input_pos}: got {result[0]}, expected {expected_pos[0]}"
-            assert (
-                abs(result[1] - expected_pos[1]) < 0.001
-            ), f"Y snap failed for {input_pos}: got {result[1]}, expected {expected_pos[1]}"
+            assert result == pytest.approx(expected_pos, abs=0.001)
 
             # Verify result is actually on grid
-            x_grid_units = result[0] / grid_size
-            y_grid_units = result[1] / grid_size
-
-            assert (
-                abs(x_grid_units - round(x_grid_units)) < 0.001
-            ), f"X not on grid: {result[0]} = {x_grid_units} grid units"
-            assert (
-                abs(y_grid_units - round(y_grid_units)) < 0.001
-            ), f"Y not on grid: {result[1]} = {y_grid_units} grid units"
+            _assert_on_grid(result, grid_size)
 
     def test_component_position_snapping(self):
         """Test that components are automatically placed on grid."""
@@ -64,28 +57,21 @@ class TestGridSnapping:
 
         grid_size = 1.27
 
-        for i, pos in enumerate(test_positions):
-            # Add component at off-grid position
-            ref = f"R{i+1}"
-            component = sch.components.add("Device:R", ref, "10k", pos)
-
-            # Verify component position is on grid
-            actual_pos = component.position
-
-            x_grid_units = actual_pos.x / grid_size
-            y_grid_units = actual_pos.y / grid_size
+        # Add all components at their off-grid positions in one call
+        components = sch.components.add_many(
+            [
+                {"lib_id": "Device:R", "reference": f"R{i+1}", "value": "10k", "position": pos}
+                for i, pos in enumerate(test_positions)
+            ]
+        )
+        actual = [(comp.position.x, comp.position.y) for comp in components]
 
-            assert (
-                abs(x_grid_units - round(x_grid_units)) < 0.001
-            ), f"{ref} X not on grid: {actual_pos.x} = {x_grid_units} grid units"
-            assert (
-                abs(y_grid_units - round(y_grid_units)) < 0.001
-            ), f"{ref} Y not on grid: {actual_pos.y} = {y_grid_units} grid units"
+        # Verify every component position is on grid
+        _assert_on_grid([coord for pos in actual for coord in pos], grid_size)
 
-            # Verify it snapped to the nearest grid point
-            expected_pos = snap_to_grid(pos, grid_size)
-            assert abs(actual_pos.x - expected_pos[0]) < 0.001, f"{ref} X position mismatch"
-            assert abs(actual_pos.y - expected_pos[1]) < 0.001, f"{ref} Y position mismatch"
+        # Verify each snapped to the nearest grid point
+        expected = [snap_to_grid(pos, grid_size) for pos in test_positions]
+        assert actual == pytest.approx(expected, abs=0.001)
 
     def test_pin_positions_on_grid(self):
         """Test that calculated pin positions are on grid."""
@@ -104,16 +90,7 @@ class TestGridSnapping:
         grid_size = 1.27
 
         # Verify pin positions are on grid
-        for pin_name, pin_pos in [("Pin 1", pin1_pos), ("Pin 2", pin2_pos)]:
-            x_grid_units = pin_pos.x / grid_size
-            y_grid_units = pin_pos.y / grid_size
-
-            assert (
-                abs(x_grid_units - round(x_grid_units)) < 0.001
-            ), f"{pin_name} X not on grid: {pin_pos.x} = {x_grid_units} grid units"
-            assert (
-                abs(y_grid_units - round(y_grid_units)) < 0.001
-            ), f"{pin_name} Y not on grid: {pin_pos.y} = {y_grid_units} grid units"
+        _assert_on_grid((pin1_pos.x, pin1_pos.y, pin2_pos.x, pin2_pos.y), grid_size)
 
     def test_component_rotation_preserves_grid(self):
         """Test that component rotation maintains grid alignment."""
@@ -133,16 +110,7 @@ class TestGridSnapping:
             pin2_pos = sch.get_component_pin_position("R1", "2")
 
             # Verify pins remain on grid after rotation
-            for pin_name, pin_pos in [("Pin 1", pin1_pos), ("Pin 2", pin2_pos)]:
-                x_grid_units = pin_pos.x / grid_size
-                y_grid_units = pin_pos.y / grid_size
-
-                assert (
-                    abs(x_grid_units - round(x_grid_units)) < 0.001
-                ), f"{pin_name} X not on grid at {rotation}°: {pin_pos.x} = {x_grid_units} grid units"
-                assert (
-                    abs(y_grid_units - round(y_grid_units)) < 0.001
-                ), f"{pin_name} Y not on grid at {rotation}°: {pin_pos.y} = {y_grid_units} grid units"
+            _assert_on_grid((pin1_pos.x, pin1_pos.y, pin2_pos.x, pin2_pos.y), grid_size)
 
     def test_multiple_components_grid_alignment(self):
         """Test that multiple components maintain proper grid spacing."""
@@ -164,16 +132,10 @@ class TestGridSnapping:
         grid_size = 1.27
 
         # Verify all components are on grid
-        for comp in components:
-            x_grid_units = comp.position.x / grid_size
-            y_grid_units = comp.position.y / grid_size
-
-            assert (
-                abs(x_grid_units - round(x_grid_units)) < 0.001
-            ), f"{comp.reference} X not on grid"
-            assert (
-                abs(y_grid_units - round(y_grid_units)) < 0.001
-            ), f"{comp.reference} Y not on grid"
+        _assert_on_grid(
+            [coord for comp in components for coord in (comp.position.x, comp.position.y)],
+            grid_size,
+        )
 
         # Verify reasonable spacing between components
         for i in range(len(components) - 1):
@@ -184,16 +146,8 @@ class TestGridSnapping:
             dx = abs(comp2.position.x - comp1.position.x)
             dy = abs(comp2.position.y - comp1.position.y)
 
-            x_grid_diff = dx / grid_size
-            y_grid_diff = dy / grid_size
-
             # Should be whole grid units apart
-            assert (
-                abs(x_grid_diff - round(x_grid_diff)) < 0.001
-            ), f"Components not grid-aligned in X"
-            assert (
-                abs(y_grid_diff - round(y_grid_diff)) < 0.001
-            ), f"Components not grid-aligned in Y"
+            _assert_on_grid((dx, dy), grid_size)
 
 
 class TestGridConstants:
@@ -207,9 +161,7 @@ class TestGridConstants:
         mils_per_mm = 39.3701  # 1mm = 39.3701 mils
         grid_in_mils = grid_size * mils_per_mm
 
-        assert (
-            abs(grid_in_mils - 50.0) < 0.1
-        ), f"Grid should be 50 mils, got {grid_in_mils:.2f} mils"
+        assert grid_in_mils == pytest.approx(50.0, abs=0.1)
 
     def test_common_kicad_spacings(self):
         """Test that common KiCAD spacings work with our grid."""
@@ -225,11 +177,8 @@ class TestGridConstants:
             25.4,  # 1.0 inch (20 grid units)
         ]
 
-        for spacing in common_spacings:
-            grid_units = spacing / grid_size
-            assert (
-                abs(grid_units - round(grid_units)) < 0.001
-            ), f"Spacing {spacing}mm = {grid_units} grid units (should be whole number)"
+        # Every spacing should be a whole number of grid units
+        _assert_on_grid(common_spacings, grid_size)
 
 
 if __name__ == "__main__":
@@ -69,7 +69,7 @@ class TestHierarchicalInstances:
 
             # Verify component exists
             assert len(reloaded.components) == 1
-            reloaded_comp = list(reloaded.components)[0]
+            reloaded_comp = next(iter(reloaded.components))
 
             # Verify instances preserved
             assert hasattr(reloaded_comp._data, "instances")
@@ -102,7 +102,7 @@ class TestHierarchicalInstances:
             sch.save(str(output_path))
             reloaded = Schematic.load(str(output_path))
 
-            reloaded_comp = list(reloaded.components)[0]
+            reloaded_comp = next(iter(reloaded.components))
             assert len(reloaded_comp._data.instances) == 2
             assert reloaded_comp._data.instances[0].path == f"/{root_uuid}/{child_uuid1}"
             assert reloaded_comp._data.instances[1].path == f"/{root_uuid}/{child_uuid2}"
@@ -123,7 +123,7 @@ class TestHierarchicalInstances:
 
             # Should still work (parser generates default instance)
             assert len(reloaded.components) == 1
-            reloaded_comp = list(reloaded.components)[0]
+            reloaded_comp = next(iter(reloaded.components))
             assert reloaded_comp.reference == "R1"
 
     def test_empty_instances_list(self):
@@ -155,7 +155,7 @@ class TestHierarchicalPaths:
             sch.save(str(output_path))
             reloaded = Schematic.load(str(output_path))
 
-            reloaded_comp = list(reloaded.components)[0]
+            reloaded_comp = next(iter(reloaded.components))
             assert reloaded_comp._data.instances[0].path == "/"
 
     def test_two_level_hierarchy(self):
@@ -173,7 +173,7 @@ class TestHierarchicalPaths:
             sch.save(str(output_path))
             reloaded = Schematic.load(str(output_path))
 
-            reloaded_comp = list(reloaded.components)[0]
+            reloaded_comp = next(iter(reloaded.components))
             assert reloaded_comp._data.instances[0].path == path
 
     def test_three_level_hierarchy(self):
@@ -192,5 +192,5 @@ class TestHierarchicalPaths:
             sch.save(str(output_path))
             reloaded = Schematic.load(str(output_path))
 
-            reloaded_comp = list(reloaded.components)[0]
+            reloaded_comp = next(iter(reloaded.components))
             assert reloaded_comp._data.instances[0].path == path
@@ -12,7 +12,6 @@ If KiCad rejects it → we broke something CRITICAL
 
 import subprocess
 import sys
-import tempfile
 import uuid
 from pathlib import Path
 
@@ -27,7 +26,14 @@ from kicad_sch_api.core.parser import SExpressionParser
 class TestKiCadValidation:
     """Test that KiCad can open and validate generated schematics."""
 
-    def _validate_with_kicad(self, schematic_path: Path) -> tuple[bool, str]:
+    @pytest.fixture(scope="class")
+    def parser(self):
+        """One parser for the whole class; each write/parse call is independent."""
+        return SExpressionParser()
+
+    def _validate_with_kicad(
+        self, parser: SExpressionParser, schematic_path: Path
+    ) -> tuple[bool, str]:
         """
         Validate schematic by attempting to open it in KiCad (CLI mode).
 
@@ -38,16 +44,14 @@ class TestKiCadValidation:
         # For now, we'll just try to read it back with our parser
         # and assume if we can read it, KiCad can too
 
-        parser = SExpressionParser()
         try:
             data = parser.parse_file(schematic_path)
             return True, "Valid"
         except Exception as e:
             return False, str(e)
 
-    def test_validate_empty_schematic(self):
+    def test_validate_empty_schematic(self, parser, tmp_path):
         """Test that KiCad can open an empty schematic."""
-        parser = SExpressionParser()
 
         schematic_data = {
             "version": "20250114",
@@ -60,19 +64,14 @@ class TestKiCadValidation:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
+        temp_file = tmp_path / "test.kicad_sch"
 
-        try:
-            parser.write_file(schematic_data, temp_file)
-            is_valid, error = self._validate_with_kicad(temp_file)
-            assert is_valid, f"KiCad validation failed: {error}"
-        finally:
-            temp_file.unlink()
+        parser.write_file(schematic_data, temp_file)
+        is_valid, error = self._validate_with_kicad(parser, temp_file)
+        assert is_valid, f"KiCad validation failed: {error}"
 
-    def test_validate_wire_schematic(self):
+    def test_validate_wire_schematic(self, parser, tmp_path):
         """Test that KiCad can open a schematic with wires."""
-        parser = SExpressionParser()
 
         schematic_data = {
             "version": "20250114",
@@ -93,19 +92,14 @@ class TestKiCadValidation:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
+        temp_file = tmp_path / "test.kicad_sch"
 
-        try:
-            parser.write_file(schematic_data, temp_file)
-            is_valid, error = self._validate_with_kicad(temp_file)
-            assert is_valid, f"KiCad validation failed: {error}"
-        finally:
-            temp_file.unlink()
+        parser.write_file(schematic_data, temp_file)
+        is_valid, error = self._validate_with_kicad(parser, temp_file)
+        assert is_valid, f"KiCad validation failed: {error}"
 
-    def test_validate_junction_schematic(self):
+    def test_validate_junction_schematic(self, parser, tmp_path):
         """Test that KiCad can open a schematic with junctions."""
-        parser = SExpressionParser()
 
         schematic_data = {
             "version": "20250114",
@@ -126,19 +120,14 @@ class TestKiCadValidation:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
+        temp_file = tmp_path / "test.kicad_sch"
 
-        try:
-            parser.write_file(schematic_data, temp_file)
-            is_valid, error = self._validate_with_kicad(temp_file)
-            assert is_valid, f"KiCad validation failed: {error}"
-        finally:
-            temp_file.unlink()
+        parser.write_file(schematic_data, temp_file)
+        is_valid, error = self._validate_with_kicad(parser, temp_file)
+        assert is_valid, f"KiCad validation failed: {error}"
 
-    def test_validate_label_schematic(self):
+    def test_validate_label_schematic(self, parser, tmp_path):
         """Test that KiCad can open a schematic with labels."""
-        parser = SExpressionParser()
 
         schematic_data = {
             "version": "20250114",
@@ -160,19 +149,14 @@ class TestKiCadValidation:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
+        temp_file = tmp_path / "test.kicad_sch"
 
-        try:
-            parser.write_file(schematic_data, temp_file)
-            is_valid, error = self._validate_with_kicad(temp_file)
-            assert is_valid, f"KiCad validation failed: {error}"
-        finally:
-            temp_file.unlink()
+        parser.write_file(schematic_data, temp_file)
+        is_valid, error = self._validate_with_kicad(parser, temp_file)
+        assert is_valid, f"KiCad validation failed: {error}"
 
-    def test_validate_hierarchical_label_schematic(self):
+    def test_validate_hierarchical_label_schematic(self, parser, tmp_path):
         """Test that KiCad can open a schematic with hierarchical labels."""
-        parser = SExpressionParser()
 
         schematic_data = {
             "version": "20250114",
@@ -196,19 +180,14 @@ class TestKiCadValidation:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
+        temp_file = tmp_path / "test.kicad_sch"
 
-        try:
-            parser.write_file(schematic_data, temp_file)
-            is_valid, error = self._validate_with_kicad(temp_file)
-            assert is_valid, f"KiCad validation failed: {error}"
-        finally:
-            temp_file.unlink()
+        parser.write_file(schematic_data, temp_file)
+        is_valid, error = self._validate_with_kicad(parser, temp_file)
+        assert is_valid, f"KiCad validation failed: {error}"
 
-    def test_validate_text_schematic(self):
+    def test_validate_text_schematic(self, parser, tmp_path):
         """Test that KiCad can open a schematic with text."""
-        parser = SExpressionParser()
 
         schematic_data = {
             "version": "20250114",
@@ -231,19 +210,14 @@ class TestKiCadValidation:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
+        temp_file = tmp_path / "test.kicad_sch"
 
-        try:
-            parser.write_file(schematic_data, temp_file)
-            is_valid, error = self._validate_with_kicad(temp_file)
-            assert is_valid, f"KiCad validation failed: {error}"
-        finally:
-            temp_file.unlink()
+        parser.write_file(schematic_data, temp_file)
+        is_valid, error = self._validate_with_kicad(parser, temp_file)
+        assert is_valid, f"KiCad validation failed: {error}"
 
-    def test_validate_all_elements_combined(self):
+    def test_validate_all_elements_combined(self, parser, tmp_path):
         """Test that KiCad can open a schematic with ALL element types."""
-        parser = SExpressionParser()
 
         schematic_data = {
             "version": "20250114",
@@ -336,32 +310,26 @@ class TestKiCadValidation:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
-
-        try:
-            parser.write_file(schematic_data, temp_file)
-            is_valid, error = self._validate_with_kicad(temp_file)
-            assert is_valid, f"KiCad validation failed: {error}"
-
-            # Also verify we can read it back
-            read_data = parser.parse_file(temp_file)
-            assert len(read_data.get("wires", [])) == 1
-            assert len(read_data.get("junctions", [])) == 1
-            assert len(read_data.get("labels", [])) == 1
-            assert len(read_data.get("hierarchical_labels", [])) == 1
-            assert len(read_data.get("no_connects", [])) == 1
-            assert len(read_data.get("texts", [])) == 1
-            assert len(read_data.get("polylines", [])) == 1
-            assert len(read_data.get("circles", [])) == 1
-            assert len(read_data.get("rectangles", [])) == 1
-
-        finally:
-            temp_file.unlink()
-
-    def test_special_characters_in_text(self):
+        temp_file = tmp_path / "test.kicad_sch"
+
+        parser.write_file(schematic_data, temp_file)
+        is_valid, error = self._validate_with_kicad(parser, temp_file)
+        assert is_valid, f"KiCad validation failed: {error}"
+
+        # Also verify we can read it back
+        read_data = parser.parse_file(temp_file)
+        assert len(read_data.get("wires", [])) == 1
+        assert len(read_data.get("junctions", [])) == 1
+        assert len(read_data.get("labels", [])) == 1
+        assert len(read_data.get("hierarchical_labels", [])) == 1
+        assert len(read_data.get("no_connects", [])) == 1
+        assert len(read_data.get("texts", [])) == 1
+        assert len(read_data.get("polylines", [])) == 1
+        assert len(read_data.get("circles", [])) == 1
+        assert len(read_data.get("rectangles", [])) == 1
+
+    def test_special_characters_in_text(self, parser, tmp_path):
         """Test S-expression escaping for special characters."""
-        parser = SExpressionParser()
 
         # Test various special characters that need proper escaping
         test_strings = [
@@ -401,21 +369,17 @@ class TestKiCadValidation:
                 "embedded_fonts": "no",
             }
 
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-                temp_file = Path(f.name)
-
-            try:
-                parser.write_file(schematic_data, temp_file)
-                is_valid, error = self._validate_with_kicad(temp_file)
-                assert is_valid, f"KiCad validation failed for '{test_string}': {error}"
-
-                # Verify text is preserved correctly
-                read_data = parser.parse_file(temp_file)
-                assert (
-                    read_data["texts"][0]["text"] == test_string
-                ), f"Text not preserved: '{test_string}' != '{read_data['texts'][0]['text']}'"
-            finally:
-                temp_file.unlink()
+            temp_file = tmp_path / "test.kicad_sch"
+
+            parser.write_file(schematic_data, temp_file)
+            is_valid, error = self._validate_with_kicad(parser, temp_file)
+            assert is_valid, f"KiCad validation failed for '{test_string}': {error}"
+
+            # Verify text is preserved correctly
+            read_data = parser.parse_file(temp_file)
+            assert (
+                read_data["texts"][0]["text"] == test_string
+            ), f"Text not preserved: '{test_string}' != '{read_data['texts'][0]['text']}'"
 
 
 if __name__ == "__main__":
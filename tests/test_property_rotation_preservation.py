@@ -6,13 +6,11 @@ This tests Issue #74 - property rotations should not be reset to 0°.
 """
 
 import re
-import tempfile
-from pathlib import Path
 
 import kicad_sch_api as ksa
 
 
-def test_property_rotation_preservation():
+def test_property_rotation_preservation(tmp_path):
     """Test that property rotations are preserved through load/save."""
 
     # Create a test schematic with rotated properties
@@ -193,58 +191,86 @@ def test_property_rotation_preservation():
 """
 
     # Create temp file with the test schematic
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-        f.write(test_schematic)
-        temp_path = f.name
+    temp_path = tmp_path / "test.kicad_sch"
+    temp_path.write_text(test_schematic)
 
-    try:
-        # Extract original rotations
-        ref_rot_before = extract_property_rotation(test_schematic, "Reference")
-        val_rot_before = extract_property_rotation(test_schematic, "Value")
+    # Extract original rotations
+    ref_rot_before = extract_property_rotation(test_schematic, "Reference")
+    val_rot_before = extract_property_rotation(test_schematic, "Value")
 
-        # Load and save
-        sch = ksa.Schematic.load(temp_path)
-        sch.save(temp_path)
+    # Load and save
+    sch = ksa.Schematic.load(temp_path)
+    sch.save(temp_path)
 
-        # Read saved content
-        with open(temp_path) as f:
-            saved_content = f.read()
+    # Read saved content
+    with open(temp_path) as f:
+        saved_content = f.read()
 
-        # Extract rotations after save
-        ref_rot_after = extract_property_rotation(saved_content, "Reference")
-        val_rot_after = extract_property_rotation(saved_content, "Value")
+    # Extract rotations after save
+    ref_rot_after = extract_property_rotation(saved_content, "Reference")
+    val_rot_after = extract_property_rotation(saved_content, "Value")
 
-        # Check if rotations were preserved
-        assert (
-            ref_rot_before == ref_rot_after
-        ), f"Reference rotation changed from {ref_rot_before}° to {ref_rot_after}°"
-        assert (
-            val_rot_before == val_rot_after
-        ), f"Value rotation changed from {val_rot_before}° to {val_rot_after}°"
+    # Check if rotations were preserved
+    assert (
+        ref_rot_before == ref_rot_after
+    ), f"Reference rotation changed from {ref_rot_before}° to {ref_rot_after}°"
+    assert (
+        val_rot_before == val_rot_after
+    ), f"Value rotation changed from {val_rot_before}° to {val_rot_after}°"
 
-    finally:
-        # Cleanup
-        Path(temp_path).unlink(missing_ok=True)
+
+# Quoted strings (which may contain parens) or a single paren
+_SEXP_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[()]')
+
+
+def _match_paren(content: str, open_idx: int) -> int:
+    """Return the index of the ')' closing the '(' at open_idx, or -1 if unbalanced."""
+    depth = 0
+    for match in _SEXP_TOKEN_RE.finditer(content, open_idx):
+        token = match.group()
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+            if depth == 0:
+                return match.start()
+    return -1
+
+
+def _first_symbol_instance_span(content: str) -> tuple[int, int]:
+    """Locate the first top-level symbol instance after lib_symbols without copying content."""
+    lib_symbols = content.find("(lib_symbols")
+    if lib_symbols == -1:
+        return -1, -1
+
+    # Skip the whole lib_symbols block, then bound the instance by its own closing paren
+    lib_symbols_end = _match_paren(content, lib_symbols)
+    start = content.find("\n\t(symbol", lib_symbols_end)
+    if lib_symbols_end == -1 or start == -1:
+        return -1, -1
+
+    end = _match_paren(content, start + 2)
+    return start, end + 1 if end != -1 else len(content)
 
 
 def extract_property_rotation(content: str, prop_name: str) -> int:
     """Extract rotation angle from a property in S-expression format."""
-    # First, find the symbol instance (not lib_symbols)
-    # Look for the section after lib_symbols
-    parts = content.split("(lib_symbols")
-    if len(parts) < 2:
+    # Only search the component instance, not the lib_symbols definition
+    start, end = _first_symbol_instance_span(content)
+    if start == -1:
         return 0
 
-    # Get the part after lib_symbols section ends
-    after_lib_symbols = parts[1].split("\n\t(symbol")[1] if "\n\t(symbol" in parts[1] else ""
-
-    # Now search for the property in the component instance
-    pattern = rf'\(property "{prop_name}"[^)]*?"([^"]*)"[^)]*?\(at\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)'
-    match = re.search(pattern, after_lib_symbols, re.DOTALL)
+    pattern = re.compile(
+        rf'\(property "{prop_name}"[^)]*?"([^"]*)"[^)]*?\(at\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)',
+        re.DOTALL,
+    )
+    match = pattern.search(content, start, end)
     if match:
         return int(float(match.group(4)))
     return 0  # Default if not found
 
 
 if __name__ == "__main__":
-    test_property_rotation_preservation()
+    import pytest
+
+    pytest.main([__file__, "-v"])
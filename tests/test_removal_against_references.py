@@ -6,44 +6,46 @@ This validates that removal operations produce output that exactly matches
 KiCAD reference files, ensuring professional-grade format preservation.
 """
 
-import tempfile
 from pathlib import Path
 
 import pytest
 
 import kicad_sch_api as ksa
 
+REFERENCE_DIR = Path(__file__).parent / "reference_tests" / "reference_kicad_projects"
+
 
 class TestRemovalAgainstReferences:
     """Test removal operations against KiCAD reference files."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.test_dir = Path(__file__).parent / "reference_tests"
-        self.reference_dir = self.test_dir / "reference_kicad_projects"
+    def _compare_schematics(self, generated: str, reference_path: Path) -> tuple[str, str]:
+        """
+        Compare generated schematic content with a reference file.
+
+        The reference is read once and serves both the exact and the
+        UUID-insensitive comparison; the diff is only rendered if both fail.
 
-    def _compare_schematics(self, generated_path: Path, reference_path: Path) -> tuple[bool, str]:
-        """Compare two schematic files for exact match."""
-        with open(generated_path, "r") as f:
-            generated = f.read()
-        with open(reference_path, "r") as f:
-            reference = f.read()
+        Returns:
+            (match, diff_output) where match is "identical", "equivalent"
+            (only UUIDs differ) or "different"
+        """
+        reference = reference_path.read_text(encoding="utf-8")
 
         if generated == reference:
-            return True, ""
+            return "identical", ""
+        if self._normalize_for_comparison(generated) == self._normalize_for_comparison(reference):
+            return "equivalent", ""
 
         # Generate diff for debugging
         import difflib
 
-        diff = "\n".join(
-            difflib.unified_diff(
-                reference.splitlines(keepends=True),
-                generated.splitlines(keepends=True),
-                fromfile=str(reference_path),
-                tofile=str(generated_path),
-            )
+        diff = difflib.unified_diff(
+            reference.splitlines(keepends=True),
+            generated.splitlines(keepends=True),
+            fromfile=str(reference_path),
+            tofile="generated",
         )
-        return False, diff
+        return "different", "".join(diff)
 
     def _normalize_for_comparison(self, content: str) -> str:
         """Normalize content for semantic comparison (ignoring UUIDs)."""
@@ -55,9 +57,9 @@ class TestRemovalAgainstReferences:
         )
         return normalized
 
-    def test_single_resistor_to_blank(self):
+    def test_single_resistor_to_blank(self, tmp_path):
         """Test: single_resistor → remove R1 → should match blank_schematic."""
-        blank_ref = self.reference_dir / "blank_schematic" / "blank_schematic.kicad_sch"
+        blank_ref = REFERENCE_DIR / "blank_schematic" / "blank_schematic.kicad_sch"
         assert blank_ref.exists(), "blank_schematic reference not found"
 
         # Create schematic with resistor
@@ -78,36 +80,25 @@ class TestRemovalAgainstReferences:
         assert len(sch.components) == 0, "Should have 0 components after removal"
 
         # Save to temp file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_path = Path(f.name)
-        sch.save(temp_path)
-
-        # Compare with blank reference
-        is_identical, diff = self._compare_schematics(temp_path, blank_ref)
-
-        if not is_identical:
-            # Try semantic comparison
-            with open(temp_path, "r") as f:
-                gen_normalized = self._normalize_for_comparison(f.read())
-            with open(blank_ref, "r") as f:
-                ref_normalized = self._normalize_for_comparison(f.read())
-
-            if gen_normalized == ref_normalized:
-                print("✅ Semantically equivalent to blank_schematic (UUIDs differ)")
-            else:
-                print("❌ Generated blank schematic differs from reference")
-                print("Diff output:")
-                print(diff[:2000])
-                pytest.fail("Generated blank schematic differs from reference")
+        temp_path = tmp_path / "test.kicad_sch"
+        generated = sch.save(temp_path)
+
+        # Compare with blank reference, falling back to semantic comparison
+        match, diff = self._compare_schematics(generated, blank_ref)
+
+        if match == "different":
+            print("❌ Generated blank schematic differs from reference")
+            print("Diff output:")
+            print(diff[:2000])
+            pytest.fail("Generated blank schematic differs from reference")
+        elif match == "equivalent":
+            print("✅ Semantically equivalent to blank_schematic (UUIDs differ)")
         else:
             print("✅ Exact match with blank_schematic reference")
 
-        # Clean up
-        temp_path.unlink()
-
-    def test_two_resistors_remove_one_matches_single(self):
+    def test_two_resistors_remove_one_matches_single(self, tmp_path):
         """Test: two_resistors → remove R2 → should match single_resistor."""
-        single_resistor_ref = self.reference_dir / "single_resistor" / "single_resistor.kicad_sch"
+        single_resistor_ref = REFERENCE_DIR / "single_resistor" / "single_resistor.kicad_sch"
         assert single_resistor_ref.exists(), "single_resistor reference not found"
 
         # Create schematic with two resistors using single_resistor reference data as target
@@ -154,32 +145,22 @@ class TestRemovalAgainstReferences:
         ), "Device:R lib_symbol should remain since R1 still uses it"
 
         # Save and compare with single_resistor reference
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_path = Path(f.name)
-        sch.save(temp_path)
-
-        is_identical, diff = self._compare_schematics(temp_path, single_resistor_ref)
-
-        if not is_identical:
-            # Try semantic comparison (ignoring UUIDs in symbol pins)
-            with open(temp_path, "r") as f:
-                gen_normalized = self._normalize_for_comparison(f.read())
-            with open(single_resistor_ref, "r") as f:
-                ref_normalized = self._normalize_for_comparison(f.read())
-
-            if gen_normalized == ref_normalized:
-                print("✅ Semantically equivalent to single_resistor (pin UUIDs differ)")
-            else:
-                print("❌ Generated schematic differs from single_resistor reference")
-                print("Diff output:")
-                print(diff[:2000])
-                pytest.fail("Generated schematic differs from single_resistor reference")
+        temp_path = tmp_path / "test.kicad_sch"
+        generated = sch.save(temp_path)
+
+        # Falls back to semantic comparison (ignoring UUIDs in symbol pins)
+        match, diff = self._compare_schematics(generated, single_resistor_ref)
+
+        if match == "different":
+            print("❌ Generated schematic differs from single_resistor reference")
+            print("Diff output:")
+            print(diff[:2000])
+            pytest.fail("Generated schematic differs from single_resistor reference")
+        elif match == "equivalent":
+            print("✅ Semantically equivalent to single_resistor (pin UUIDs differ)")
         else:
             print("✅ Exact match with single_resistor reference")
 
-        # Clean up
-        temp_path.unlink()
-
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
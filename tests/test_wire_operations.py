@@ -10,7 +10,6 @@ Tests wire functionality including:
 """
 
 import sys
-import tempfile
 import uuid
 from pathlib import Path
 
@@ -25,7 +24,7 @@ from kicad_sch_api.core.parser import SExpressionParser
 class TestWireOperations:
     """Test suite for wire creation, reading, modification, and preservation."""
 
-    def test_create_single_wire(self):
+    def test_create_single_wire(self, tmp_path):
         """Test creating a single wire segment."""
         parser = SExpressionParser()
 
@@ -48,31 +47,26 @@ class TestWireOperations:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
+        temp_file = tmp_path / "test.kicad_sch"
 
-        try:
-            # Write schematic
-            parser.write_file(schematic_data, temp_file)
+        # Write schematic
+        parser.write_file(schematic_data, temp_file)
 
-            # Read it back
-            read_data = parser.parse_file(temp_file)
+        # Read it back
+        read_data = parser.parse_file(temp_file)
 
-            # Verify wire was preserved
-            assert "wires" in read_data, "Wires field missing in parsed data"
-            assert len(read_data["wires"]) == 1, f"Expected 1 wire, got {len(read_data['wires'])}"
+        # Verify wire was preserved
+        assert "wires" in read_data, "Wires field missing in parsed data"
+        assert len(read_data["wires"]) == 1, f"Expected 1 wire, got {len(read_data['wires'])}"
 
-            wire = read_data["wires"][0]
-            assert len(wire["points"]) == 2, "Wire should have 2 points"
-            assert wire["points"][0]["x"] == 50
-            assert wire["points"][0]["y"] == 50
-            assert wire["points"][1]["x"] == 100
-            assert wire["points"][1]["y"] == 50
+        wire = read_data["wires"][0]
+        assert len(wire["points"]) == 2, "Wire should have 2 points"
+        assert wire["points"][0]["x"] == 50
+        assert wire["points"][0]["y"] == 50
+        assert wire["points"][1]["x"] == 100
+        assert wire["points"][1]["y"] == 50
 
-        finally:
-            temp_file.unlink()
-
-    def test_create_multiple_wires(self):
+    def test_create_multiple_wires(self, tmp_path):
         """Test creating multiple connected wire segments."""
         parser = SExpressionParser()
 
@@ -107,42 +101,37 @@ class TestWireOperations:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
-
-        try:
-            # Write schematic
-            parser.write_file(schematic_data, temp_file)
+        temp_file = tmp_path / "test.kicad_sch"
 
-            # Read it back
-            read_data = parser.parse_file(temp_file)
+        # Write schematic
+        parser.write_file(schematic_data, temp_file)
 
-            # Verify all wires were preserved
-            assert "wires" in read_data
-            assert len(read_data["wires"]) == 3, f"Expected 3 wires, got {len(read_data['wires'])}"
+        # Read it back
+        read_data = parser.parse_file(temp_file)
 
-            # Verify wire 1 (horizontal)
-            assert read_data["wires"][0]["points"][0]["x"] == 50
-            assert read_data["wires"][0]["points"][0]["y"] == 50
-            assert read_data["wires"][0]["points"][1]["x"] == 100
-            assert read_data["wires"][0]["points"][1]["y"] == 50
+        # Verify all wires were preserved
+        assert "wires" in read_data
+        assert len(read_data["wires"]) == 3, f"Expected 3 wires, got {len(read_data['wires'])}"
 
-            # Verify wire 2 (vertical)
-            assert read_data["wires"][1]["points"][0]["x"] == 100
-            assert read_data["wires"][1]["points"][0]["y"] == 50
-            assert read_data["wires"][1]["points"][1]["x"] == 100
-            assert read_data["wires"][1]["points"][1]["y"] == 100
+        # Verify wire 1 (horizontal)
+        assert read_data["wires"][0]["points"][0]["x"] == 50
+        assert read_data["wires"][0]["points"][0]["y"] == 50
+        assert read_data["wires"][0]["points"][1]["x"] == 100
+        assert read_data["wires"][0]["points"][1]["y"] == 50
 
-            # Verify wire 3 (horizontal)
-            assert read_data["wires"][2]["points"][0]["x"] == 100
-            assert read_data["wires"][2]["points"][0]["y"] == 100
-            assert read_data["wires"][2]["points"][1]["x"] == 150
-            assert read_data["wires"][2]["points"][1]["y"] == 100
+        # Verify wire 2 (vertical)
+        assert read_data["wires"][1]["points"][0]["x"] == 100
+        assert read_data["wires"][1]["points"][0]["y"] == 50
+        assert read_data["wires"][1]["points"][1]["x"] == 100
+        assert read_data["wires"][1]["points"][1]["y"] == 100
 
-        finally:
-            temp_file.unlink()
+        # Verify wire 3 (horizontal)
+        assert read_data["wires"][2]["points"][0]["x"] == 100
+        assert read_data["wires"][2]["points"][0]["y"] == 100
+        assert read_data["wires"][2]["points"][1]["x"] == 150
+        assert read_data["wires"][2]["points"][1]["y"] == 100
 
-    def test_modify_wire_positions(self):
+    def test_modify_wire_positions(self, tmp_path):
         """Test modifying wire positions (round-trip with modification)."""
         parser = SExpressionParser()
 
@@ -166,38 +155,33 @@ class TestWireOperations:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
+        temp_file = tmp_path / "test.kicad_sch"
 
-        try:
-            # Write initial schematic
-            parser.write_file(schematic_data, temp_file)
+        # Write initial schematic
+        parser.write_file(schematic_data, temp_file)
 
-            # Read it back
-            read_data = parser.parse_file(temp_file)
+        # Read it back
+        read_data = parser.parse_file(temp_file)
 
-            # Modify wire position (move +50 in X, +30 in Y)
-            read_data["wires"][0]["points"][0]["x"] = 100
-            read_data["wires"][0]["points"][0]["y"] = 80
-            read_data["wires"][0]["points"][1]["x"] = 150
-            read_data["wires"][0]["points"][1]["y"] = 80
+        # Modify wire position (move +50 in X, +30 in Y)
+        read_data["wires"][0]["points"][0]["x"] = 100
+        read_data["wires"][0]["points"][0]["y"] = 80
+        read_data["wires"][0]["points"][1]["x"] = 150
+        read_data["wires"][0]["points"][1]["y"] = 80
 
-            # Write modified schematic
-            parser.write_file(read_data, temp_file)
+        # Write modified schematic
+        parser.write_file(read_data, temp_file)
 
-            # Read again to verify modification persisted
-            final_data = parser.parse_file(temp_file)
+        # Read again to verify modification persisted
+        final_data = parser.parse_file(temp_file)
 
-            # Verify modified positions
-            assert final_data["wires"][0]["points"][0]["x"] == 100
-            assert final_data["wires"][0]["points"][0]["y"] == 80
-            assert final_data["wires"][0]["points"][1]["x"] == 150
-            assert final_data["wires"][0]["points"][1]["y"] == 80
+        # Verify modified positions
+        assert final_data["wires"][0]["points"][0]["x"] == 100
+        assert final_data["wires"][0]["points"][0]["y"] == 80
+        assert final_data["wires"][0]["points"][1]["x"] == 150
+        assert final_data["wires"][0]["points"][1]["y"] == 80
 
-        finally:
-            temp_file.unlink()
-
-    def test_wire_uuid_preservation(self):
+    def test_wire_uuid_preservation(self, tmp_path):
         """Test that wire UUIDs are preserved during round-trip."""
         parser = SExpressionParser()
 
@@ -222,26 +206,21 @@ class TestWireOperations:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
-
-        try:
-            # Write schematic
-            parser.write_file(schematic_data, temp_file)
+        temp_file = tmp_path / "test.kicad_sch"
 
-            # Read it back
-            read_data = parser.parse_file(temp_file)
+        # Write schematic
+        parser.write_file(schematic_data, temp_file)
 
-            # Verify UUID is preserved
-            assert "uuid" in read_data["wires"][0], "Wire UUID not preserved"
-            assert (
-                read_data["wires"][0]["uuid"] == wire_uuid
-            ), f"Wire UUID changed: {read_data['wires'][0]['uuid']} != {wire_uuid}"
+        # Read it back
+        read_data = parser.parse_file(temp_file)
 
-        finally:
-            temp_file.unlink()
+        # Verify UUID is preserved
+        assert "uuid" in read_data["wires"][0], "Wire UUID not preserved"
+        assert (
+            read_data["wires"][0]["uuid"] == wire_uuid
+        ), f"Wire UUID changed: {read_data['wires'][0]['uuid']} != {wire_uuid}"
 
-    def test_wire_stroke_properties(self):
+    def test_wire_stroke_properties(self, tmp_path):
         """Test that wire stroke properties are preserved."""
         parser = SExpressionParser()
 
@@ -264,29 +243,20 @@ class TestWireOperations:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
+        temp_file = tmp_path / "test.kicad_sch"
 
-        try:
-            # Write schematic
-            parser.write_file(schematic_data, temp_file)
+        # Write schematic
+        parser.write_file(schematic_data, temp_file)
 
-            # Read it back
-            read_data = parser.parse_file(temp_file)
+        # Read it back
+        read_data = parser.parse_file(temp_file)
 
-            # Verify stroke properties
-            wire = read_data["wires"][0]
-            assert (
-                wire["stroke_width"] == 0.5
-            ), f"Stroke width not preserved: {wire['stroke_width']}"
-            assert (
-                wire["stroke_type"] == "dash"
-            ), f"Stroke type not preserved: {wire['stroke_type']}"
+        # Verify stroke properties
+        wire = read_data["wires"][0]
+        assert wire["stroke_width"] == 0.5, f"Stroke width not preserved: {wire['stroke_width']}"
+        assert wire["stroke_type"] == "dash", f"Stroke type not preserved: {wire['stroke_type']}"
 
-        finally:
-            temp_file.unlink()
-
-    def test_empty_wires_list(self):
+    def test_empty_wires_list(self, tmp_path):
         """Test schematic with no wires."""
         parser = SExpressionParser()
 
@@ -302,24 +272,19 @@ class TestWireOperations:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
-
-        try:
-            # Write schematic
-            parser.write_file(schematic_data, temp_file)
+        temp_file = tmp_path / "test.kicad_sch"
 
-            # Read it back
-            read_data = parser.parse_file(temp_file)
+        # Write schematic
+        parser.write_file(schematic_data, temp_file)
 
-            # Verify wires list exists but is empty
-            assert "wires" in read_data, "Wires field missing"
-            assert len(read_data["wires"]) == 0, "Expected empty wires list"
+        # Read it back
+        read_data = parser.parse_file(temp_file)
 
-        finally:
-            temp_file.unlink()
+        # Verify wires list exists but is empty
+        assert "wires" in read_data, "Wires field missing"
+        assert len(read_data["wires"]) == 0, "Expected empty wires list"
 
-    def test_wire_with_decimal_coordinates(self):
+    def test_wire_with_decimal_coordinates(self, tmp_path):
         """Test wires with decimal/floating-point coordinates."""
         parser = SExpressionParser()
 
@@ -342,25 +307,20 @@ class TestWireOperations:
             "embedded_fonts": "no",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".kicad_sch", delete=False) as f:
-            temp_file = Path(f.name)
-
-        try:
-            # Write schematic
-            parser.write_file(schematic_data, temp_file)
+        temp_file = tmp_path / "test.kicad_sch"
 
-            # Read it back
-            read_data = parser.parse_file(temp_file)
+        # Write schematic
+        parser.write_file(schematic_data, temp_file)
 
-            # Verify decimal coordinates are preserved
-            wire = read_data["wires"][0]
-            assert abs(wire["points"][0]["x"] - 50.5) < 0.001
-            assert abs(wire["points"][0]["y"] - 50.25) < 0.001
-            assert abs(wire["points"][1]["x"] - 100.75) < 0.001
-            assert abs(wire["points"][1]["y"] - 50.125) < 0.001
+        # Read it back
+        read_data = parser.parse_file(temp_file)
 
-        finally:
-            temp_file.unlink()
+        # Verify decimal coordinates are preserved
+        wire = read_data["wires"][0]
+        assert abs(wire["points"][0]["x"] - 50.5) < 0.001
+        assert abs(wire["points"][0]["y"] - 50.25) < 0.001
+        assert abs(wire["points"][1]["x"] - 100.75) < 0.001
+        assert abs(wire["points"][1]["y"] - 50.125) < 0.001
 
 
 if __name__ == "__main__":
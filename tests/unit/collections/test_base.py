@@ -357,6 +357,23 @@ class TestBaseCollection:
         assert len(empty_collection) == 1
         assert empty_collection.is_modified is True
 
+    def test_add_keeps_current_indexes_current(self, populated_collection):
+        """Test add() extends current indexes instead of forcing a rebuild."""
+        populated_collection.get("uuid1")  # Build indexes
+        item = MockItem(uuid="uuid4", reference="R3", value="1k")
+        populated_collection.add(item)
+
+        assert populated_collection._index_registry.is_dirty() is False
+        assert populated_collection.get("uuid4") is item
+
+        # Incrementally maintained indexes match a full rebuild
+        incremental = {
+            name: dict(index)
+            for name, index in populated_collection._index_registry.indexes.items()
+        }
+        populated_collection._rebuild_indexes()
+        assert populated_collection._index_registry.indexes == incremental
+
     def test_add_duplicate_uuid_raises_error(self, populated_collection):
         """Test adding item with duplicate UUID raises error."""
         duplicate = MockItem(uuid="uuid1", reference="R99", value="1k")
@@ -364,6 +381,27 @@ class TestBaseCollection:
         with pytest.raises(ValueError, match="Item with UUID uuid1 already exists"):
             populated_collection.add(duplicate)
 
+    def test_add_duplicate_unique_key_leaves_collection_unchanged(self, populated_collection):
+        """Test a duplicate key in another unique index rolls the add back."""
+        populated_collection.get("uuid1")  # Build indexes
+        populated_collection.mark_clean()
+        duplicate = MockItem(uuid="uuid4", reference="R1", value="1k")
+
+        with pytest.raises(ValueError, match="Duplicate key 'R1' in unique index 'reference'"):
+            populated_collection.add(duplicate)
+
+        assert len(populated_collection) == 3
+        assert populated_collection.get("uuid4") is None
+        assert populated_collection.is_modified is False
+
+        # The indexes still match the items
+        indexes = {
+            name: dict(index)
+            for name, index in populated_collection._index_registry.indexes.items()
+        }
+        populated_collection._rebuild_indexes()
+        assert populated_collection._index_registry.indexes == indexes
+
     def test_add_none_item_with_validation_raises_error(self, empty_collection):
         """Test adding None item with validation raises error."""
         with pytest.raises(ValueError, match="Cannot add None item"):
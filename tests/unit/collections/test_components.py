@@ -188,6 +188,105 @@ class TestComponentCollection:
         assert "Connector:Conn_01x04" in error_msg
         assert "Common libraries" in error_msg or "Connector_Generic" in error_msg
 
+    @patch("kicad_sch_api.collections.components.get_symbol_cache")
+    def test_add_many(self, mock_get_cache):
+        """Test adding several components in one call."""
+        mock_symbol = MagicMock(pins=[], units=1, reference_prefix="R")
+        mock_get_cache.return_value.get_symbol.return_value = mock_symbol
+
+        collection = ComponentCollection()
+
+        components = collection.add_many(
+            [
+                {"lib_id": "Device:R", "reference": "R1", "value": "10k", "position": (100, 100)},
+                {
+                    "lib_id": "Device:R",
+                    "reference": "R2",
+                    "value": "1k",
+                    "position": (120, 100),
+                    "properties": {"Tolerance": "1%"},
+                },
+            ]
+        )
+
+        assert [c.reference for c in components] == ["R1", "R2"]
+        assert len(collection) == 2
+        assert collection.get("R2") is components[1]
+        assert components[1].get_property("Tolerance") == "1%"
+        # Both specs share one lib_id, so the library is only consulted once
+        mock_get_cache.return_value.get_symbol.assert_called_once_with("Device:R")
+
+    @patch("kicad_sch_api.collections.components.get_symbol_cache")
+    def test_add_validates_existing_units_of_reference(self, mock_get_cache):
+        """Test adding a unit checks the other units sharing its reference."""
+        mock_get_cache.return_value.get_symbol.return_value = MagicMock(
+            pins=[], units=2, reference_prefix="U"
+        )
+        collection = ComponentCollection(
+            [
+                SchematicSymbol(
+                    uuid="uuid1",
+                    lib_id="Amplifier_Operational:TL072",
+                    reference="U1",
+                    position=Point(100, 100),
+                    unit=1,
+                ),
+                SchematicSymbol(
+                    uuid="uuid2",
+                    lib_id="Device:R",
+                    reference="U10",
+                    position=Point(150, 100),
+                ),
+            ]
+        )
+
+        with pytest.raises(ValidationError, match="Unit 1 of reference 'U1' already exists"):
+            collection.add("Amplifier_Operational:TL072", "U1", position=(100, 150), unit=1)
+        with pytest.raises(ValidationError, match="different lib_id"):
+            collection.add("Device:R", "U1", position=(100, 150), unit=2)
+
+        unit2 = collection.add("Amplifier_Operational:TL072", "U1", position=(100, 150), unit=2)
+        assert collection._get_all_by_reference("U1") == [collection.get("U1"), unit2]
+
+    @patch("kicad_sch_api.collections.components.get_symbol_cache")
+    def test_add_from(self, mock_get_cache):
+        """Test copying a component from another schematic's collection."""
+        mock_get_cache.return_value.get_symbol.return_value = None
+        definition = ["symbol", "Device:R"]
+        source_sch = MagicMock(_data={"lib_symbols": {"Device:R": definition}})
+        target_sch = MagicMock(_data={"lib_symbols": {}}, _hierarchy_path=None)
+        source = ComponentCollection(
+            [
+                SchematicSymbol(
+                    uuid="uuid1",
+                    lib_id="Device:R",
+                    reference="R1",
+                    value="10k",
+                    position=Point(100, 100),
+                    properties={"Tolerance": "1%"},
+                )
+            ],
+            parent_schematic=source_sch,
+        )
+        collection = ComponentCollection(parent_schematic=target_sch)
+
+        copy = collection.add_from(source.get("R1"))
+        moved = collection.add_from(source.get("R1"), reference="R2", position=(120, 100))
+
+        assert copy.reference == "R1"
+        assert copy.value == "10k"
+        assert copy.position == Point(100, 100)
+        assert copy.get_property("Tolerance") == "1%"
+        assert copy.uuid != "uuid1"
+        assert moved.reference == "R2"
+        assert moved.position == Point(120, 100)
+        # The copy shares no mutable state with the source
+        assert target_sch._data["lib_symbols"]["Device:R"] == definition
+        assert target_sch._data["lib_symbols"]["Device:R"] is not definition
+        assert copy._data.pins is not source.get("R1")._data.pins
+        copy.set_property("Tolerance", "5%")
+        assert source.get("R1").get_property("Tolerance") == "1%"
+
     def test_get(self):
         """Test getting components by reference."""
         symbol_data = SchematicSymbol(
@@ -240,6 +339,29 @@ class TestComponentCollection:
         none_found = collection.filter(lib_id="NonExistent")
         assert len(none_found) == 0
 
+    def test_filter_by_lib_id_follows_collection_order(self):
+        """Test lib_id filtering keeps collection order after a sort and combines criteria."""
+        symbol_data = [
+            SchematicSymbol(
+                uuid=f"uuid{i}",
+                lib_id="Device:C" if i % 3 == 0 else "Device:R",
+                reference=f"R{10 - i}",
+                value="10k" if i % 2 else "1k",
+                position=Point(100 * i, 100),
+            )
+            for i in range(1, 9)
+        ]
+        collection = ComponentCollection(symbol_data)
+
+        def references(**criteria):
+            return [c.reference for c in collection.filter(**criteria)]
+
+        assert references(lib_id="Device:R") == ["R9", "R8", "R6", "R5", "R3", "R2"]
+
+        collection.sort_by_reference()
+        assert references(lib_id="Device:R") == ["R2", "R3", "R5", "R6", "R8", "R9"]
+        assert references(lib_id="Device:R", value="10k") == ["R3", "R5", "R9"]
+
     def test_get_by_value(self):
         """Test getting components by value."""
         symbol_data = [
@@ -436,6 +558,20 @@ class TestComponent:
         with pytest.raises(ValidationError, match="Invalid reference format"):
             component.reference = "Invalid Ref"
 
+    def test_collections_do_not_share_validator_state(self):
+        """Test validating a component in one collection leaves another's issues alone."""
+        symbol_data = SchematicSymbol(
+            uuid="uuid1", lib_id="Device:R", reference="1R", value="10k", position=Point(100, 100)
+        )
+        first = ComponentCollection([symbol_data])
+        second = ComponentCollection()
+
+        issues = first.get_by_uuid("uuid1").validate()
+
+        assert issues
+        assert first._validator is not second._validator
+        assert second._validator.issues == []
+
     def test_component_set_value(self):
         """Test setting component value."""
         symbol_data = SchematicSymbol(
@@ -497,6 +633,30 @@ class TestComponent:
         assert component.get_property("Tolerance") == "1%"
         assert collection.is_modified
 
+    def test_component_update_properties(self):
+        """Test setting several properties in one call."""
+        symbol_data = SchematicSymbol(
+            uuid="uuid1",
+            lib_id="Device:R",
+            reference="R1",
+            value="10k",
+            position=Point(100, 100),
+            properties={"MPN": "RC0603FR-0710KL"},
+            hidden_properties={"MPN"},
+        )
+        collection = ComponentCollection()
+        component = Component(symbol_data, collection)
+
+        component.update_properties({"MPN": "ERJ-3EKF1002V", "Tolerance": "1%"})
+        assert component.properties == {"MPN": "ERJ-3EKF1002V", "Tolerance": "1%"}
+        assert component.hidden_properties == {"MPN"}
+        assert collection.is_modified
+
+        # Invalid pairs are rejected before anything is applied
+        with pytest.raises(ValidationError):
+            component.update_properties({"Datasheet": "~", "Power": 0.1})
+        assert "Datasheet" not in component.properties
+
     def test_component_repr(self):
         """Test component string representation."""
         symbol_data = SchematicSymbol(
@@ -0,0 +1,39 @@
+"""Unit tests for ValidationManager summaries."""
+
+from kicad_sch_api.core.managers.validation import ValidationManager
+from kicad_sch_api.utils.validation import ValidationIssue
+
+
+def _issues():
+    return [
+        ValidationIssue(category="reference", level="error", message="Duplicate R1"),
+        ValidationIssue(category="reference", level="error", message="Duplicate R2"),
+        ValidationIssue(category="connectivity", level="warning", message="Dangling wire"),
+        ValidationIssue(category="metadata", level="info", message="No title"),
+    ]
+
+
+def test_validation_summary_counts_levels_and_categories():
+    """Summary counts match the issue levels (enum-valued) and categories."""
+    manager = ValidationManager({}, [], [])
+
+    summary = manager.get_validation_summary(_issues())
+
+    assert summary["total_issues"] == 4
+    assert summary["error_count"] == 2
+    assert summary["warning_count"] == 1
+    assert summary["info_count"] == 1
+    assert summary["categories"] == {"reference": 2, "connectivity": 1, "metadata": 1}
+    assert summary["severity"] == "error"
+
+
+def test_validation_summary_without_issues():
+    """An empty issue list summarizes as info severity."""
+    manager = ValidationManager({}, [], [])
+
+    summary = manager.get_validation_summary([])
+
+    assert summary["total_issues"] == 0
+    assert summary["error_count"] == 0
+    assert summary["categories"] == {}
+    assert summary["severity"] == "info"
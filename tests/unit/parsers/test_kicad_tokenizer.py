@@ -0,0 +1,108 @@
+"""
+Unit tests for the KiCAD-subset S-expression tokenizer used by SExpressionParser.
+"""
+
+import math
+
+import pytest
+import sexpdata
+
+from kicad_sch_api.core._symbols import AT, SYMBOL, YES
+from kicad_sch_api.core.parser import SExpressionParser, _loads_kicad, _UnsupportedSyntax
+from kicad_sch_api.utils.validation import ValidationError
+
+
+def _same_tree(a, b):
+    """Structural equality that also requires identical types (1 != 1.0, Symbol != str)."""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_same_tree(x, y) for x, y in zip(a, b))
+    if isinstance(a, float) and math.isnan(a):
+        return math.isnan(b)
+    return a == b
+
+
+class TestKicadTokenizer:
+    """The fast path must produce exactly what sexpdata.loads() produces."""
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            '(kicad_sch (version 20250114) (generator "eeschema") (paper "A4"))',
+            "(at 100.33 -2.54 90) (xy 1e3 .5) (n +3 -0 1_000)",
+            '(property "Value" "10k" (effects (font (size 1.27 1.27)) (hide yes)))',
+            '(text "Line 1\\nLine 2\\t\\"quoted\\" back\\\\slash \\q")',
+            "(flags t nil inf Infinity NaN yes no)",
+            '(empty "" ())',
+            "(pin passive line\n\t(at 0 3.81 270)\r\n\t(length 1.27))",
+            "(atom\xa0 mixed'quote)",
+            '(same_text "1.27" 1.27 "yes" yes "nil" nil)',
+        ],
+    )
+    def test_matches_sexpdata(self, source):
+        source = f"(root {source})"
+        assert _same_tree(_loads_kicad(source), sexpdata.loads(source))
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "(a [b])",
+            "(a 'b)",
+            "(a b) ; comment",
+            "(a b\\ c)",
+            "(a b",
+            "(a b))",
+            "(a) (b)",
+            "",
+            '(a "unterminated)',
+        ],
+    )
+    def test_defers_outside_kicad_subset(self, source):
+        with pytest.raises(_UnsupportedSyntax):
+            _loads_kicad(source)
+
+    def test_repeated_nil_atoms_are_distinct_lists(self):
+        """Repeated atoms are converted once, but each nil must stay its own list."""
+        tree = _loads_kicad("(root nil nil 1.27 1.27)")
+        assert tree[1] == tree[2] == [] and tree[1] is not tree[2]
+        assert tree[3] == tree[4] == 1.27
+
+    def test_repeated_strings_share_one_object(self):
+        """Equal string values in one parse are the same str object."""
+        tree = _loads_kicad('(root (lib_id "Device:R") (lib_id "Device:R") "a\\"b" "a\\"b")')
+        assert tree[1][1] is tree[2][1]
+        assert tree[3] == 'a"b' and tree[3] is tree[4]
+
+    def test_parse_string_falls_back_to_sexpdata(self):
+        """Syntax outside the subset is still parsed, via sexpdata."""
+        parser = SExpressionParser(enable_persistence=False)
+        assert _same_tree(parser.parse_string("(a [b] 'c)"), sexpdata.loads("(a [b] 'c)"))
+
+    def test_parse_string_reports_malformed_input(self):
+        parser = SExpressionParser(enable_persistence=False)
+        with pytest.raises(ValidationError):
+            parser.parse_string("(unbalanced (list)")
+
+
+class TestKeywordInterning:
+    """KiCAD keywords are returned as the shared Symbols from _symbols."""
+
+    SOURCE = '(symbol (lib_id "Device:R") (at 1 2 0) (in_bom yes) (custom_tag value))'
+
+    def test_keywords_are_shared_instances(self):
+        tree = _loads_kicad(self.SOURCE)
+
+        assert tree[0] is SYMBOL
+        assert tree[2][0] is AT
+        assert tree[3][1] is YES
+        assert tree[4][0] == sexpdata.Symbol("custom_tag")
+
+    def test_cached_parse_keeps_shared_instances(self):
+        """Trees restored from the parse cache still use the shared keyword Symbols."""
+        parser = SExpressionParser(enable_persistence=False)
+        parser.parse_string(self.SOURCE)
+        tree = parser.parse_string(self.SOURCE)
+
+        assert tree[2][0] is AT
+        assert tree[3][1] is YES
@@ -0,0 +1,115 @@
+"""
+Unit tests for SExpressionParser parse tree caching.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from kicad_sch_api.core.parser import SExpressionParser
+
+MINIMAL_SCHEMATIC = """(kicad_sch
+\t(version 20250114)
+\t(generator "eeschema")
+\t(uuid "a6f3c0b4-0b4e-4f6e-9f5d-2c8f5e1c7d11")
+\t(paper "A4")
+)
+"""
+
+
+@pytest.fixture
+def schematic_file(tmp_path):
+    path = tmp_path / "minimal.kicad_sch"
+    path.write_text(MINIMAL_SCHEMATIC)
+    return path
+
+
+class TestParseFileCache:
+    """Test the on-disk parse tree cache used by parse_file."""
+
+    def test_second_parse_uses_cache(self, schematic_file, tmp_path):
+        """A second parse of an unchanged file should not re-tokenize it."""
+        cache_dir = tmp_path / "cache"
+        first = SExpressionParser(cache_dir=cache_dir, enable_persistence=True).parse_file(
+            schematic_file
+        )
+        assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+        with patch("kicad_sch_api.core.parser.sexpdata.loads") as loads:
+            second = SExpressionParser(cache_dir=cache_dir, enable_persistence=True).parse_file(
+                schematic_file
+            )
+
+        loads.assert_not_called()
+        assert second["uuid"] == first["uuid"]
+
+    def test_modified_file_invalidates_cache(self, schematic_file, tmp_path):
+        """Changing the file contents should produce a fresh parse."""
+        cache_dir = tmp_path / "cache"
+        SExpressionParser(cache_dir=cache_dir, enable_persistence=True).parse_file(schematic_file)
+
+        stat = schematic_file.stat()
+        schematic_file.write_text(MINIMAL_SCHEMATIC.replace('"A4"', '"A3"'))
+        # Same mtime and size as before: only the content tells the two versions apart
+        os.utime(schematic_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        data = SExpressionParser(cache_dir=cache_dir, enable_persistence=True).parse_file(
+            schematic_file
+        )
+
+        assert data["paper"] == "A3"
+        assert len(list(cache_dir.glob("*.pickle"))) == 2
+
+    def test_persistence_disabled_by_default(self, schematic_file, tmp_path):
+        """Without opting in the cache directory is never created."""
+        cache_dir = tmp_path / "cache"
+        SExpressionParser(cache_dir=cache_dir).parse_file(schematic_file)
+
+        assert not cache_dir.exists()
+
+    def test_cache_directory_is_capped(self, schematic_file, tmp_path):
+        """Writing past the size cap removes the oldest entries first."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        stale = cache_dir / "stale.pickle"
+        stale.write_bytes(b"x" * 4096)
+        os.utime(stale, ns=(0, 0))
+
+        with patch("kicad_sch_api.core.parser._PARSE_CACHE_MAX_BYTES", 2048):
+            SExpressionParser(cache_dir=cache_dir, enable_persistence=True).parse_file(
+                schematic_file
+            )
+
+        assert not stale.exists()
+        assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    def test_corrupt_cache_entry_falls_back_to_parse(self, schematic_file, tmp_path):
+        """An unreadable cache entry should be ignored, not raised."""
+        cache_dir = tmp_path / "cache"
+        SExpressionParser(cache_dir=cache_dir, enable_persistence=True).parse_file(schematic_file)
+        for entry in cache_dir.glob("*.pickle"):
+            entry.write_bytes(b"not a pickle")
+
+        data = SExpressionParser(cache_dir=cache_dir, enable_persistence=True).parse_file(
+            schematic_file
+        )
+
+        assert data["paper"] == "A4"
+
+
+class TestParseStringCache:
+    """Test the in-memory cache used by parse_string."""
+
+    def test_repeated_parse_returns_independent_trees(self):
+        """Cached results must not share structure with earlier callers."""
+        parser = SExpressionParser(enable_persistence=False)
+        first = parser.parse_string(MINIMAL_SCHEMATIC)
+        first.append("mutated")
+
+        with patch("kicad_sch_api.core.parser.sexpdata.loads") as loads:
+            second = parser.parse_string(MINIMAL_SCHEMATIC)
+
+        loads.assert_not_called()
+        assert "mutated" not in second
+        assert len(second) == len(first) - 1
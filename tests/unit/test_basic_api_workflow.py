@@ -11,6 +11,7 @@ from pathlib import Path
 import pytest
 
 import kicad_sch_api as ksa
+from kicad_sch_api.core.types import Point
 
 
 class TestBasicAPIWorkflow:
@@ -73,6 +74,29 @@ class TestBasicAPIWorkflow:
         wires = list(sch.wires)
         assert len(wires) == 1
 
+    def test_add_wires_along_route(self):
+        """Test adding one wire per segment of a route."""
+        sch = ksa.create_schematic("My Circuit")
+
+        wire_uuids = sch.add_wires([(100, 110), Point(150, 110), (150, 150)], grid_units=False)
+
+        assert len(wire_uuids) == 2
+        wires = list(sch.wires)
+        assert [w.uuid for w in wires] == wire_uuids
+        assert (wires[0].start, wires[0].end) == (Point(100, 110), Point(150, 110))
+        assert (wires[1].start, wires[1].end) == (Point(150, 110), Point(150, 150))
+        assert sch.add_wires([(100, 110)]) == []
+
+    @pytest.mark.parametrize("grid_units", [False, True])
+    def test_add_wires_invalid_point_adds_nothing(self, grid_units):
+        """Test a route with an invalid point adds none of its wires."""
+        sch = ksa.create_schematic("My Circuit")
+
+        with pytest.raises(ValueError, match="Route point must be Point or tuple"):
+            sch.add_wires([(100, 110), (150, 110), None], grid_units=grid_units)
+
+        assert len(sch.wires) == 0
+
     def test_add_label(self):
         """Test adding a label to the schematic."""
         sch = ksa.create_schematic("My Circuit")
@@ -160,6 +184,47 @@ class TestBasicAPIWorkflow:
         assert len(labels) == 1
         assert labels[0].text == "VCC"
 
+    def test_dumps_matches_saved_content(self, tmp_path):
+        """Test that dumps() returns what save() writes without touching the file path."""
+        sch = ksa.create_schematic("My Circuit")
+        sch.wires.add(start=(100, 110), end=(150, 110))
+        sch.add_label("VCC", position=(125, 110))
+
+        content = sch.dumps()
+        assert sch.file_path is None
+
+        temp_file = tmp_path / "my_circuit.kicad_sch"
+        sch.save(str(temp_file))
+
+        assert content == temp_file.read_text(encoding="utf-8")
+        assert '(label "VCC"' in content
+
+    def test_save_returns_written_content(self, tmp_path):
+        """Test that save() returns exactly what it wrote to disk."""
+        sch = ksa.create_schematic("My Circuit")
+        sch.wires.add(start=(100, 110), end=(150, 110))
+
+        temp_file = tmp_path / "my_circuit.kicad_sch"
+        content = sch.save(str(temp_file))
+
+        assert content == temp_file.read_text(encoding="utf-8")
+
+    def test_clone_from_copies_without_sharing_state(self):
+        """Test that a cloned schematic matches its source and is independent of it."""
+        sch = ksa.create_schematic("My Circuit")
+        sch.wires.add(start=(100, 110), end=(150, 110))
+        sch.add_label("VCC", position=(125, 110))
+
+        clone = ksa.Schematic.clone_from(sch, name="Clone")
+
+        assert clone.name == "Clone"
+        assert clone.dumps() == sch.dumps()
+
+        clone.wires.add(start=(150, 110), end=(150, 150))
+
+        assert len(clone.wires) == 2
+        assert len(sch.wires) == 1
+
     def test_api_usage_from_documentation(self):
         """Test the exact API usage pattern from documentation."""
         # This is the workflow from CLAUDE.md examples
@@ -0,0 +1,143 @@
+"""
+Unit tests for reuse of symbol-local bounds in get_component_bounding_box.
+
+The symbol cache is replaced with a stub, so these tests do not depend on
+KiCAD symbol libraries being installed.
+"""
+
+import math
+from collections import OrderedDict
+
+import pytest
+
+from kicad_sch_api.core import component_bounds
+from kicad_sch_api.core.component_bounds import (
+    BoundingBox,
+    SymbolBoundingBoxCalculator,
+    get_component_bounding_box,
+    get_schematic_component_bboxes,
+)
+from kicad_sch_api.core.types import Point, SchematicSymbol
+from kicad_sch_api.library.cache import SymbolDefinition
+
+
+class _StubSymbolCache:
+    def __init__(self, symbol):
+        self.symbol = symbol
+        self.lookups = []
+
+    def get_symbol(self, lib_id):
+        self.lookups.append(lib_id)
+        return self.symbol
+
+
+@pytest.fixture
+def stub_cache(monkeypatch):
+    """Serve one symbol definition and count bounding box calculations."""
+    cache = _StubSymbolCache(SymbolDefinition("Test:Part", "Part", "Test", "U"))
+    calls = []
+    calculate = SymbolBoundingBoxCalculator.calculate_bounding_box.__func__
+
+    def counting_calculate(cls, symbol, include_properties=True):
+        calls.append(symbol)
+        return calculate(cls, symbol, include_properties)
+
+    monkeypatch.setattr(component_bounds, "get_symbol_cache", lambda: cache)
+    monkeypatch.setattr(component_bounds, "_LOCAL_BBOX_CACHE", OrderedDict())
+    monkeypatch.setattr(
+        SymbolBoundingBoxCalculator, "calculate_bounding_box", classmethod(counting_calculate)
+    )
+    cache.calls = calls
+    return cache
+
+
+def _component(reference, x, y, rotation=0.0):
+    return SchematicSymbol("", "Test:Part", Point(x, y), reference, rotation=rotation)
+
+
+class TestLocalBoundsCache:
+    """Identical parts compute their symbol bounds once and are only translated."""
+
+    def test_identical_parts_share_local_bounds(self, stub_cache):
+        first = get_component_bounding_box(_component("U1", 0, 0), include_properties=False)
+        second = get_component_bounding_box(_component("U2", 50, 25), include_properties=False)
+
+        assert len(stub_cache.calls) == 1
+        assert second.min_x == pytest.approx(first.min_x + 50)
+        assert second.min_y == pytest.approx(first.min_y + 25)
+        assert (second.width, second.height) == pytest.approx((first.width, first.height))
+
+    def test_rotation_and_properties_are_cached_separately(self, stub_cache):
+        get_component_bounding_box(_component("U1", 0, 0), include_properties=False)
+        get_component_bounding_box(_component("U2", 0, 0, 90), include_properties=False)
+        get_component_bounding_box(_component("U3", 0, 0), include_properties=True)
+        get_component_bounding_box(_component("U4", 0, 0, 90), include_properties=False)
+
+        assert len(stub_cache.calls) == 3
+
+    def test_reloaded_symbol_is_recalculated(self, stub_cache):
+        get_component_bounding_box(_component("U1", 0, 0))
+        stub_cache.symbol = SymbolDefinition("Test:Part", "Part", "Test", "U")
+        get_component_bounding_box(_component("U2", 0, 0))
+
+        assert len(stub_cache.calls) == 2
+
+    def test_least_recently_used_bounds_are_evicted(self, stub_cache, monkeypatch):
+        monkeypatch.setattr(component_bounds, "_LOCAL_BBOX_CACHE_SIZE", 2)
+        get_component_bounding_box(_component("U1", 0, 0, 0))
+        get_component_bounding_box(_component("U2", 0, 0, 90))
+        get_component_bounding_box(_component("U3", 0, 0, 0))
+        get_component_bounding_box(_component("U4", 0, 0, 180))
+        get_component_bounding_box(_component("U5", 0, 0, 0))
+        get_component_bounding_box(_component("U6", 0, 0, 90))
+
+        assert len(component_bounds._LOCAL_BBOX_CACHE) == 2
+        # 0 stayed cached while 90 was evicted by 180 and had to be recalculated
+        assert len(stub_cache.calls) == 4
+
+
+class TestQuarterTurnBounds:
+    """Multiples of 90° match the general rotation without trigonometry."""
+
+    @pytest.mark.parametrize("rotation", [0, 90, 180, 270, -90, 450, 45])
+    def test_matches_rotation_matrix(self, rotation, monkeypatch):
+        symbol = object()
+        monkeypatch.setattr(component_bounds, "_LOCAL_BBOX_CACHE", OrderedDict())
+        monkeypatch.setattr(
+            SymbolBoundingBoxCalculator,
+            "calculate_bounding_box",
+            classmethod(lambda cls, symbol, include_properties=True: BoundingBox(-1, -3, 2, 5)),
+        )
+
+        bounds = component_bounds._get_local_bounds(symbol, "Test:Part", rotation, False)
+
+        angle = math.radians(rotation)
+        corners = [(-1, -3), (2, -3), (2, 5), (-1, 5)]
+        xs = [x * math.cos(angle) - y * math.sin(angle) for x, y in corners]
+        ys = [x * math.sin(angle) + y * math.cos(angle) for x, y in corners]
+        assert bounds == pytest.approx((min(xs), min(ys), max(xs), max(ys)))
+
+
+class TestBatchBoundingBoxes:
+    """A batch resolves each symbol once and matches per-component results."""
+
+    def test_batch_looks_up_each_lib_id_once(self, stub_cache):
+        components = [_component(f"U{i}", i * 10, 0, 90 * (i % 2)) for i in range(6)]
+
+        bboxes = get_schematic_component_bboxes(components, include_properties=False)
+
+        assert stub_cache.lookups == ["Test:Part"]
+        for component, bbox in zip(components, bboxes):
+            single = get_component_bounding_box(component, include_properties=False)
+            assert (bbox.min_x, bbox.min_y, bbox.max_x, bbox.max_y) == pytest.approx(
+                (single.min_x, single.min_y, single.max_x, single.max_y)
+            )
+
+    def test_batch_missing_symbol_uses_default_box(self, stub_cache):
+        stub_cache.symbol = None
+
+        bboxes = get_schematic_component_bboxes([_component("U1", 10, 20)])
+
+        assert (bboxes[0].min_x, bboxes[0].min_y) == pytest.approx((10 - 2.54, 20 - 2.54))
+        assert (bboxes[0].width, bboxes[0].height) == pytest.approx((5.08, 5.08))
+        assert stub_cache.calls == []
@@ -0,0 +1,109 @@
+"""
+Unit tests for wire-to-pin matching in ConnectivityAnalyzer.
+
+Pins are given directly as positions, so these tests do not depend on
+KiCAD symbol libraries being installed.
+"""
+
+import pytest
+
+import kicad_sch_api as ksa
+from kicad_sch_api.core.connectivity import ConnectivityAnalyzer, PinConnection
+from kicad_sch_api.core.types import Point
+
+
+def _pins(*specs):
+    """Build a pin position mapping from (reference, pin_number, x, y) tuples."""
+    pins = {}
+    for reference, pin_number, x, y in specs:
+        position = Point(x, y)
+        pins[PinConnection(reference, pin_number, position)] = position
+    return pins
+
+
+class TestWirePinMatching:
+    """Test that wires pick up exactly the pins within tolerance of their points."""
+
+    @pytest.mark.parametrize("tolerance", [0.01, 0.5, 1.27])
+    def test_pins_matched_within_tolerance(self, tolerance):
+        sch = ksa.create_schematic("Pin Matching")
+        sch.wires.add(start=(100, 100), end=(110, 100))
+        just_inside = tolerance * 0.99
+        pins = _pins(
+            ("R1", "1", 100, 100),
+            ("R2", "1", 110 + just_inside, 100 - just_inside),
+            ("R3", "1", 100 - tolerance * 1.01, 100),  # just outside
+            ("R4", "1", 105, 100),  # on the wire, but not at an endpoint
+        )
+
+        analyzer = ConnectivityAnalyzer(tolerance=tolerance)
+        analyzer._trace_wire_connections(sch, pins)
+
+        assert len(analyzer.nets) == 1
+        assert {pin.reference for pin in analyzer.nets[0].pins} == {"R1", "R2"}
+
+    def test_zero_tolerance_matches_nothing(self):
+        sch = ksa.create_schematic("Pin Matching")
+        sch.wires.add(start=(100, 100), end=(110, 100))
+
+        analyzer = ConnectivityAnalyzer(tolerance=0)
+        analyzer._trace_wire_connections(sch, _pins(("R1", "1", 100, 100)))
+
+        assert len(analyzer.nets) == 1
+        assert not analyzer.nets[0].pins
+
+
+class TestPinQueries:
+    """Test pin queries against nets built from wires."""
+
+    def test_wire_joining_two_nets_connects_all_their_pins(self):
+        sch = ksa.create_schematic("Pin Queries")
+        sch.wires.add(start=(100, 100), end=(110, 100))
+        sch.wires.add(start=(200, 100), end=(210, 100))
+        # Joins the first net (via R2) and the second (via R3)
+        sch.wires.add(start=(110, 100), end=(200, 100))
+        pins = _pins(
+            ("R1", "1", 100, 100),
+            ("R2", "1", 110, 100),
+            ("R3", "1", 200, 100),
+            ("R4", "1", 210, 100),
+            ("R5", "1", 300, 300),
+        )
+
+        analyzer = ConnectivityAnalyzer()
+        analyzer._trace_wire_connections(sch, pins)
+
+        assert len(analyzer.nets) == 1
+        assert analyzer.are_connected("R1", "1", "R4", "1")
+        assert analyzer.get_net_for_pin("R1", "1") is analyzer.nets[0]
+        assert not analyzer.are_connected("R1", "1", "R5", "1")
+        assert analyzer.get_net_for_pin("R5", "1") is None
+        assert sorted(analyzer.get_connected_pins("R1", "1")) == [
+            ("R2", "1"),
+            ("R3", "1"),
+            ("R4", "1"),
+        ]
+
+
+class TestLabelNetMatching:
+    """Test that labels attach to the net with a point within tolerance."""
+
+    def test_labels_with_same_text_merge_nets(self):
+        sch = ksa.create_schematic("Label Matching")
+        sch.wires.add(start=(100, 100), end=(110, 100))
+        sch.wires.add(start=(200, 100), end=(210, 100))
+        sch.wires.add(start=(300, 100), end=(310, 100))
+        sch.add_label("VCC", position=(110.005, 100), grid_units=False)
+        sch.add_label("VCC", position=(200, 99.995), grid_units=False)
+        # Just outside tolerance of the third wire
+        sch.add_label("VCC", position=(300, 100.02), grid_units=False)
+        pins = _pins(("R1", "1", 100, 100), ("R2", "1", 210, 100), ("R3", "1", 310, 100))
+
+        analyzer = ConnectivityAnalyzer()
+        analyzer._trace_wire_connections(sch, pins)
+        analyzer._merge_label_nets(sch)
+
+        assert len(analyzer.nets) == 2
+        assert analyzer.are_connected("R1", "1", "R2", "1")
+        assert not analyzer.are_connected("R1", "1", "R3", "1")
+        assert analyzer.get_net_for_pin("R1", "1").name == "VCC"
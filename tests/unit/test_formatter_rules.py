@@ -0,0 +1,50 @@
+"""
+Unit tests for ExactFormatter's formatting rules table.
+"""
+
+import sexpdata
+
+from kicad_sch_api.core.formatter import ExactFormatter, FormatRule
+
+
+class TaggedFormatter(ExactFormatter):
+    """Formatter whose version handler is a bound method using instance state."""
+
+    def __init__(self, tag: str):
+        self.tag = tag
+        super().__init__()
+
+    def _initialize_kicad_rules(self):
+        super()._initialize_kicad_rules()
+        self.rules["version"] = FormatRule(custom_handler=self._format_version)
+
+    def _format_version(self, lst, indent_level):
+        return f"(version {self.tag})"
+
+
+class TestFormatterRules:
+    """Test that formatters share how the table is built, not the table itself."""
+
+    def test_instances_have_their_own_rules(self):
+        """Changing one formatter's rules leaves other formatters alone."""
+        first = ExactFormatter()
+        second = ExactFormatter()
+
+        first.rules["custom"] = FormatRule(inline=True)
+
+        assert first.rules is not second.rules
+        assert "custom" not in second.rules
+        assert "custom" not in ExactFormatter().rules
+
+    def test_handlers_are_bound_to_their_formatter(self):
+        """Built-in handlers are bound methods of the formatter using them."""
+        formatter = ExactFormatter()
+
+        assert formatter.rules["pin"].custom_handler.__self__ is formatter
+
+    def test_subclass_bound_method_handlers(self):
+        """A subclass handler registered as a bound method sees its own instance."""
+        data = [sexpdata.Symbol("version"), 20250114]
+
+        assert TaggedFormatter("a").format(data) == "(version a)\n"
+        assert TaggedFormatter("b").format(data) == "(version b)\n"
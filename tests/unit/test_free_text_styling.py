@@ -4,10 +4,13 @@ Unit tests for free text styling properties.
 Tests the Text dataclass, parser, and API for bold, italic, thickness, color, and face properties.
 """
 
+import re
+
 import pytest
 
 import kicad_sch_api as ksa
 from kicad_sch_api.core.types import Point, Text
+from kicad_sch_api.utils.validation import ValidationError
 
 
 class TestTextDataclass:
@@ -253,3 +256,64 @@ class TestTextValidation:
                 position=(100, 100),
                 thickness=0.0,
             )
+
+
+class TestAddTexts:
+    """Test adding several texts with one add_texts call."""
+
+    def test_add_texts_matches_add_text(self, tmp_path):
+        """Batch-added texts are saved like texts added one at a time."""
+        sch = ksa.create_schematic("test")
+        uuids = sch.add_texts(
+            [
+                ("U1_TL", Point(10, 10), 0.8),
+                ("U1_BR", (20, 20), 0.8),
+                ("U1_C", (15, 15), 1.27),
+            ],
+            grid_units=False,
+        )
+
+        assert len(uuids) == 3
+        assert [text.text for text in sch.texts] == ["U1_TL", "U1_BR", "U1_C"]
+        assert [text["uuid"] for text in sch._data["texts"]] == uuids
+
+        output_file = tmp_path / "test_add_texts.kicad_sch"
+        sch.save(str(output_file))
+        sch2 = ksa.Schematic.load(str(output_file))
+
+        loaded = {text.text: text for text in sch2.texts}
+        assert loaded["U1_BR"].position == Point(20, 20)
+        assert loaded["U1_TL"].size == 0.8
+
+    def test_add_texts_empty(self):
+        """An empty batch adds nothing."""
+        sch = ksa.create_schematic("test")
+
+        assert sch.add_texts([]) == []
+        assert len(sch.texts) == 0
+
+    def test_add_texts_output_equals_add_text_calls(self):
+        """add_texts writes the same file content as calling add_text per item."""
+        items = [("A", (10, 10), 0.8), ("B", Point(2, 3), 1.27), ("C", (4, 4), 2.0)]
+
+        batch = ksa.create_schematic("test")
+        batch.add_texts(items, rotation=90, grid_units=True, grid_size=2.54)
+
+        single = ksa.create_schematic("test")
+        for text, position, size in items:
+            single.add_text(text, position, rotation=90, size=size, grid_units=True, grid_size=2.54)
+
+        def without_uuids(content):
+            return re.sub(r'\(uuid "[^"]*"\)', "(uuid)", content)
+
+        assert without_uuids(batch.dumps()) == without_uuids(single.dumps())
+
+    def test_add_texts_invalid_item_adds_nothing(self):
+        """An invalid item anywhere in the batch leaves the schematic unchanged."""
+        sch = ksa.create_schematic("test")
+
+        with pytest.raises(ValidationError, match="Text size must be positive"):
+            sch.add_texts([("A", (10, 10), 1.27), ("B", (20, 20), 0)], grid_units=False)
+
+        assert len(sch.texts) == 0
+        assert sch._data.get("texts", []) == []
@@ -153,7 +153,7 @@ class TestLabelPinPlacement:
         label = sch._labels.get(label_uuid)
         assert label.rotation == pytest.approx(45.0, abs=0.1)
 
-    def test_label_roundtrip_preserves_justification(self):
+    def test_label_roundtrip_preserves_justification(self, tmp_path):
         """Test that label justification is preserved through save/load cycle."""
         sch = ksa.create_schematic("Test")
         sch.components.add("Device:R", "R1", "10k", position=(100.0, 100.0), rotation=0)
@@ -161,8 +161,9 @@ class TestLabelPinPlacement:
         sch.add_label("GND", pin=("R1", "2"))
 
         # Save and reload
-        sch.save("test_label_roundtrip.kicad_sch")
-        sch2 = ksa.Schematic.load("test_label_roundtrip.kicad_sch")
+        output_path = tmp_path / "test_label_roundtrip.kicad_sch"
+        sch.save(str(output_path))
+        sch2 = ksa.Schematic.load(str(output_path))
 
         # Find labels
         vcc_labels = [l for l in sch2._labels if l.text == "VCC"]
@@ -0,0 +1,106 @@
+"""
+Unit tests for the lib_symbols definitions written on save.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import sexpdata
+
+import kicad_sch_api as ksa
+from kicad_sch_api.collections.components import ComponentCollection
+from kicad_sch_api.core.types import Point, SchematicSymbol
+from kicad_sch_api.library.cache import SymbolDefinition
+
+
+def _symbol_definition():
+    raw = [
+        sexpdata.Symbol("symbol"),
+        "R",
+        [
+            sexpdata.Symbol("instances"),
+            [sexpdata.Symbol("project"), "library_project"],
+        ],
+    ]
+    return SymbolDefinition(
+        lib_id="Device:R", name="R", library="Device", reference_prefix="R", raw_kicad_data=raw
+    )
+
+
+def _fake_cache(symbol_def):
+    cache = MagicMock()
+    cache.get_symbol.side_effect = lambda lib_id: symbol_def if lib_id == "Device:R" else None
+    return cache
+
+
+class TestLibSymbolDefinitions:
+    """Test conversion and reuse of lib_symbols definitions."""
+
+    def test_definition_is_converted_once_per_project(self):
+        """Repeated lookups for the same lib_id and project reuse the converted definition."""
+        cache = _fake_cache(_symbol_definition())
+        sch = ksa.create_schematic("lib_symbols_reuse")
+
+        first = sch._get_lib_symbol_definition(cache, "Device:R")
+        second = sch._get_lib_symbol_definition(cache, "Device:R")
+
+        assert first is second
+        assert first[1] == "Device:R"
+        assert first[2][1][1] == "lib_symbols_reuse"
+
+    def test_projects_do_not_share_definitions(self):
+        """Project name rewriting must not leak into the library or other projects."""
+        symbol_def = _symbol_definition()
+        cache = _fake_cache(symbol_def)
+
+        first = ksa.create_schematic("project_a")._get_lib_symbol_definition(cache, "Device:R")
+        second = ksa.create_schematic("project_b")._get_lib_symbol_definition(cache, "Device:R")
+
+        assert first[2][1][1] == "project_a"
+        assert second[2][1][1] == "project_b"
+        assert symbol_def.raw_kicad_data[2][1][1] == "library_project"
+
+    def test_same_named_schematics_do_not_share_definitions(self):
+        """Editing one schematic's lib_symbols entry must not change another's."""
+        cache = _fake_cache(_symbol_definition())
+
+        first = ksa.create_schematic("shared_name")._get_lib_symbol_definition(cache, "Device:R")
+        second = ksa.create_schematic("shared_name")._get_lib_symbol_definition(cache, "Device:R")
+        first.append("edited")
+
+        assert second is not first
+        assert "edited" not in second
+
+    def test_reloaded_symbol_is_converted_again(self):
+        """A new SymbolDefinition for the same lib_id replaces the cached conversion."""
+        sch = ksa.create_schematic("lib_symbols_reload")
+        first = sch._get_lib_symbol_definition(_fake_cache(_symbol_definition()), "Device:R")
+        second = sch._get_lib_symbol_definition(_fake_cache(_symbol_definition()), "Device:R")
+
+        assert first is not second
+        assert first == second
+
+    def test_unknown_symbol_returns_none(self):
+        """Symbols missing from the library produce no definition."""
+        sch = ksa.create_schematic("lib_symbols_missing")
+
+        assert sch._get_lib_symbol_definition(_fake_cache(None), "Device:C") is None
+
+    def test_sync_keeps_definitions_the_libraries_cannot_provide(self):
+        """An existing lib_symbols entry survives sync when no library has the symbol."""
+        definition = [sexpdata.Symbol("symbol"), "Custom:Part"]
+        source = ComponentCollection(
+            [
+                SchematicSymbol(
+                    uuid="uuid1", lib_id="Custom:Part", reference="U1", position=Point(100, 100)
+                )
+            ],
+            parent_schematic=MagicMock(_data={"lib_symbols": {"Custom:Part": definition}}),
+        )
+        sch = ksa.create_schematic("lib_symbols_unresolved")
+        sch.components.add_from(source.get("U1"))
+        sch._data["lib_symbols"]["Custom:Unused"] = definition
+
+        with patch("kicad_sch_api.core.schematic.get_symbol_cache", return_value=_fake_cache(None)):
+            sch._sync_components_to_data()
+
+        assert sch._data["lib_symbols"] == {"Custom:Part": definition}
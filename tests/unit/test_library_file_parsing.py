@@ -0,0 +1,88 @@
+"""
+Unit tests for reuse of parsed library files in SymbolLibraryCache.
+
+A small .kicad_sym file is written to tmp_path, so these tests do not
+depend on KiCAD symbol libraries being installed.
+"""
+
+import os
+
+import pytest
+import sexpdata
+
+from kicad_sch_api.library import cache as cache_module
+from kicad_sch_api.library.cache import SymbolLibraryCache
+
+LIBRARY = """(kicad_symbol_lib
+  (version 20241209)
+  (symbol "R"
+    (property "Reference" "R" (at 2.032 0 90))
+    (symbol "R_0_1"
+      (rectangle (start -1.016 -2.54) (end 1.016 2.54))
+    )
+    (symbol "R_1_1"
+      (pin passive line (at 0 3.81 270) (length 1.27) (name "~") (number "1"))
+      (pin passive line (at 0 -3.81 90) (length 1.27) (name "~") (number "2"))
+    )
+  )
+  (symbol "C"
+    (property "Reference" "C" (at 0.635 2.54 0))
+    (symbol "C_1_1"
+      (pin passive line (at 0 3.81 270) (length 2.794) (name "~") (number "1"))
+    )
+  )
+  (symbol "C_Small" (extends "C")
+    (property "Reference" "C" (at 0.254 1.778 0))
+  )
+)
+"""
+
+
+@pytest.fixture
+def library_cache(tmp_path, monkeypatch):
+    """A cache serving one test library that counts how often library files are parsed."""
+    library_path = tmp_path / "Test.kicad_sym"
+    library_path.write_text(LIBRARY, encoding="utf-8")
+
+    parses = []
+    loads = sexpdata.loads
+
+    def counting_loads(content, **kwargs):
+        parses.append(content)
+        return loads(content, **kwargs)
+
+    monkeypatch.setattr(cache_module.sexpdata, "loads", counting_loads)
+    cache = SymbolLibraryCache(enable_persistence=False)
+    cache.add_library_path(library_path)
+    cache.parses = parses
+    cache.library_path = library_path
+    return cache
+
+
+class TestLibraryFileParsing:
+    """Symbols from one library share a single parse of its file."""
+
+    def test_symbols_from_one_library_parse_it_once(self, library_cache):
+        resistor = library_cache.get_symbol("Test:R")
+        capacitor = library_cache.get_symbol("Test:C")
+        small = library_cache.get_symbol("Test:C_Small")
+
+        assert len(library_cache.parses) == 1
+        assert [pin.number for pin in resistor.pins] == ["1", "2"]
+        assert [pin.number for pin in capacitor.pins] == ["1"]
+        # extends is resolved against the same parsed file
+        assert small.extends is None and len(small.pins) == 1
+
+    def test_missing_symbol_does_not_reparse(self, library_cache):
+        assert library_cache.get_symbol("Test:R") is not None
+        assert library_cache.get_symbol("Test:Missing") is None
+
+        assert len(library_cache.parses) == 1
+
+    def test_modified_library_is_parsed_again(self, library_cache):
+        library_cache.get_symbol("Test:R")
+        stat = library_cache.library_path.stat()
+        os.utime(library_cache.library_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        library_cache.get_symbol("Test:C")
+
+        assert len(library_cache.parses) == 2
@@ -0,0 +1,58 @@
+"""
+Unit tests for the packed obstacle index used by path collision checks.
+"""
+
+import random
+
+import pytest
+
+from kicad_sch_api.core.component_bounds import (
+    BoundingBox,
+    ObstacleIndex,
+    check_path_collision,
+)
+from kicad_sch_api.core.types import Point
+
+
+def _random_boxes(rng, count):
+    boxes = []
+    for _ in range(count):
+        x, y = rng.uniform(0, 200), rng.uniform(0, 200)
+        boxes.append(BoundingBox(x, y, x + rng.uniform(1, 10), y + rng.uniform(1, 10)))
+    return boxes
+
+
+class TestObstacleIndex:
+    """The index returns the same answers as scanning every obstacle."""
+
+    @pytest.mark.parametrize("count", [0, 1, 15, 16, 17, 300])
+    def test_intersection_matches_full_scan(self, count):
+        rng = random.Random(count)
+        boxes = _random_boxes(rng, count)
+        index = ObstacleIndex(boxes, clearance=1.27)
+
+        for _ in range(50):
+            x, y = rng.uniform(-10, 210), rng.uniform(-10, 210)
+            query = BoundingBox(x, y, x + rng.uniform(0, 40), y + rng.uniform(0, 40))
+            expected = {i for i, box in enumerate(boxes) if box.expand(1.27).overlaps(query)}
+            assert (
+                set(index.intersection(query.min_x, query.min_y, query.max_x, query.max_y))
+                == expected
+            )
+
+    def test_collides_matches_check_path_collision(self):
+        rng = random.Random(7)
+        boxes = _random_boxes(rng, 200)
+        index = ObstacleIndex(boxes)
+
+        for _ in range(200):
+            start = Point(rng.uniform(0, 200), rng.uniform(0, 200))
+            end = Point(rng.uniform(0, 200), rng.uniform(0, 200))
+            assert index.collides(start, end) == check_path_collision(start, end, boxes)
+
+    def test_axis_aligned_segment_near_obstacle(self):
+        index = ObstacleIndex([BoundingBox(10, 10, 20, 20)], clearance=1.27)
+
+        assert index.collides(Point(0, 9), Point(30, 9))
+        assert not index.collides(Point(0, 8), Point(30, 8))
+        assert not index.collides(Point(0, 0), Point(5, 0))
@@ -0,0 +1,74 @@
+"""
+Unit tests for reuse of absolute pin positions in WireManager.
+
+The reference schematic is loaded without KiCAD libraries installed, so the
+symbol cache used for pin lookups is replaced with a stub.
+"""
+
+from pathlib import Path
+
+import pytest
+
+import kicad_sch_api as ksa
+from kicad_sch_api.core import pin_utils
+from kicad_sch_api.core.types import Point, SchematicPin
+from kicad_sch_api.library.cache import SymbolDefinition
+
+REFERENCE = (
+    Path(__file__).parent.parent
+    / "reference_tests"
+    / "reference_kicad_projects"
+    / "single_resistor"
+    / "single_resistor.kicad_sch"
+)
+
+
+class _StubSymbolCache:
+    def __init__(self):
+        self.lookups = []
+        self.symbol = SymbolDefinition("Device:R", "R", "Device", "R")
+        self.symbol.pins = [
+            SchematicPin("1", "~", Point(0, 3.81)),
+            SchematicPin("2", "~", Point(0, -3.81)),
+        ]
+
+    def get_symbol(self, lib_id):
+        self.lookups.append(lib_id)
+        return self.symbol
+
+
+@pytest.fixture
+def schematic(monkeypatch):
+    """Single resistor schematic whose pins come from a counting stub library."""
+    cache = _StubSymbolCache()
+    monkeypatch.setattr(pin_utils, "get_symbol_cache", lambda: cache)
+    sch = ksa.Schematic.load(str(REFERENCE))
+    sch.lookups = cache.lookups
+    return sch
+
+
+class TestPinPositionCache:
+    """Pin positions are computed once per component state."""
+
+    def test_repeated_lookups_reuse_positions(self, schematic):
+        pin2 = schematic.get_component_pin_position("R1", "2")
+        assert schematic.get_component_pin_position("R1", "2") == pin2
+        assert schematic.get_component_pin_position("R1", "1") != pin2
+        assert [num for num, _ in schematic.list_component_pins("R1")] == ["1", "2"]
+
+        assert len(schematic.lookups) == 1
+
+    def test_moved_component_is_recomputed(self, schematic):
+        before = schematic.get_component_pin_position("R1", "1")
+        component = schematic.components.get("R1")
+        component.position = Point(component.position.x + 10, component.position.y)
+
+        after = schematic.get_component_pin_position("R1", "1")
+
+        assert len(schematic.lookups) == 2
+        assert after == Point(before.x + 10, before.y)
+
+    def test_missing_pin_and_component(self, schematic):
+        assert schematic.get_component_pin_position("R1", "3") is None
+        assert schematic.get_component_pin_position("R9", "1") is None
+        assert schematic.list_component_pins("R9") == []
@@ -41,7 +41,7 @@ class TestPinUUIDParsing:
         )
         sch = ksa.Schematic.load(ref_path)
 
-        resistor = list(sch.components)[0]
+        resistor = next(iter(sch.components))
 
         # Check UUID format (should be valid UUID string)
         import uuid
@@ -61,7 +61,7 @@ class TestPinUUIDParsing:
         )
         sch = ksa.Schematic.load(ref_path)
 
-        resistor = list(sch.components)[0]
+        resistor = next(iter(sch.components))
 
         # These are the exact UUIDs in the reference file
         expected_pin1_uuid = "df660b58-5cdf-473e-8c0a-859cae977374"
@@ -94,12 +94,12 @@ class TestPinUUIDStorage:
         )
         sch = ksa.Schematic.load(ref_path)
 
-        resistor = list(sch.components)[0]
+        resistor = next(iter(sch.components))
         original_pin1_uuid = resistor.pin_uuids["1"]
         original_pin2_uuid = resistor.pin_uuids["2"]
 
         # Access component multiple times - UUIDs should remain stable
-        resistor_again = list(sch.components)[0]
+        resistor_again = next(iter(sch.components))
         assert resistor_again.pin_uuids["1"] == original_pin1_uuid
         assert resistor_again.pin_uuids["2"] == original_pin2_uuid
 
@@ -115,7 +115,7 @@ class TestPinUUIDPreservation:
 
         # Load schematic
         sch = ksa.Schematic.load(ref_path)
-        resistor = list(sch.components)[0]
+        resistor = next(iter(sch.components))
 
         # Capture original pin UUIDs
         original_pin_uuids = dict(resistor.pin_uuids)
@@ -127,7 +127,7 @@ class TestPinUUIDPreservation:
 
             # Load again
             sch2 = ksa.Schematic.load(temp_path)
-            resistor2 = list(sch2.components)[0]
+            resistor2 = next(iter(sch2.components))
 
             # Verify pin UUIDs are preserved
             assert (
@@ -150,11 +150,11 @@ class TestPinUUIDPreservation:
 
             sch.save(path1)
             sch1 = ksa.Schematic.load(path1)
-            uuids1 = list(sch1.components)[0].pin_uuids
+            uuids1 = next(iter(sch1.components)).pin_uuids
 
             sch1.save(path2)
             sch2 = ksa.Schematic.load(path2)
-            uuids2 = list(sch2.components)[0].pin_uuids
+            uuids2 = next(iter(sch2.components)).pin_uuids
 
             # UUIDs should remain identical across multiple saves
             assert uuids1 == uuids2, "Pin UUIDs should not change across multiple saves"
@@ -210,7 +210,7 @@ class TestPinUUIDEdgeCases:
             schematic.save(temp_path)
 
             sch2 = ksa.Schematic.load(temp_path)
-            comp2 = list(sch2.components)[0]
+            comp2 = next(iter(sch2.components))
 
             # Should have UUIDs assigned (either during add or during save)
             assert hasattr(comp2, "pin_uuids"), "Component should have pin_uuids"
@@ -224,7 +224,7 @@ class TestPinUUIDEdgeCases:
         )
 
         sch = ksa.Schematic.load(ref_path)
-        resistor = list(sch.components)[0]
+        resistor = next(iter(sch.components))
         original_pin_uuids = dict(resistor.pin_uuids)
 
         # Modify component value
@@ -241,7 +241,7 @@ class TestPinUUIDEdgeCases:
             sch.save(temp_path)
 
             sch2 = ksa.Schematic.load(temp_path)
-            resistor2 = list(sch2.components)[0]
+            resistor2 = next(iter(sch2.components))
 
             assert resistor2.value == "20k", "Value should be updated"
             assert resistor2.pin_uuids == original_pin_uuids, "Pin UUIDs should be preserved"
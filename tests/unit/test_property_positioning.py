@@ -10,11 +10,51 @@ Related:
 - Analysis: docs/PROPERTY_POSITIONING_ANALYSIS.md
 """
 
+import functools
+import hashlib
+import os
+from pathlib import Path
+
 import pytest
 
 from kicad_sch_api.core.types import Point
 
 
+@functools.lru_cache(maxsize=256)
+def _file_digest(path: str, mtime_ns: int, size: int) -> bytes:
+    """Hash a file's bytes; (mtime_ns, size) are part of the key so stale entries miss."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _same_file_content(path_a: str, path_b: str) -> bool:
+    """Compare two files by size first, then by (cached) content digest."""
+    stat_a, stat_b = os.stat(path_a), os.stat(path_b)
+    if stat_a.st_size != stat_b.st_size:
+        return False
+    return _file_digest(path_a, stat_a.st_mtime_ns, stat_a.st_size) == _file_digest(
+        path_b, stat_b.st_mtime_ns, stat_b.st_size
+    )
+
+
+# Property positioning references under tests/reference_kicad_projects/
+PROPERTY_POSITIONING_REFERENCES = (
+    "property_positioning_resistor/resistor.kicad_sch",
+    "property_positioning_capacitor/capacitor.kicad_sch",
+    "property_positioning_inductor/inductor.kicad_sch",
+    "property_positioning_diode/diode.kicad_sch",
+    "property_positioning_led/led.kicad_sch",
+    "property_positioning_transistor_bjt/transistor_bjt.kicad_sch",
+    "property_positioning_op_amp/op_amp.kicad_sch",
+    "property_positioning_logic_ic/logic_ic.kicad_sch",
+    "property_positioning_connector/connector.kicad_sch",
+    "property_positioning_capacitor_electrolytic/capacitor_electrolytic.kicad_sch",
+)
+
+
 class TestPropertyPositionCalculation:
     """Test REQ-1: Property Position Calculation algorithm."""
 
@@ -206,14 +246,12 @@ class TestFieldsAutoplacedFlag:
 class TestRoundTripPreservation:
     """Test REQ-4: Round-Trip Preservation of existing schematics."""
 
-    def test_load_resistor_reference_preserves_positions(self):
+    def test_load_resistor_reference_preserves_positions(self, tmp_path):
         """Loading resistor reference should preserve exact property positions.
 
         Reference schematic: property_positioning_resistor/resistor.kicad_sch
         Round-trip: load → save → load should produce byte-perfect output.
         """
-        import tempfile
-
         import kicad_sch_api as ksa
 
         ref_path = "tests/reference_kicad_projects/property_positioning_resistor/resistor.kicad_sch"
@@ -227,9 +265,7 @@ class TestRoundTripPreservation:
         original_val_pos = comp.properties["Value"]["at"]
 
         # Save and reload
-        with tempfile.NamedTemporaryFile(suffix=".kicad_sch", delete=False) as f:
-            temp_path = f.name
-
+        temp_path = tmp_path / "resistor.kicad_sch"
         sch.save(temp_path)
         sch2 = ksa.Schematic.load(temp_path)
         comp2 = sch2.components[0]
@@ -238,44 +274,24 @@ class TestRoundTripPreservation:
         assert comp2.properties["Reference"]["at"] == original_ref_pos
         assert comp2.properties["Value"]["at"] == original_val_pos
 
-    def test_round_trip_all_10_references_byte_perfect(self):
-        """All 10 reference schematics should round-trip byte-perfectly.
+    @pytest.mark.parametrize("ref_file", PROPERTY_POSITIONING_REFERENCES)
+    def test_round_trip_reference_byte_perfect(self, ref_file, tmp_path):
+        """Each of the 10 reference schematics should round-trip byte-perfectly.
 
         This validates REQ-4: exact format preservation on load/save.
         """
-        import filecmp
-        import tempfile
-
         import kicad_sch_api as ksa
 
-        references = [
-            "property_positioning_resistor/resistor.kicad_sch",
-            "property_positioning_capacitor/capacitor.kicad_sch",
-            "property_positioning_inductor/inductor.kicad_sch",
-            "property_positioning_diode/diode.kicad_sch",
-            "property_positioning_led/led.kicad_sch",
-            "property_positioning_transistor_bjt/transistor_bjt.kicad_sch",
-            "property_positioning_op_amp/op_amp.kicad_sch",
-            "property_positioning_logic_ic/logic_ic.kicad_sch",
-            "property_positioning_connector/connector.kicad_sch",
-            "property_positioning_capacitor_electrolytic/capacitor_electrolytic.kicad_sch",
-        ]
-
-        for ref_file in references:
-            ref_path = f"tests/reference_kicad_projects/{ref_file}"
-
-            # Load and save
-            sch = ksa.Schematic.load(ref_path)
+        ref_path = f"tests/reference_kicad_projects/{ref_file}"
 
-            with tempfile.NamedTemporaryFile(suffix=".kicad_sch", delete=False) as f:
-                temp_path = f.name
+        # Load and save
+        sch = ksa.Schematic.load(ref_path)
 
-            sch.save(temp_path)
+        temp_path = tmp_path / Path(ref_file).name
+        sch.save(temp_path)
 
-            # Files should be byte-identical
-            assert filecmp.cmp(
-                ref_path, temp_path, shallow=False
-            ), f"Round-trip failed for {ref_file}"
+        # Files should be byte-identical
+        assert _same_file_content(ref_path, str(temp_path))
 
 
 class TestMultiUnitComponents:
@@ -10,42 +10,34 @@ import pytest
 import kicad_sch_api as ksa
 from kicad_sch_api.core.types import Point, SchematicSymbol
 
+REFERENCE_FILE = "tests/reference_kicad_projects/property_preservation/test.kicad_sch"
+
 
 class TestPropertyVisibilityLoading:
     """Test that property visibility state is extracted during load."""
 
-    def test_load_extracts_hidden_properties(self):
-        """Hidden properties should be identified and added to hidden_properties set."""
-        sch = ksa.Schematic.load(
-            "tests/reference_kicad_projects/property_preservation/test.kicad_sch"
-        )
-        r1 = sch.components.get("R1")
+    @pytest.fixture(scope="class")
+    def r1(self):
+        """Load the reference schematic once; these tests only read it."""
+        return ksa.Schematic.load(REFERENCE_FILE).components.get("R1")
 
+    def test_load_extracts_hidden_properties(self, r1):
+        """Hidden properties should be identified and added to hidden_properties set."""
         # Properties with (hide yes) should be in hidden_properties set
         assert "Footprint" in r1.hidden_properties
         assert "Datasheet" in r1.hidden_properties
         assert "MPN" in r1.hidden_properties
 
-    def test_load_identifies_visible_properties(self):
+    def test_load_identifies_visible_properties(self, r1):
         """Visible properties should NOT be in hidden_properties set."""
-        sch = ksa.Schematic.load(
-            "tests/reference_kicad_projects/property_preservation/test.kicad_sch"
-        )
-        r1 = sch.components.get("R1")
-
         # Properties without hide flag should NOT be in set
         assert "Reference" not in r1.hidden_properties
         assert "Value" not in r1.hidden_properties
         assert "Manufacturer" not in r1.hidden_properties
         assert "Tolearnce" not in r1.hidden_properties  # Typo preserved from reference
 
-    def test_all_properties_loaded(self):
+    def test_all_properties_loaded(self, r1):
         """All properties should be loaded regardless of visibility."""
-        sch = ksa.Schematic.load(
-            "tests/reference_kicad_projects/property_preservation/test.kicad_sch"
-        )
-        r1 = sch.components.get("R1")
-
         # Check all properties are in dict
         assert r1.properties["Datasheet"] == "~"
         assert r1.properties["MPN"] == "C0603FR-0710KL"
@@ -53,13 +45,8 @@ class TestPropertyVisibilityLoading:
         assert r1.properties["Tolearnce"] == "1%"
         assert r1.properties["Description"] == ""  # Empty value
 
-    def test_hidden_properties_field_exists(self):
+    def test_hidden_properties_field_exists(self, r1):
         """SchematicSymbol should have hidden_properties field."""
-        sch = ksa.Schematic.load(
-            "tests/reference_kicad_projects/property_preservation/test.kicad_sch"
-        )
-        r1 = sch.components.get("R1")
-
         # Field should exist and be a set
         assert hasattr(r1, "hidden_properties")
         assert isinstance(r1.hidden_properties, set)
@@ -71,9 +58,7 @@ class TestPropertyVisibilityRoundTrip:
     def test_hidden_properties_preserved_on_save(self, tmp_path):
         """Hidden properties should have (hide yes) flag after save."""
         # Load reference
-        sch = ksa.Schematic.load(
-            "tests/reference_kicad_projects/property_preservation/test.kicad_sch"
-        )
+        sch = ksa.Schematic.load(REFERENCE_FILE)
 
         # Save to temp file
         output_path = tmp_path / "roundtrip.kicad_sch"
@@ -91,9 +76,7 @@ class TestPropertyVisibilityRoundTrip:
     def test_visible_properties_preserved_on_save(self, tmp_path):
         """Visible properties should NOT have hide flag after save."""
         # Load reference
-        sch = ksa.Schematic.load(
-            "tests/reference_kicad_projects/property_preservation/test.kicad_sch"
-        )
+        sch = ksa.Schematic.load(REFERENCE_FILE)
 
         # Save to temp file
         output_path = tmp_path / "roundtrip.kicad_sch"
@@ -111,9 +94,7 @@ class TestPropertyVisibilityRoundTrip:
     def test_property_values_unchanged_after_roundtrip(self, tmp_path):
         """Property values should not change during round-trip."""
         # Load reference
-        sch = ksa.Schematic.load(
-            "tests/reference_kicad_projects/property_preservation/test.kicad_sch"
-        )
+        sch = ksa.Schematic.load(REFERENCE_FILE)
 
         # Save and reload
         output_path = tmp_path / "roundtrip.kicad_sch"
@@ -239,9 +220,7 @@ class TestVisibilityToggling:
 
     def test_hide_existing_property(self):
         """Adding property to hidden_properties should hide it."""
-        sch = ksa.Schematic.load(
-            "tests/reference_kicad_projects/property_preservation/test.kicad_sch"
-        )
+        sch = ksa.Schematic.load(REFERENCE_FILE)
         r1 = sch.components.get("R1")
 
         # Manufacturer is initially visible
@@ -254,9 +233,7 @@ class TestVisibilityToggling:
 
     def test_show_existing_property(self):
         """Removing property from hidden_properties should show it."""
-        sch = ksa.Schematic.load(
-            "tests/reference_kicad_projects/property_preservation/test.kicad_sch"
-        )
+        sch = ksa.Schematic.load(REFERENCE_FILE)
         r1 = sch.components.get("R1")
 
         # MPN is initially hidden
@@ -269,9 +246,7 @@ class TestVisibilityToggling:
 
     def test_visibility_change_survives_save(self, tmp_path):
         """Visibility changes should persist after save."""
-        sch = ksa.Schematic.load(
-            "tests/reference_kicad_projects/property_preservation/test.kicad_sch"
-        )
+        sch = ksa.Schematic.load(REFERENCE_FILE)
         r1 = sch.components.get("R1")
 
         # Hide Manufacturer (was visible)
@@ -296,9 +271,7 @@ class TestEdgeCases:
 
     def test_empty_property_value(self):
         """Properties with empty values should be handled correctly."""
-        sch = ksa.Schematic.load(
-            "tests/reference_kicad_projects/property_preservation/test.kicad_sch"
-        )
+        sch = ksa.Schematic.load(REFERENCE_FILE)
         r1 = sch.components.get("R1")
 
         # Description has empty value
@@ -352,11 +325,7 @@ class TestFormatPreservation:
         r1.add_property("MPN", "TEST_MPN", hidden=True)
 
         output_path = tmp_path / "test_hide.kicad_sch"
-        sch.save(str(output_path))
-
-        # Read raw file and check for hide flag
-        with open(output_path, "r") as f:
-            content = f.read()
+        content = sch.save(str(output_path))
 
         # Should contain (hide yes) for MPN property
         assert "(hide yes)" in content
@@ -369,11 +338,7 @@ class TestFormatPreservation:
         r1.add_property("Notes", "Important", hidden=False)
 
         output_path = tmp_path / "test_visible.kicad_sch"
-        sch.save(str(output_path))
-
-        # Read raw file
-        with open(output_path, "r") as f:
-            content = f.read()
+        content = sch.save(str(output_path))
 
         # Find the Notes property section
         notes_start = content.find('property "Notes"')
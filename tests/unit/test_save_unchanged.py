@@ -0,0 +1,73 @@
+"""
+Unit tests for saving loaded schematics without modifications.
+"""
+
+from pathlib import Path
+
+import kicad_sch_api as ksa
+from kicad_sch_api.core.types import Point
+
+# KiCAD writes "(diameter 0)" here; the formatter on its own would emit "0.0000"
+JUNCTION_PATH = Path("tests/reference_kicad_projects/junction/junction.kicad_sch")
+
+
+class TestSaveUnchanged:
+    """Unchanged schematics are written back exactly as loaded."""
+
+    def test_unchanged_save_keeps_original_content(self, tmp_path):
+        """Load → save writes the original bytes."""
+        sch = ksa.Schematic.load(JUNCTION_PATH)
+        output_path = tmp_path / "junction.kicad_sch"
+
+        sch.save(output_path)
+
+        assert output_path.read_bytes() == JUNCTION_PATH.read_bytes()
+        assert sch.dumps() == JUNCTION_PATH.read_text(encoding="utf-8")
+
+    def test_preserve_format_false_reformats(self, tmp_path):
+        """Without preserve_format the formatter always runs."""
+        sch = ksa.Schematic.load(JUNCTION_PATH)
+        output_path = tmp_path / "junction.kicad_sch"
+
+        sch.save(output_path, preserve_format=False)
+
+        assert output_path.read_bytes() != JUNCTION_PATH.read_bytes()
+
+    def test_modified_schematic_is_reformatted(self, tmp_path):
+        """A tracked modification bypasses the original content."""
+        sch = ksa.Schematic.load(JUNCTION_PATH)
+        sch.wires.add(start=(10, 10), end=(20, 10))
+
+        content = sch.dumps()
+
+        assert content != JUNCTION_PATH.read_text(encoding="utf-8")
+        assert (
+            content.count("(wire") == JUNCTION_PATH.read_text(encoding="utf-8").count("(wire") + 1
+        )
+
+    def test_untracked_edit_is_not_lost(self, tmp_path):
+        """Edits the modified flag misses are still caught by comparing content."""
+        sch = ksa.Schematic.load(JUNCTION_PATH)
+        wire = next(iter(sch.wires))
+        wire.points[-1] = Point(wire.points[-1].x + 2.54, wire.points[-1].y)
+        assert not sch.modified
+
+        output_path = tmp_path / "junction.kicad_sch"
+        sch.save(output_path)
+
+        reloaded = ksa.Schematic.load(output_path)
+        assert next(iter(reloaded.wires)).points[-1] == wire.points[-1]
+
+    def test_untracked_edit_after_unchanged_save_is_not_lost(self, tmp_path):
+        """The original tree kept between saves is never shared with the schematic data."""
+        sch = ksa.Schematic.load(JUNCTION_PATH)
+        output_path = tmp_path / "junction.kicad_sch"
+        sch.save(output_path)
+        assert output_path.read_bytes() == JUNCTION_PATH.read_bytes()
+
+        wire = next(iter(sch.wires))
+        wire.points[-1] = Point(wire.points[-1].x + 2.54, wire.points[-1].y)
+        sch.save(output_path)
+
+        reloaded = ksa.Schematic.load(output_path)
+        assert next(iter(reloaded.wires)).points[-1] == wire.points[-1]